@@ -0,0 +1,29 @@
+"""Add keyset pagination indexes
+
+Revision ID: 05a1e1ccc164
+Revises: 6bc634fc85f5
+Create Date: 2026-10-17 20:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '05a1e1ccc164'
+down_revision = '6bc634fc85f5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # GET /logs, /events, /projects のカーソルページネーション（並び替えキー, id）
+    op.create_index('ix_logs_created_at_id', 'logs', ['created_at', 'id'], unique=False)
+    op.create_index('ix_events_start_date_id', 'events', ['start_date', 'id'], unique=False)
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
+    op.drop_index('ix_events_start_date_id', table_name='events')
+    op.drop_index('ix_logs_created_at_id', table_name='logs')
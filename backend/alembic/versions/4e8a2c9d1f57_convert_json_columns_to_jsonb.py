@@ -0,0 +1,59 @@
+"""Convert tag/skill JSON columns to JSONB with GIN indexes
+
+Revision ID: 4e8a2c9d1f57
+Revises: 9d3b7f21a6c4
+Create Date: 2026-10-17 21:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '4e8a2c9d1f57'
+down_revision = '9d3b7f21a6c4'
+branch_labels = None
+depends_on = None
+
+# (テーブル, カラム, GINインデックス名)
+COLUMNS = [
+    ('logs', 'tags', 'ix_logs_tags_gin'),
+    ('events', 'tags', 'ix_events_tags_gin'),
+    ('projects', 'tags', 'ix_projects_tags_gin'),
+    ('projects', 'required_skills', 'ix_projects_required_skills_gin'),
+    ('user_profiles', 'skills', 'ix_user_profiles_skills_gin'),
+    ('user_profiles', 'interests', 'ix_user_profiles_interests_gin'),
+]
+
+
+def upgrade() -> None:
+    # tags::jsonb の式インデックスは列インデックスに置き換える
+    op.drop_index('ix_logs_tags_gin', table_name='logs')
+
+    for table, column, index in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+        op.create_index(index, table, [column], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for table, column, index in reversed(COLUMNS):
+        op.drop_index(index, table_name=table)
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=True,
+            postgresql_using=f'{column}::json',
+        )
+
+    op.create_index(
+        'ix_logs_tags_gin', 'logs', [sa.text('CAST(tags AS JSONB)')], unique=False,
+        postgresql_using='gin',
+    )
@@ -0,0 +1,51 @@
+"""Add indexes for hot query paths
+
+Revision ID: 9d3b7f21a6c4
+Revises: cf44d837e0e3
+Create Date: 2026-10-17 21:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3b7f21a6c4'
+down_revision = 'cf44d837e0e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # logs: 自分のログ / 公開ログ（部分インデックス）/ タグ
+    op.create_index('ix_logs_user_id_created_at', 'logs', ['user_id', 'created_at'], unique=False)
+    op.create_index(
+        'ix_logs_public_created_at_id', 'logs', ['created_at', 'id'], unique=False,
+        postgresql_where=sa.text("visibility = 'PUBLIC'"),
+    )
+    op.create_index(
+        'ix_logs_tags_gin', 'logs', [sa.text('CAST(tags AS JSONB)')], unique=False,
+        postgresql_using='gin',
+    )
+
+    # points: ix_points_user_id を (user_id, created_at) に置き換え
+    op.create_index('ix_points_user_id_created_at', 'points', ['user_id', 'created_at'], unique=False)
+    op.drop_index('ix_points_user_id', table_name='points')
+
+    op.create_index('ix_goals_user_id_status_created_at', 'goals', ['user_id', 'status', 'created_at'], unique=False)
+    op.create_index(op.f('ix_steps_goal_id'), 'steps', ['goal_id'], unique=False)
+    op.create_index(
+        'ix_event_participants_event_id_status_joined_at', 'event_participants',
+        ['event_id', 'status', 'joined_at'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_event_participants_event_id_status_joined_at', table_name='event_participants')
+    op.drop_index(op.f('ix_steps_goal_id'), table_name='steps')
+    op.drop_index('ix_goals_user_id_status_created_at', table_name='goals')
+    op.create_index('ix_points_user_id', 'points', ['user_id'], unique=False)
+    op.drop_index('ix_points_user_id_created_at', table_name='points')
+    op.drop_index('ix_logs_tags_gin', table_name='logs')
+    op.drop_index('ix_logs_public_created_at_id', table_name='logs')
+    op.drop_index('ix_logs_user_id_created_at', table_name='logs')
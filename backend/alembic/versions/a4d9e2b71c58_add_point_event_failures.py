@@ -0,0 +1,35 @@
+"""Add point_events failure tracking
+
+反映に失敗し続けるイベントでアウトボックス全体が止まらないよう、
+失敗回数・最後のエラー・失敗として除外した日時を持たせる。
+
+Revision ID: a4d9e2b71c58
+Revises: f2b8d4c6e913
+Create Date: 2026-10-18 08:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d9e2b71c58'
+down_revision = 'f2b8d4c6e913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('point_events', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('point_events', sa.Column('last_error', sa.Text(), nullable=True))
+    op.add_column('point_events', sa.Column('failed_at', sa.DateTime(timezone=True), nullable=True))
+    op.drop_index('ix_point_events_unprocessed', table_name='point_events', postgresql_where=sa.text('processed_at IS NULL'))
+    op.create_index('ix_point_events_unprocessed', 'point_events', ['id'], unique=False, postgresql_where=sa.text('processed_at IS NULL AND failed_at IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_point_events_unprocessed', table_name='point_events', postgresql_where=sa.text('processed_at IS NULL AND failed_at IS NULL'))
+    op.create_index('ix_point_events_unprocessed', 'point_events', ['id'], unique=False, postgresql_where=sa.text('processed_at IS NULL'))
+    op.drop_column('point_events', 'failed_at')
+    op.drop_column('point_events', 'last_error')
+    op.drop_column('point_events', 'attempts')
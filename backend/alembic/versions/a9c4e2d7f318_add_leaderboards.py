@@ -0,0 +1,66 @@
+"""Add leaderboard tables
+
+Revision ID: a9c4e2d7f318
+Revises: e5c3a1f7b942
+Create Date: 2026-10-18 03:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c4e2d7f318'
+down_revision = 'e5c3a1f7b942'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'leaderboard_entries',
+        sa.Column('period', sa.String(length=16), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('period', 'user_id')
+    )
+    op.create_index('ix_leaderboard_entries_period_score', 'leaderboard_entries', ['period', 'score', 'user_id'], unique=False)
+    op.create_table(
+        'leaderboard_score_counts',
+        sa.Column('period', sa.String(length=16), nullable=False),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('users', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('period', 'score')
+    )
+    op.create_index('ix_project_members_project_id_contribution_points', 'project_members', ['project_id', 'contribution_points'], unique=False)
+
+    # 既存の points からランキングを作る（期間の区切りは POINTS_TIMEZONE）
+    op.execute(sa.text("""
+        INSERT INTO leaderboard_entries (period, user_id, score, updated_at)
+        SELECT k.period, p.user_id, SUM(p.amount), now()
+        FROM points p
+        CROSS JOIN LATERAL (VALUES
+            ('all'),
+            (to_char(timezone(:tz, p.created_at), 'YYYY-MM')),
+            (to_char(timezone(:tz, p.created_at), 'IYYY-"W"IW'))
+        ) AS k(period)
+        GROUP BY k.period, p.user_id
+    """).bindparams(tz=settings.POINTS_TIMEZONE))
+    op.execute("""
+        INSERT INTO leaderboard_score_counts (period, score, users)
+        SELECT period, score, COUNT(*)
+        FROM leaderboard_entries
+        GROUP BY period, score
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_project_members_project_id_contribution_points', table_name='project_members')
+    op.drop_table('leaderboard_score_counts')
+    op.drop_index('ix_leaderboard_entries_period_score', table_name='leaderboard_entries')
+    op.drop_table('leaderboard_entries')
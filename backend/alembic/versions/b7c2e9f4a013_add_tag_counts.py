@@ -0,0 +1,95 @@
+"""Add tag_counts
+
+よく使われているタグ（GET /tags）を毎回 tags 列の展開で集計しないよう、
+(集計対象, タグ) ごとの件数を持ち、logs / events / projects の文ごとのトリガーで増分更新する（app.core.tags）。
+既存の行の件数はここで集計して入れる（ログは公開ログのみ）。
+
+Revision ID: b7c2e9f4a013
+Revises: a4d9e2b71c58
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7c2e9f4a013'
+down_revision = 'a4d9e2b71c58'
+branch_labels = None
+depends_on = None
+
+TAG_COUNT_SOURCES = ('logs', 'events', 'projects')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tag_counts',
+        sa.Column('source', sa.String(length=16), nullable=False),
+        sa.Column('tag', sa.Text(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('source', 'tag'),
+    )
+    op.create_index('ix_tag_counts_source_count', 'tag_counts', ['source', sa.text('count DESC'), 'tag'], unique=False)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION tag_counts_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $fn$
+        DECLARE
+            counted text := CASE WHEN TG_TABLE_NAME = 'logs' THEN 'visibility = ''PUBLIC''' ELSE 'true' END;
+            changes text;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                changes := 'SELECT tags, 1 AS sign FROM new_rows WHERE ' || counted;
+            ELSIF TG_OP = 'DELETE' THEN
+                changes := 'SELECT tags, -1 AS sign FROM old_rows WHERE ' || counted;
+            ELSE
+                changes := 'SELECT tags, 1 AS sign FROM new_rows WHERE ' || counted
+                    || ' UNION ALL SELECT tags, -1 FROM old_rows WHERE ' || counted;
+            END IF;
+
+            EXECUTE 'INSERT INTO tag_counts AS t (source, tag, count)'
+                || ' SELECT $1, tag, SUM(c.sign)'
+                || ' FROM (' || changes || ') AS c, jsonb_array_elements_text(c.tags) AS tag'
+                || ' GROUP BY tag HAVING SUM(c.sign) <> 0 ORDER BY tag'
+                || ' ON CONFLICT (source, tag) DO UPDATE SET count = t.count + EXCLUDED.count'
+            USING TG_TABLE_NAME;
+            DELETE FROM tag_counts WHERE source = TG_TABLE_NAME AND count <= 0;
+            RETURN NULL;
+        END
+        $fn$
+    """)
+    for table in TAG_COUNT_SOURCES:
+        op.execute(
+            f"CREATE TRIGGER {table}_tag_counts_insert AFTER INSERT ON {table} "
+            "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION tag_counts_apply()"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_tag_counts_update AFTER UPDATE ON {table} "
+            "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION tag_counts_apply()"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_tag_counts_delete AFTER DELETE ON {table} "
+            "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION tag_counts_apply()"
+        )
+
+    # CREATE TRIGGER のロックはトランザクションの終わりまで続くので、集計の間の書き込みは待たされる（数え漏れ・二重計上はない）
+    for table in TAG_COUNT_SOURCES:
+        counted = "visibility = 'PUBLIC'" if table == 'logs' else 'true'
+        op.execute(f"""
+            INSERT INTO tag_counts (source, tag, count)
+            SELECT '{table}', tag, COUNT(*)
+            FROM {table}, jsonb_array_elements_text({table}.tags) AS tag
+            WHERE {counted}
+            GROUP BY tag
+        """)
+
+
+def downgrade() -> None:
+    for table in TAG_COUNT_SOURCES:
+        op.execute(f"DROP TRIGGER {table}_tag_counts_delete ON {table}")
+        op.execute(f"DROP TRIGGER {table}_tag_counts_update ON {table}")
+        op.execute(f"DROP TRIGGER {table}_tag_counts_insert ON {table}")
+    op.execute("DROP FUNCTION tag_counts_apply()")
+    op.drop_index('ix_tag_counts_source_count', table_name='tag_counts')
+    op.drop_table('tag_counts')
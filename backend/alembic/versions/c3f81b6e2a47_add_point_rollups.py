@@ -0,0 +1,37 @@
+"""Add point_rollups
+
+既存の points からの集計は scripts/backfill_point_rollups.py で作成する。
+
+Revision ID: c3f81b6e2a47
+Revises: a9c4e2d7f318
+Create Date: 2026-10-18 04:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f81b6e2a47'
+down_revision = 'a9c4e2d7f318'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'point_rollups',
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('granularity', sa.String(length=8), nullable=False),
+        sa.Column('bucket_start', sa.Date(), nullable=False),
+        sa.Column('action_type', sa.String(length=50), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'granularity', 'bucket_start', 'action_type')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('point_rollups')
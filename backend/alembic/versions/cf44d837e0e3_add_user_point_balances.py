@@ -0,0 +1,40 @@
+"""Add user_point_balances and points.user_id index
+
+Revision ID: cf44d837e0e3
+Revises: 05a1e1ccc164
+Create Date: 2026-10-17 20:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'cf44d837e0e3'
+down_revision = '05a1e1ccc164'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('user_point_balances',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('balance', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(op.f('ix_points_user_id'), 'points', ['user_id'], unique=False)
+
+    # 既存の points から残高を作成
+    op.execute("""
+        INSERT INTO user_point_balances (user_id, balance, updated_at)
+        SELECT user_id, SUM(amount), now()
+        FROM points
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_points_user_id'), table_name='points')
+    op.drop_table('user_point_balances')
@@ -0,0 +1,37 @@
+"""Add point_events outbox
+
+Revision ID: d2a6f83b5c17
+Revises: b7e14c3a9d20
+Create Date: 2026-10-18 00:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a6f83b5c17'
+down_revision = 'b7e14c3a9d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('point_events',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('action_type', sa.String(length=50), nullable=False),
+    sa.Column('reference_id', sa.String(length=255), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_point_events_unprocessed', 'point_events', ['id'], unique=False, postgresql_where=sa.text('processed_at IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_point_events_unprocessed', table_name='point_events', postgresql_where=sa.text('processed_at IS NULL'))
+    op.drop_table('point_events')
@@ -0,0 +1,50 @@
+"""Deduplicate points and add point rule constraints
+
+Revision ID: e5c3a1f7b942
+Revises: d2a6f83b5c17
+Create Date: 2026-10-18 01:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5c3a1f7b942'
+down_revision = 'd2a6f83b5c17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 同じアクションに重複して付与された points を最初の1件だけ残して削除
+    op.execute("""
+        DELETE FROM points p
+        USING (
+            SELECT id, row_number() OVER (
+                PARTITION BY user_id, action_type, reference_id
+                ORDER BY created_at, id
+            ) AS rn
+            FROM points
+            WHERE reference_id IS NOT NULL
+        ) d
+        WHERE p.id = d.id AND d.rn > 1
+    """)
+    # 削除した分を残高に反映
+    op.execute("""
+        UPDATE user_point_balances b
+        SET balance = COALESCE((SELECT SUM(amount) FROM points p WHERE p.user_id = b.user_id), 0),
+            updated_at = now()
+    """)
+    op.create_index('uq_points_user_id_action_type_reference_id', 'points', ['user_id', 'action_type', 'reference_id'], unique=True)
+
+    # 付与量はルールで決めるため、アウトボックスには区分だけを持つ
+    op.add_column('point_events', sa.Column('variant', sa.String(length=50), nullable=True))
+    op.drop_column('point_events', 'amount')
+
+
+def downgrade() -> None:
+    op.add_column('point_events', sa.Column('amount', sa.Integer(), server_default='0', nullable=False))
+    op.alter_column('point_events', 'amount', server_default=None)
+    op.drop_column('point_events', 'variant')
+    op.drop_index('uq_points_user_id_action_type_reference_id', table_name='points')
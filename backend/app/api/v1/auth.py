@@ -1,41 +1,31 @@
+from typing import Awaitable, TypeVar
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token, decode_access_token
+from app.core.dependencies import get_current_user_oauth2
+from app.core.password_hasher import PasswordHasherBusy, password_hasher
+from app.core.security import password_needs_rehash
 from app.models.user import User
-from app.schemas.user import UserCreate, UserResponse, Token
+from app.schemas.user import UserCreate, UserResponse, Token, RefreshTokenRequest, LogoutRequest
+from app.services.tokens import RefreshTokenError, issue_tokens, revoke_refresh_token, rotate_refresh_token
 router = APIRouter()
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
-
-
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """現在のユーザーを取得（依存性注入用）"""
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="認証情報を検証できませんでした",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    payload = decode_access_token(token)
-    if payload is None:
-        raise credentials_exception
 
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-
-    result = await db.execute(select(User).filter(User.id == user_id))
-    user = result.scalar_one_or_none()
+T = TypeVar("T")
 
-    if user is None:
-        raise credentials_exception
 
-    return user
+async def _hashing(awaitable: Awaitable[T]) -> T:
+    """パスワードのハッシュ処理を待つ（混雑時は 503）"""
+    try:
+        return await awaitable
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="混み合っています。しばらくしてから再度お試しください",
+            headers={"Retry-After": "1"},
+        )
 
 
 @router.post(
@@ -60,7 +50,8 @@ async def get_current_user(
             }
         },
         400: {"description": "メールアドレスが既に登録されています"},
-        422: {"description": "入力データの検証エラー"}
+        422: {"description": "入力データの検証エラー"},
+        503: {"description": "パスワードの処理が混み合っています"}
     }
 )
 async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
@@ -76,7 +67,7 @@ async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
         )
 
     # ユーザー作成
-    hashed_password = get_password_hash(user_in.password)
+    hashed_password = await _hashing(password_hasher.hash(user_in.password))
     user = User(
         email=user_in.email,
         full_name=user_in.full_name,
@@ -94,7 +85,8 @@ async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
     "/login",
     response_model=Token,
     summary="ログイン",
-    description="メールアドレスとパスワードでログインし、OAuth2形式のフォームデータを受け付けてJWTトークンを返します。",
+    description="メールアドレスとパスワードでログインし、OAuth2形式のフォームデータを受け付けてJWTトークンを返します。"
+                "アクセストークンの期限が切れたら、リフレッシュトークンで `/auth/refresh` から再発行できます。",
     responses={
         200: {
             "description": "ログイン成功",
@@ -102,13 +94,16 @@ async def register(user_in: UserCreate, db: AsyncSession = Depends(get_db)):
                 "application/json": {
                     "example": {
                         "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-                        "token_type": "bearer"
+                        "token_type": "bearer",
+                        "refresh_token": "3q2-7wX9...",
+                        "expires_in": 900
                     }
                 }
             }
         },
         401: {"description": "メールアドレスまたはパスワードが正しくありません"},
-        400: {"description": "アカウントが無効です"}
+        400: {"description": "アカウントが無効です"},
+        503: {"description": "パスワードの処理が混み合っています"}
     }
 )
 async def login(
@@ -120,7 +115,7 @@ async def login(
     result = await db.execute(select(User).filter(User.email == form_data.username))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await _hashing(password_hasher.verify(form_data.password, user.hashed_password)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="メールアドレスまたはパスワードが正しくありません",
@@ -133,10 +128,61 @@ async def login(
             detail="このアカウントは無効です"
         )
 
-    # JWTトークン生成
-    access_token = create_access_token(data={"sub": str(user.id)})
+    # BCRYPT_ROUNDS が変わっていたら新しいコストでハッシュし直す（混雑時は次回に回す）
+    if password_needs_rehash(user.hashed_password):
+        try:
+            user.hashed_password = await password_hasher.hash(form_data.password)
+        except PasswordHasherBusy:
+            pass
+
+    # JWTトークン生成（再ハッシュしたパスワードも一緒にコミットされる）
+    return await issue_tokens(db, user)
+
+
+@router.post(
+    "/refresh",
+    response_model=Token,
+    summary="トークン更新",
+    description="リフレッシュトークンを新しいアクセストークン・リフレッシュトークンと交換します。"
+                "使用したリフレッシュトークンは無効になり、再度使われた場合は同じログインのトークンがすべて無効になります。",
+    responses={
+        200: {"description": "トークン更新成功"},
+        401: {"description": "リフレッシュトークンが無効です"}
+    }
+)
+async def refresh(body: RefreshTokenRequest, db: AsyncSession = Depends(get_db)):
+    """トークン更新"""
+    try:
+        return await rotate_refresh_token(db, body.refresh_token)
+    except RefreshTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="リフレッシュトークンが無効です",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
 
-    return {"access_token": access_token, "token_type": "bearer"}
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="ログアウト",
+    description="リフレッシュトークンを無効にします。`everywhere` を true にすると、"
+                "すべての端末のアクセストークン・リフレッシュトークンを無効にします。",
+    responses={
+        204: {"description": "ログアウト成功"},
+        401: {"description": "リフレッシュトークンが無効です"}
+    }
+)
+async def logout(body: LogoutRequest, db: AsyncSession = Depends(get_db)):
+    """ログアウト"""
+    try:
+        await revoke_refresh_token(db, body.refresh_token, everywhere=body.everywhere)
+    except RefreshTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="リフレッシュトークンが無効です",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 
 @router.get(
@@ -162,6 +208,6 @@ async def login(
         401: {"description": "認証が必要です"}
     }
 )
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user_oauth2)):
     """現在のユーザー情報を取得"""
     return current_user
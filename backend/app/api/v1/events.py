@@ -1,18 +1,23 @@
 """イベント（Event）API エンドポイント"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List
+from sqlalchemy import select, func, and_
+from typing import List, Optional, Union
 from uuid import UUID
 from datetime import datetime
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.fields import load_fields, parse_fields, project, projected_response
+from app.core.http_cache import apply_cache_headers, is_not_modified, not_modified_response, row_validators
+from app.core.pagination import MAX_PAGE_SIZE, build_page, is_paginated, paginate_query
+from app.core.responses import model_response
+from app.core.tags import TAG_MODE_PATTERN, apply_tag_filter, normalize_tags
+from app.core.dependencies import get_current_user, get_read_db
 from app.models.user import User
 from app.models.event import Event, EventStatus
 from app.models.event_participant import EventParticipant, ParticipantStatus
-from app.models.point import Point
-from app.schemas.event import EventCreate, EventUpdate, EventResponse
+from app.services.point_events import enqueue_point_event
+from app.schemas.event import EventCreate, EventUpdate, EventResponse, EventSummary, EventPage
 
 router = APIRouter()
 
@@ -43,47 +48,76 @@ async def create_event(
         status=EventStatus.UPCOMING
     )
     db.add(event)
+    await db.flush()
 
-    # ポイントを付与（50pt）
-    point = Point(
+    # ポイント付与の対象として記録（付与量は app.services.point_rules）
+    await enqueue_point_event(
+        db,
         user_id=current_user.id,
-        amount=50,
         action_type="event_create",
         reference_id=str(event.id),
         description=f"イベント「{event.title}」を作成"
     )
-    db.add(point)
 
     await db.commit()
     await db.refresh(event)
     return event
 
 
-@router.get("/events", response_model=List[EventResponse], tags=["イベント"])
+@router.get("/events", response_model=Union[EventPage, List[EventResponse]], tags=["イベント"])
 async def get_events(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="1ページの件数（指定時はカーソルページで返却）"),
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    tags: Optional[List[str]] = Query(None, description="タグフィルタ（複数指定可）"),
+    tag_mode: str = Query("all", pattern=TAG_MODE_PATTERN, description="複数タグの条件（all: すべて含む / any: いずれかを含む）"),
+    fields: Optional[str] = Query(None, description="返すフィールド（カンマ区切り。summary で要約）"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     イベント一覧を取得
 
     今後のイベントを新しい順に表示
+
+    - **tags** / **tag_mode**: 複数タグでフィルタ（all: AND / any: OR）
+    - **limit** / **cursor**: 指定するとカーソルページ（items, next_cursor）で返却
+    - **fields**: 返すフィールド（例: id,title,start_date。summary で要約）。指定したカラムだけを読みます
     """
+    query = apply_tag_filter(select(Event), Event.tags, normalize_tags(tags), tag_mode)
+
+    projection = parse_fields(fields, EventResponse, EventSummary)
+    if projection:
+        query = load_fields(query, Event, projection, "id", "start_date")
+
+    if is_paginated(limit, cursor):
+        query = paginate_query(query, Event.start_date, Event.id, limit, cursor)
+        result = await db.execute(query)
+        page = build_page(result.scalars().all(), "start_date", limit)
+        if projection:
+            return projected_response({**page, "items": project(page["items"], EventResponse, projection)})
+        return model_response(EventPage, page)
+
     result = await db.execute(
-        select(Event).order_by(Event.start_date.desc())
+        query.order_by(Event.start_date.desc())
     )
     events = result.scalars().all()
-    return events
+    if projection:
+        return projected_response(project(events, EventResponse, projection))
+    return model_response(List[EventResponse], events)
 
 
 @router.get("/events/{event_id}", response_model=EventResponse, tags=["イベント"])
 async def get_event(
     event_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     イベントの詳細を取得
+
+    ETag / Last-Modified を返し、If-None-Match / If-Modified-Since が一致すれば 304 を返します。
     """
     result = await db.execute(
         select(Event).where(Event.id == event_id)
@@ -96,6 +130,10 @@ async def get_event(
             detail="Event not found"
         )
 
+    validators = row_validators(event)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    apply_cache_headers(response, validators)
     return event
 
 
@@ -182,39 +220,41 @@ async def join_event(
             detail="Event not found"
         )
 
-    # 既に参加しているかチェック
+    # 既に参加しているかチェック（キャンセル済みの行も含めて1ユーザー1行）
     existing_result = await db.execute(
         select(EventParticipant).where(
             EventParticipant.event_id == event_id,
-            EventParticipant.user_id == current_user.id,
-            EventParticipant.status == ParticipantStatus.JOINED
+            EventParticipant.user_id == current_user.id
         )
     )
-    existing = existing_result.scalar_one_or_none()
+    participant = existing_result.scalar_one_or_none()
 
-    if existing:
+    if participant and participant.status == ParticipantStatus.JOINED:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already joined this event"
         )
 
-    # 参加登録
-    participant = EventParticipant(
-        event_id=event_id,
-        user_id=current_user.id,
-        status=ParticipantStatus.JOINED
-    )
-    db.add(participant)
+    # 参加登録（キャンセル後の再参加は同じ行を戻す）
+    if participant:
+        participant.status = ParticipantStatus.JOINED
+        participant.joined_at = func.now()
+    else:
+        participant = EventParticipant(
+            event_id=event_id,
+            user_id=current_user.id,
+            status=ParticipantStatus.JOINED
+        )
+        db.add(participant)
 
-    # ポイントを付与（10pt）
-    point = Point(
+    # ポイント付与の対象として記録（付与量は app.services.point_rules）
+    await enqueue_point_event(
+        db,
         user_id=current_user.id,
-        amount=10,
         action_type="event_join",
         reference_id=str(event_id),
         description=f"イベント「{event.title}」に参加"
     )
-    db.add(point)
 
     await db.commit()
     await db.refresh(participant)
@@ -258,33 +298,33 @@ async def leave_event(
 async def get_participants(
     event_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     イベント参加者一覧を取得
     """
-    # イベントの存在確認
-    event_result = await db.execute(
-        select(Event).where(Event.id == event_id)
+    # イベントの存在確認と参加者の取得を1つのクエリで行う（参加者がいなければ参加者は NULL の1行）
+    result = await db.execute(
+        select(Event.id, EventParticipant)
+        .outerjoin(
+            EventParticipant,
+            and_(
+                EventParticipant.event_id == Event.id,
+                EventParticipant.status == ParticipantStatus.JOINED
+            )
+        )
+        .where(Event.id == event_id)
+        .order_by(EventParticipant.joined_at.desc())
     )
-    event = event_result.scalar_one_or_none()
+    rows = result.all()
 
-    if not event:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found"
         )
 
-    # 参加者を取得
-    result = await db.execute(
-        select(EventParticipant)
-        .where(
-            EventParticipant.event_id == event_id,
-            EventParticipant.status == ParticipantStatus.JOINED
-        )
-        .order_by(EventParticipant.joined_at.desc())
-    )
-    participants = result.scalars().all()
+    participants = [participant for _, participant in rows if participant is not None]
 
     return [
         {
@@ -6,7 +6,7 @@ from typing import List
 from uuid import UUID
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_read_db
 from app.models.user import User
 from app.models.goal import Goal, GoalStatus
 from app.schemas.goal import GoalCreate, GoalUpdate, GoalResponse
@@ -43,7 +43,7 @@ async def create_goal(
 @router.get("/goals", response_model=List[GoalResponse], tags=["あそとステップ"])
 async def get_goals(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     自分の目標一覧を取得
@@ -59,7 +59,7 @@ async def get_goals(
 async def get_goal(
     goal_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     目標の詳細を取得
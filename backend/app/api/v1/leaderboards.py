@@ -0,0 +1,77 @@
+"""ランキング API エンドポイント"""
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.core.dependencies import get_current_user, get_read_db
+from app.models.user import User
+from app.models.project import Project
+from app.schemas.leaderboard import LeaderboardResponse
+from app.services.leaderboards import (
+    LeaderboardPeriod,
+    get_project_rank,
+    get_project_top,
+    get_rank,
+    get_top,
+    period_key,
+)
+
+router = APIRouter()
+
+
+@router.get("/leaderboards/{period}", response_model=LeaderboardResponse, tags=["ランキング"])
+async def get_leaderboard(
+    period: LeaderboardPeriod,
+    limit: int = Query(10, ge=1, le=100, description="取得する上位の人数"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    獲得ポイントのランキングを取得
+
+    - **period**: 期間（all: 累計 / month: 今月 / week: 今週）
+
+    **返却データ**:
+    - **period**: 期間のキー（"all" / "2026-10" / "2026-W42"）
+    - **entries**: 上位のユーザー（同点は同順位）
+    - **me**: 自分の順位（この期間にポイントがなければ null）
+    """
+    key = period_key(period, datetime.now(timezone.utc))
+
+    return LeaderboardResponse(
+        period=key,
+        entries=await get_top(db, key, limit),
+        me=await get_rank(db, key, current_user),
+    )
+
+
+@router.get("/projects/{project_id}/leaderboard", response_model=LeaderboardResponse, tags=["ランキング"])
+async def get_project_leaderboard(
+    project_id: UUID,
+    limit: int = Query(10, ge=1, le=100, description="取得する上位の人数"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    プロジェクト内の貢献度ランキングを取得
+
+    参加中のメンバーを contribution_points の順に返します。
+    貢献度はこのプロジェクトに紐づくポイントの合計です。
+    現在はプロジェクトの作成（オーナー）のポイントだけが対象で、ほかのメンバーは 0 です。
+    """
+    result = await db.execute(
+        select(Project.id).where(Project.id == project_id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    return LeaderboardResponse(
+        entries=await get_project_top(db, project_id, limit),
+        me=await get_project_rank(db, project_id, current_user),
+    )
@@ -1,20 +1,51 @@
 """内省ログ（Log）API エンドポイント"""
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, and_
-from typing import List, Optional
+from sqlalchemy import Select, select, or_, and_
+from typing import List, Optional, Union
 from uuid import UUID
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.fields import load_fields, parse_fields, project, projected_response
+from app.core.http_cache import apply_cache_headers, is_not_modified, not_modified_response, rows_validators
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, build_page, is_paginated, paginate_query
+from app.core.responses import model_response
+from app.core.search import highlight, search_terms
+from app.core.tags import TAG_MODE_PATTERN, apply_tag_filter, normalize_tags
+from app.core.dependencies import get_current_user, get_read_db
 from app.models.user import User
 from app.models.log import Log, LogVisibility
-from app.models.point import Point
-from app.schemas.log import LogCreate, LogUpdate, LogResponse
+from app.services.log_search import SEARCH_CANDIDATES, find_candidates
+from app.services.point_events import enqueue_point_event
+from app.schemas.log import LogCreate, LogUpdate, LogResponse, LogSummary, LogPage, LogSearchHit, LogSearchPage
 
 router = APIRouter()
 
 
+def _visible_logs(current_user: User, visibility: Optional[str]) -> Select:
+    """閲覧できるログ（自分のログ OR 公開ログ）を visibility で絞り込むクエリ"""
+    # 基本クエリ: 自分のログ OR 公開ログ
+    query = select(Log).where(
+        or_(
+            Log.user_id == current_user.id,
+            Log.visibility == LogVisibility.PUBLIC
+        )
+    )
+
+    # visibilityフィルタ
+    if visibility:
+        if visibility == "public":
+            query = query.where(Log.visibility == LogVisibility.PUBLIC)
+        elif visibility == "private":
+            query = query.where(
+                and_(
+                    Log.user_id == current_user.id,
+                    Log.visibility == LogVisibility.PRIVATE
+                )
+            )
+    return query
+
+
 @router.post("/logs", response_model=LogResponse, status_code=status.HTTP_201_CREATED, tags=["内省ログ"])
 async def create_log(
     log_data: LogCreate,
@@ -38,28 +69,34 @@ async def create_log(
         user_id=current_user.id,
     )
     db.add(log)
+    await db.flush()
 
-    # ポイントを付与（5pt）
-    point = Point(
+    # ポイント付与の対象として記録（付与量は app.services.point_rules）
+    await enqueue_point_event(
+        db,
         user_id=current_user.id,
-        amount=5,
         action_type="log_create",
         reference_id=str(log.id),
         description=f"内省ログ「{log.title}」を投稿"
     )
-    db.add(point)
 
     await db.commit()
     await db.refresh(log)
     return log
 
 
-@router.get("/logs", response_model=List[LogResponse], tags=["内省ログ"])
+@router.get("/logs", response_model=Union[LogPage, List[LogResponse]], tags=["内省ログ"])
 async def get_logs(
+    request: Request,
     visibility: Optional[str] = Query(None, description="公開設定フィルタ（public/private）"),
     tag: Optional[str] = Query(None, description="タグフィルタ"),
+    tags: Optional[List[str]] = Query(None, description="タグフィルタ（複数指定可）"),
+    tag_mode: str = Query("all", pattern=TAG_MODE_PATTERN, description="複数タグの条件（all: すべて含む / any: いずれかを含む）"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="1ページの件数（指定時はカーソルページで返却）"),
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    fields: Optional[str] = Query(None, description="返すフィールド（カンマ区切り。summary で要約）"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     内省ログ一覧を取得
@@ -70,47 +107,106 @@ async def get_logs(
     クエリパラメータ:
     - **visibility**: public/private でフィルタ
     - **tag**: タグでフィルタ
-    """
-    # 基本クエリ: 自分のログ OR 公開ログ
-    query = select(Log).where(
-        or_(
-            Log.user_id == current_user.id,
-            Log.visibility == LogVisibility.PUBLIC
-        )
-    )
+    - **tags** / **tag_mode**: 複数タグでフィルタ（all: AND / any: OR）
+    - **limit** / **cursor**: 指定するとカーソルページ（items, next_cursor）で返却
+    - **fields**: 返すフィールド（例: id,title,created_at。summary で要約）。指定したカラムだけを読みます
 
-    # visibilityフィルタ
-    if visibility:
-        if visibility == "public":
-            query = query.where(Log.visibility == LogVisibility.PUBLIC)
-        elif visibility == "private":
-            query = query.where(
-                and_(
-                    Log.user_id == current_user.id,
-                    Log.visibility == LogVisibility.PRIVATE
-                )
-            )
+    ETag を返し、If-None-Match が一致すれば 304 を返します（本文は作りません）。
+    """
+    query = _visible_logs(current_user, visibility)
 
-    # タグフィルタ（PostgreSQLのJSON演算子を使用）
+    # タグフィルタ（tags の GIN インデックスを使用）
     if tag:
-        # JSON配列に指定したタグが含まれているかチェック
-        # JSONBの@>演算子を使用（contains）
-        from sqlalchemy import cast, String
-        from sqlalchemy.dialects.postgresql import JSONB
-        query = query.where(cast(Log.tags, JSONB).op('@>')(cast([tag], JSONB)))
+        query = apply_tag_filter(query, Log.tags, [tag])
+    query = apply_tag_filter(query, Log.tags, normalize_tags(tags), tag_mode)
+
+    projection = parse_fields(fields, LogResponse, LogSummary)
+    if projection:
+        # updated_at は ETag に使う
+        query = load_fields(query, Log, projection, "id", "created_at", "updated_at")
+
+    if is_paginated(limit, cursor):
+        query = paginate_query(query, Log.created_at, Log.id, limit, cursor)
+        result = await db.execute(query)
+        page = build_page(result.scalars().all(), "created_at", limit)
+        validators = rows_validators(page["items"], page["next_cursor"], projection)
+        if is_not_modified(request, validators):
+            return not_modified_response(validators)
+        if projection:
+            content = projected_response({**page, "items": project(page["items"], LogResponse, projection)})
+        else:
+            content = model_response(LogPage, page)
+        return apply_cache_headers(content, validators)
 
     query = query.order_by(Log.created_at.desc())
 
     result = await db.execute(query)
     logs = result.scalars().all()
-    return logs
+    validators = rows_validators(logs, projection)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    if projection:
+        content = projected_response(project(logs, LogResponse, projection))
+    else:
+        content = model_response(List[LogResponse], logs)
+    return apply_cache_headers(content, validators)
+
+
+@router.get("/logs/search", response_model=LogSearchPage, tags=["内省ログ"])
+async def search_logs(
+    q: str = Query(..., min_length=1, max_length=100, description="検索語（空白区切りで AND）"),
+    visibility: Optional[str] = Query(None, description="公開設定フィルタ（public/private）"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="1ページの件数"),
+    offset: int = Query(0, ge=0, le=SEARCH_CANDIDATES, description="前ページの next_offset"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    内省ログをタイトル・本文で検索
+
+    一覧（GET /logs）と同じく、自分のログと他人の公開ログが対象です。
+    検索語を部分文字列として含むログを関連度（タイトルの一致を優先）の順に返します。
+    一致するログが多い場合は、新しい1000件の中での関連度順になります。
+
+    **返却データ**:
+    - **items**: ログと rank（関連度）、snippet（本文の検索語の前後）、highlights（snippet 内の検索語の位置）
+    - **next_offset**: 次ページの offset（最後のページは null）
+    """
+    terms = search_terms(q)
+    if not terms:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query is empty"
+        )
+
+    candidates = await find_candidates(db, _visible_logs(current_user, visibility).whereclause, terms)
+    ranked = sorted(candidates, key=lambda candidate: (candidate.rank, candidate.created_at, candidate.id), reverse=True)
+    page = ranked[offset:offset + limit]
+
+    result = await db.execute(select(Log).where(Log.id.in_([candidate.id for candidate in page])))
+    logs = {log.id: log for log in result.scalars()}
+
+    items = []
+    for candidate in page:
+        log = logs.get(candidate.id)
+        if log is None:
+            # 候補の検索と本文の取得の間に削除された
+            continue
+        snippet, highlights = highlight(log.content, terms)
+        items.append(LogSearchHit(
+            **LogResponse.model_validate(log).model_dump(),
+            rank=candidate.rank,
+            snippet=snippet,
+            highlights=highlights,
+        ))
+    return LogSearchPage(items=items, next_offset=offset + limit if len(ranked) > offset + limit else None)
 
 
 @router.get("/logs/{log_id}", response_model=LogResponse, tags=["内省ログ"])
 async def get_log(
     log_id: UUID,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     ログの詳細を取得
@@ -1,22 +1,30 @@
 """ポイント（Point）API エンドポイント"""
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc
-from typing import List
+from sqlalchemy import select, desc
+from typing import List, Optional
 
-from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, get_read_db
 from app.models.user import User
 from app.models.point import Point
-from app.schemas.point import PointResponse, PointSummary
+from app.services.points import get_balance
+from app.services.point_rollups import PointGranularity, get_series
+from app.services.point_rules import day_start
+from app.schemas.point import PointResponse, PointSummary, PointSeries
 
 router = APIRouter()
 
+# 推移で一度に返す期間の上限
+MAX_SERIES_BUCKETS = 366
+# from を省略したときに返す期間の数
+DEFAULT_SERIES_BUCKETS = {PointGranularity.DAY: 30, PointGranularity.WEEK: 12}
+
 
 @router.get("/users/me/points", response_model=PointSummary, tags=["ポイント"])
 async def get_my_points(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     自分のポイント累計を取得
@@ -25,12 +33,8 @@ async def get_my_points(
     - **total_points**: 累計ポイント
     - **user_id**: ユーザーID
     """
-    # ポイント累計を計算
-    result = await db.execute(
-        select(func.sum(Point.amount))
-        .where(Point.user_id == current_user.id)
-    )
-    total_points = result.scalar() or 0
+    # ポイント残高テーブルから取得
+    total_points = await get_balance(db, current_user.id)
 
     return PointSummary(
         user_id=current_user.id,
@@ -41,7 +45,7 @@ async def get_my_points(
 @router.get("/users/me/points/history", response_model=List[PointResponse], tags=["ポイント"])
 async def get_my_points_history(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     自分のポイント獲得履歴を取得
@@ -66,3 +70,46 @@ async def get_my_points_history(
     points = result.scalars().all()
 
     return points
+
+
+@router.get("/users/me/points/series", response_model=PointSeries, tags=["ポイント"])
+async def get_my_points_series(
+    granularity: PointGranularity = Query(PointGranularity.DAY, description="集計の単位（day / week）"),
+    from_date: Optional[date] = Query(None, alias="from", description="開始日（省略時は to から30日・12週前）"),
+    to_date: Optional[date] = Query(None, alias="to", description="終了日（省略時は今日）"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    自分の獲得ポイントの推移を取得
+
+    日別・週別の集計（point_rollups）から返すので、期間の長さによらず軽量です。
+    日付の区切りは POINTS_TIMEZONE、週は月曜始まりです。
+
+    **返却データ**:
+    - **granularity**: 集計の単位
+    - **buckets**: 期間ごとの合計（ポイントのない期間も 0 で含む）
+        - **bucket_start**: 期間の初日
+        - **total**: 獲得ポイント
+        - **count**: 付与の回数
+        - **by_action**: アクションタイプごとの獲得ポイント
+    """
+    step = 7 if granularity == PointGranularity.WEEK else 1
+    if to_date is None:
+        to_date = day_start(datetime.now(timezone.utc)).date()
+    if from_date is None:
+        from_date = to_date - timedelta(days=step * (DEFAULT_SERIES_BUCKETS[granularity] - 1))
+
+    if from_date > to_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'"
+        )
+    if (to_date - from_date).days // step + 1 > MAX_SERIES_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many buckets (max {MAX_SERIES_BUCKETS})"
+        )
+
+    buckets = await get_series(db, current_user.id, granularity, from_date, to_date)
+    return PointSeries(granularity=granularity.value, buckets=buckets)
@@ -1,19 +1,24 @@
 """プロジェクト（Project）API エンドポイント"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional, Union
 from uuid import UUID
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.fields import load_fields, parse_fields, project, projected_response
+from app.core.http_cache import apply_cache_headers, is_not_modified, not_modified_response, row_validators
+from app.core.pagination import MAX_PAGE_SIZE, build_page, is_paginated, paginate_query
+from app.core.responses import model_response
+from app.core.tags import TAG_MODE_PATTERN, apply_tag_filter, normalize_tags
+from app.core.dependencies import get_current_user, get_read_db
 from app.models.user import User
-from app.models.project import Project, ProjectCategory, ProjectStatus
+from app.models.project import Project, ProjectStatus
 from app.models.project_member import ProjectMember, MemberRole, MemberStatus
 from app.models.project_task import ProjectTask, TaskStatus
-from app.models.point import Point
+from app.services.point_events import enqueue_point_event
 from app.schemas.project import (
-    ProjectCreate, ProjectUpdate, ProjectResponse,
+    ProjectCreate, ProjectUpdate, ProjectResponse, ProjectSummary, ProjectPage,
     ProjectTaskCreate, ProjectTaskUpdate, ProjectTaskResponse
 )
 
@@ -62,47 +67,75 @@ async def create_project(
     )
     db.add(owner_member)
 
-    # ポイントを付与（あそと: 50pt, あそび: 30pt）
-    points = 50 if project_data.category == ProjectCategory.ASOTO else 30
-    point = Point(
+    # ポイント付与の対象として記録（付与量は app.services.point_rules）
+    await enqueue_point_event(
+        db,
         user_id=current_user.id,
-        amount=points,
         action_type="project_create",
         reference_id=str(project.id),
-        description=f"プロジェクト「{project.title}」を作成"
+        description=f"プロジェクト「{project.title}」を作成",
+        variant=project_data.category.value,
     )
-    db.add(point)
 
     await db.commit()
     await db.refresh(project)
     return project
 
 
-@router.get("/projects", response_model=List[ProjectResponse], tags=["プロジェクト"])
+@router.get("/projects", response_model=Union[ProjectPage, List[ProjectResponse]], tags=["プロジェクト"])
 async def get_projects(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="1ページの件数（指定時はカーソルページで返却）"),
+    cursor: Optional[str] = Query(None, description="前ページの next_cursor"),
+    tags: Optional[List[str]] = Query(None, description="タグフィルタ（複数指定可）"),
+    tag_mode: str = Query("all", pattern=TAG_MODE_PATTERN, description="複数タグの条件（all: すべて含む / any: いずれかを含む）"),
+    fields: Optional[str] = Query(None, description="返すフィールド（カンマ区切り。summary で要約）"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     プロジェクト一覧を取得
 
     公開プロジェクトを新しい順に表示
+
+    - **tags** / **tag_mode**: 複数タグでフィルタ（all: AND / any: OR）
+    - **limit** / **cursor**: 指定するとカーソルページ（items, next_cursor）で返却
+    - **fields**: 返すフィールド（例: id,title,created_at。summary で要約）。指定したカラムだけを読みます
     """
+    query = apply_tag_filter(select(Project), Project.tags, normalize_tags(tags), tag_mode)
+
+    projection = parse_fields(fields, ProjectResponse, ProjectSummary)
+    if projection:
+        query = load_fields(query, Project, projection, "id", "created_at")
+
+    if is_paginated(limit, cursor):
+        query = paginate_query(query, Project.created_at, Project.id, limit, cursor)
+        result = await db.execute(query)
+        page = build_page(result.scalars().all(), "created_at", limit)
+        if projection:
+            return projected_response({**page, "items": project(page["items"], ProjectResponse, projection)})
+        return model_response(ProjectPage, page)
+
     result = await db.execute(
-        select(Project).order_by(Project.created_at.desc())
+        query.order_by(Project.created_at.desc())
     )
     projects = result.scalars().all()
-    return projects
+    if projection:
+        return projected_response(project(projects, ProjectResponse, projection))
+    return model_response(List[ProjectResponse], projects)
 
 
 @router.get("/projects/{project_id}", response_model=ProjectResponse, tags=["プロジェクト"])
 async def get_project(
     project_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     プロジェクトの詳細を取得
+
+    ETag / Last-Modified を返し、If-None-Match / If-Modified-Since が一致すれば 304 を返します。
     """
     result = await db.execute(
         select(Project).where(Project.id == project_id)
@@ -115,6 +148,10 @@ async def get_project(
             detail="Project not found"
         )
 
+    validators = row_validators(project)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    apply_cache_headers(response, validators)
     return project
 
 
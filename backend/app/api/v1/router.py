@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, goals, steps, logs, events, projects, dashboard, users, points
+from app.api.v1 import auth, goals, steps, logs, events, projects, dashboard, users, points, tags, leaderboards
 
 api_router = APIRouter()
 
@@ -7,8 +7,10 @@ api_router.include_router(auth.router, prefix="/auth", tags=["認証"])
 api_router.include_router(dashboard.router)
 api_router.include_router(users.router)
 api_router.include_router(points.router)
+api_router.include_router(leaderboards.router)
 api_router.include_router(goals.router)
 api_router.include_router(steps.router)
 api_router.include_router(logs.router)
 api_router.include_router(events.router)
 api_router.include_router(projects.router)
+api_router.include_router(tags.router)
@@ -11,7 +11,7 @@ from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.goal import Goal
 from app.models.step import Step, StepStatus
-from app.models.point import Point
+from app.services.point_events import enqueue_point_event
 from app.schemas.step import StepCreate, StepUpdate, StepResponse
 
 router = APIRouter()
@@ -99,7 +99,7 @@ async def complete_step(
     """
     ステップを完了
 
-    ステップを完了状態にし、10ポイントを付与します。
+    ステップを完了状態にし、10ポイントを付与します（同じステップへの付与は1回のみ）。
     """
     # ステップの取得と権限チェック
     result = await db.execute(
@@ -119,15 +119,14 @@ async def complete_step(
     step.status = StepStatus.COMPLETED
     step.completed_at = datetime.now()
 
-    # ポイントを付与（10pt）
-    point = Point(
+    # ポイント付与の対象として記録（付与量は app.services.point_rules）
+    await enqueue_point_event(
+        db,
         user_id=current_user.id,
-        amount=10,
         action_type="step_complete",
         reference_id=str(step_id),
         description=f"ステップ「{step.title}」を完了"
     )
-    db.add(point)
 
     await db.commit()
     await db.refresh(step)
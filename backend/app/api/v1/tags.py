@@ -0,0 +1,34 @@
+"""タグ API エンドポイント"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import List
+
+from app.core.dependencies import get_current_user, get_read_db
+from app.models.user import User
+from app.models.tag_count import TagCounter
+from app.schemas.tag import TagCount
+
+router = APIRouter()
+
+
+@router.get("/tags", response_model=List[TagCount], tags=["タグ"])
+async def get_tag_counts(
+    source: str = Query("logs", pattern="^(logs|events|projects)$", description="集計対象（logs / events / projects）"),
+    limit: int = Query(20, ge=1, le=100, description="取得するタグの件数"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    よく使われているタグと件数を取得
+
+    件数の多い順に最大 limit 件を返します（ログは公開ログのみ集計）。
+    件数はトリガーで更新している tag_counts から、インデックスの順に読み出します。
+    """
+    result = await db.execute(
+        select(TagCounter.tag, TagCounter.count)
+        .where(TagCounter.source == source)
+        .order_by(TagCounter.count.desc(), TagCounter.tag)
+        .limit(limit)
+    )
+    return [TagCount(tag=row.tag, count=row.count) for row in result]
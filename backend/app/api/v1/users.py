@@ -1,11 +1,12 @@
 """ユーザープロフィール（UserProfile）API エンドポイント"""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.http_cache import PRIVATE_SHORT, apply_cache_headers, is_not_modified, not_modified_response, row_validators
+from app.core.dependencies import get_current_user, get_read_db
 from app.models.user import User
 from app.models.user_profile import UserProfile
 from app.schemas.user_profile import UserProfileUpdate, UserProfileResponse
@@ -13,22 +14,17 @@ from app.schemas.user_profile import UserProfileUpdate, UserProfileResponse
 router = APIRouter()
 
 
-@router.get("/users/{user_id}/profile", response_model=UserProfileResponse, tags=["プロフィール"])
-async def get_user_profile(
-    user_id: UUID,
+# /users/{user_id}/profile より先に登録する（"me" を user_id として解釈させない）
+@router.get("/users/me/profile", response_model=UserProfileResponse, tags=["プロフィール"])
+async def get_my_profile(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    ユーザープロフィールを取得
-
-    - **user_id**: ユーザーID
-
-    誰でも他のユーザーのプロフィールを閲覧できます。
+    自分のプロフィールを取得
     """
-    # ユーザープロフィールを取得
     result = await db.execute(
-        select(UserProfile).where(UserProfile.user_id == user_id)
+        select(UserProfile).where(UserProfile.user_id == current_user.id)
     )
     profile = result.scalar_one_or_none()
 
@@ -41,16 +37,25 @@ async def get_user_profile(
     return profile
 
 
-@router.get("/users/me/profile", response_model=UserProfileResponse, tags=["プロフィール"])
-async def get_my_profile(
+@router.get("/users/{user_id}/profile", response_model=UserProfileResponse, tags=["プロフィール"])
+async def get_user_profile(
+    user_id: UUID,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
-    自分のプロフィールを取得
+    ユーザープロフィールを取得
+
+    - **user_id**: ユーザーID
+
+    誰でも他のユーザーのプロフィールを閲覧できます。
+    ETag / Last-Modified を返し、ブラウザには60秒まで再検証なしでキャッシュさせます。
     """
+    # ユーザープロフィールを取得
     result = await db.execute(
-        select(UserProfile).where(UserProfile.user_id == current_user.id)
+        select(UserProfile).where(UserProfile.user_id == user_id)
     )
     profile = result.scalar_one_or_none()
 
@@ -60,6 +65,10 @@ async def get_my_profile(
             detail="Profile not found"
         )
 
+    validators = row_validators(profile, cache_control=PRIVATE_SHORT)
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    apply_cache_headers(response, validators)
     return profile
 
 
@@ -0,0 +1,150 @@
+"""キャッシュバックエンド
+
+プロセス内の LRU キャッシュと、Redis 互換サーバーを使うキャッシュを同じインターフェースで扱う。
+Redis バックエンドを使う場合は redis パッケージが必要。
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Coroutine, Optional, Set
+
+from sqlalchemy.exc import MissingGreenlet
+from sqlalchemy.util import await_only
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class CacheBackend:
+    """キャッシュバックエンドの共通インターフェース"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """TTL付きのプロセス内 LRU キャッシュ"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self.put(key, value, ttl)
+
+    def put(self, key: str, value: Any, ttl: int) -> None:
+        """同期コンテキストからエントリを保存"""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self.discard(key)
+
+    def discard(self, key: str) -> None:
+        """同期コンテキストからエントリを破棄"""
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 互換サーバーを使うキャッシュ（値はJSONで保存）"""
+
+    def __init__(self, url: str, prefix: str = "asotobase:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("Redis cache backend requires the 'redis' package") from e
+
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(self.prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self._client.set(self.prefix + key, json.dumps(value), ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self.prefix + key)
+
+    async def clear(self) -> None:
+        async for key in self._client.scan_iter(match=self.prefix + "*"):
+            await self._client.delete(key)
+
+
+def run_in_session_hook(coro: Coroutine[Any, Any, None]) -> None:
+    """
+    セッションのイベントフック（after_commit など同期の処理）から、外部バックエンドへの書き込みを実行する
+
+    AsyncSession のコミット中（greenlet 内）なら書き込みが終わるまで待つので、
+    await db.commit() が戻った時点で反映済みになる。書き込みの例外は呼び出し側に伝わる。
+    それ以外（イベントループ上の同期 Session など）は実行中のイベントループに予約し、失敗はログに残す。
+    """
+    try:
+        await_only(coro)
+        return
+    except MissingGreenlet:
+        pass
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()
+        return
+    task = loop.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_finish_background_task)
+
+
+def _finish_background_task(task: asyncio.Task) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Cache backend write failed", exc_info=task.exception())
+
+
+def create_cache_backend(backend: str, max_size: int, prefix: str = "asotobase:") -> Optional[CacheBackend]:
+    """設定値からキャッシュバックエンドを作成（"none" の場合は None）"""
+    if backend == "none":
+        return None
+    if backend == "redis":
+        if not settings.REDIS_URL:
+            raise RuntimeError("REDIS_URL must be set to use the redis cache backend")
+        return RedisCacheBackend(settings.REDIS_URL, prefix=prefix)
+    if backend == "memory":
+        return MemoryCacheBackend(max_size=max_size)
+    raise ValueError(f"Unknown cache backend: {backend}")
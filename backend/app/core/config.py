@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -11,10 +11,58 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_URL_SYNC: str
 
+    # Connection pool（ワーカーごと。最大接続数 = POOL_SIZE + MAX_OVERFLOW）
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # -1 で無効
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # PgBouncer（transaction モード）経由では 0
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # 0 で無効
+
+    # Read replica（未設定なら読み取りもプライマリ）
+    DATABASE_REPLICA_URL: Optional[str] = None
+    READ_REPLICA_STICKY_SECONDS: int = 5  # 書き込んだユーザーの読み取りをプライマリに向ける時間
+    READ_REPLICA_STICKY_BACKEND: str = "memory"  # 書き込みの記録先（memory / redis / none）。複数ワーカーでは redis
+    READ_REPLICA_STICKY_MAX_SIZE: int = 10000
+
     # JWT
     SECRET_KEY: str
-    ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ALGORITHM: str = "HS256"  # HS256 / RS256 / ES256 など
+    JWT_PRIVATE_KEY_FILE: Optional[str] = None  # RS256 / ES256 の署名用 PEM
+    JWT_PUBLIC_KEY_FILE: Optional[str] = None  # 省略時は秘密鍵から作成
+    JWT_VERIFY_CACHE_SIZE: int = 10000  # 検証済みトークンのキャッシュ件数（0 で無効）
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+
+    # Password hashing（変更するとログイン時に新しいコストでハッシュし直す）
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2  # 0 でイベントループ上で実行
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # 超えたら 503
+
+    # Cache
+    REDIS_URL: Optional[str] = None
+    USER_CACHE_BACKEND: str = "memory"  # memory / redis / none
+    USER_CACHE_TTL_SECONDS: int = 30
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Dashboard（sequential / concurrent / single）
+    DASHBOARD_QUERY_STRATEGY: str = "sequential"
+    COMMUNITY_CACHE_TTL_SECONDS: int = 30  # 0 で無効
+    COMMUNITY_CACHE_STALE_SECONDS: int = 30
+
+    # Point events（worker: バックグラウンドで反映 / inline: リクエスト内で反映）
+    POINT_EVENTS_MODE: str = "worker"
+    POINT_EVENTS_BATCH_SIZE: int = 100
+    POINT_EVENTS_POLL_SECONDS: float = 1.0
+    POINT_EVENTS_MAX_ATTEMPTS: int = 5  # 失敗がこの回数に達したイベントは処理しない（failed_at）
+    POINTS_TIMEZONE: str = "Asia/Tokyo"  # 1日の上限・日別集計の区切り
+
+    # Response compression（Accept-Encoding で選ぶ優先順。空で無効。br は brotli パッケージが必要）
+    COMPRESSION_ENCODINGS: List[str] = ["br", "gzip"]
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # これより小さい本文は圧縮しない
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
 
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
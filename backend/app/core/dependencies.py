@@ -1,26 +1,32 @@
 """依存性注入用の共通関数"""
+from typing import AsyncGenerator
+
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core import database
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.replica import SESSION_USER_KEY, recent_writers
 from app.core.security import decode_access_token
+from app.core.token_revocation import token_revocations
+from app.core.user_cache import user_cache
 from app.models.user import User
 
 security = HTTPBearer()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
+async def authenticate(token: str, db: AsyncSession) -> User:
     """
-    現在のユーザーを取得
+    アクセストークンからユーザーを取得
 
-    JWTトークンを検証し、ユーザー情報を返す
+    JWTトークンを検証し、ユーザー情報を返す（署名の検証結果は verified_tokens にキャッシュされる）
+    ユーザー情報は user_cache に短時間キャッシュされる
+    無効化されたユーザー・失効したトークンは token_revocations でユーザーを読む前に拒否する
     """
-    token = credentials.credentials
     payload = decode_access_token(token)
 
     if payload is None:
@@ -38,9 +44,21 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # ユーザーを取得
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    token_version = payload.get("ver", 0)
+    if await token_revocations.is_revoked(user_id, token_version):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # ユーザーを取得（キャッシュになければDBから）
+    user = await user_cache.get(user_id)
+    if user is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            await user_cache.set(user)
 
     if user is None or not user.is_active:
         raise HTTPException(
@@ -49,4 +67,48 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    if token_version != (user.token_version or 0):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # このリクエストでコミットされた書き込みを、ユーザーに紐付けて記録するため
+    db.info[SESSION_USER_KEY] = user.id
     return user
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """現在のユーザーを取得（Authorization ヘッダーがなければ 403）"""
+    return await authenticate(credentials.credentials, db)
+
+
+async def get_current_user_oauth2(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """現在のユーザーを取得（OAuth2 のパスワードフロー用。Authorization ヘッダーがなければ 401）"""
+    return await authenticate(token, db)
+
+
+async def get_read_db(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    読み取り用のデータベースセッション
+
+    レプリカが設定されていればレプリカのセッションを返す。
+    レプリカ未設定の場合と、直近に書き込んだユーザーの場合はプライマリのセッションを返す。
+    書き込みを行うエンドポイントでは使わないこと。
+    """
+    if database.ReplicaSessionLocal is None or await recent_writers.contains(current_user.id):
+        yield db
+        return
+
+    async with database.ReplicaSessionLocal() as session:
+        yield session
@@ -0,0 +1,68 @@
+"""一覧 API のフィールド指定（fields=）
+
+fields=id,title,created_at のようにレスポンスに含めるフィールドを指定すると、
+SELECT も load_only でそのカラムだけに絞る（本文などの大きなカラムを読まない・送らない）。
+fields=summary は各リソースの要約スキーマ（LogSummary など）のフィールド。
+
+指定したフィールドだけのスキーマを作って検証・シリアライズするので、値の形式は
+指定しない場合のレスポンスと同じになる。
+"""
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import Select
+from sqlalchemy.orm import load_only
+
+from app.core.database import Base
+
+SUMMARY_FIELDS = "summary"
+
+
+def parse_fields(
+    fields: Optional[str],
+    response_model: Type[BaseModel],
+    summary_model: Type[BaseModel],
+) -> Optional[Tuple[str, ...]]:
+    """fields をフィールド名の組にする（指定なしは None、response_model にないフィールドは400エラー）"""
+    if fields is None:
+        return None
+    if fields.strip() == SUMMARY_FIELDS:
+        return tuple(summary_model.model_fields)
+
+    names = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in response_model.model_fields]
+    if not names or unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields specified"
+        )
+    return names
+
+
+def load_fields(query: Select, model: Type[Base], fields: Sequence[str], *required: str) -> Select:
+    """fields と required（カーソルの組み立てに使うカラムなど）のカラムだけを読む"""
+    return query.options(load_only(*(getattr(model, name) for name in dict.fromkeys([*required, *fields]))))
+
+
+@lru_cache(maxsize=256)
+def _fields_model(response_model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """response_model から fields だけを持つスキーマを作る"""
+    return create_model(
+        f"{response_model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (response_model.model_fields[name].annotation, response_model.model_fields[name]) for name in fields},
+    )
+
+
+def project(rows: Sequence[Any], response_model: Type[BaseModel], fields: Tuple[str, ...]) -> List[dict]:
+    """行を fields だけのスキーマで JSON 向けの dict にする（読んでいないカラムには触れない）"""
+    fields_model = _fields_model(response_model, fields)
+    return [fields_model.model_validate(row).model_dump(mode="json") for row in rows]
+
+
+def projected_response(content: Any) -> ORJSONResponse:
+    """fields を指定したときのレスポンス（response_model の検証を通さずに返す）"""
+    return ORJSONResponse(content)
@@ -0,0 +1,106 @@
+"""HTTP の条件付きリクエスト（ETag / Last-Modified）
+
+読み取り API で、取得した行の (id, updated_at) から弱い ETag を作り、
+If-None-Match（なければ If-Modified-Since）が一致すれば本文を JSON 化せずに 304 を返す。
+ポーリングするフロントエンドは変更がない間、ヘッダーだけのやり取りになる。
+
+- 1行（詳細）: ETag は (id, updated_at)、Last-Modified は updated_at
+- 一覧: ETag は件数と各行の (id, updated_at)（削除や公開範囲の変更で行が抜けても変わる）。
+  行が抜けても最大の updated_at は変わらないため、一覧には Last-Modified を付けない
+
+レスポンスは認証ユーザーごとに違うので、Cache-Control は private、Vary に Authorization を付ける。
+"""
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+# 毎回 ETag で再検証させる（変更がなければ 304）
+PRIVATE_REVALIDATE = "private, no-cache"
+# 少しの古さを許す（その間はリクエスト自体を送らせない）
+PRIVATE_SHORT = "private, max-age=60"
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """レスポンスの検証子と Cache-Control"""
+    etag: str
+    last_modified: Optional[datetime] = None
+    cache_control: str = field(default=PRIVATE_REVALIDATE)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control, "Vary": "Authorization"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+
+def weak_etag(*parts: Any) -> str:
+    """parts から弱い ETag（W/"..."）を作る"""
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _version(row: Any) -> tuple:
+    updated_at = getattr(row, "updated_at", None)
+    return str(row.id), updated_at.isoformat() if updated_at else None
+
+
+def row_validators(row: Any, cache_control: str = PRIVATE_REVALIDATE) -> CacheValidators:
+    """1行（id と updated_at を持つ ORM のオブジェクトやスキーマ）の検証子"""
+    return CacheValidators(
+        etag=weak_etag(_version(row)),
+        last_modified=getattr(row, "updated_at", None),
+        cache_control=cache_control,
+    )
+
+
+def rows_validators(rows: Iterable[Any], *extra: Any, cache_control: str = PRIVATE_REVALIDATE) -> CacheValidators:
+    """
+    一覧の検証子
+
+    extra には行以外で本文を変えるもの（次ページのカーソル、fields の指定、ポイントなど）を渡す。
+    """
+    versions = [_version(row) for row in rows]
+    return CacheValidators(etag=weak_etag(len(versions), versions, *extra), cache_control=cache_control)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match の弱い比較（W/ の有無を区別しない）"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def is_not_modified(request: Request, validators: CacheValidators) -> bool:
+    """条件付きリクエストがキャッシュ済みの本文と一致するか（If-None-Match を優先）"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validators.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # Last-Modified は秒までなので秒未満を切り捨てて比べる
+    return validators.last_modified.replace(microsecond=0) <= since
+
+
+def not_modified_response(validators: CacheValidators) -> Response:
+    """本文なしの 304"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers())
+
+
+def apply_cache_headers(response: Response, validators: CacheValidators) -> Response:
+    """response（エンドポイントの Response 引数、または返す Response）に検証子のヘッダーを付ける"""
+    response.headers.update(validators.headers())
+    return response
@@ -0,0 +1,135 @@
+"""リクエスト・SQLのメトリクス
+
+リクエストごとのレイテンシ、SQLの実行回数と合計時間を集計し、
+Prometheus のテキスト形式で出力する。
+
+SQL の計測は Engine のイベントで行い、実行中のリクエストの RequestStats
+（contextvar）に加算する。リクエスト外（スクリプトなど）の SQL は集計しない。
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_QUERY_START_KEY = "metrics_query_start"
+
+
+@dataclass
+class RequestStats:
+    """1リクエスト中のSQLの実行回数と合計時間"""
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+class Histogram:
+    """ラベルごとのヒストグラム（累積バケット・合計・件数）"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        # [バケットごとの件数..., +Inf の件数, 合計]
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, series in sorted(self._series.items()):
+            label_text = _format_labels(self.label_names, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                yield f'{self.name}_bucket{{{label_text},le="{le}"}} {cumulative}'
+            yield f"{self.name}_sum{{{label_text}}} {_format_value(series[-1])}"
+            yield f"{self.name}_count{{{label_text}}} {cumulative}"
+
+    def clear(self) -> None:
+        self._series.clear()
+
+
+class MetricsRegistry:
+    """HTTPリクエストのメトリクス"""
+
+    def __init__(self):
+        labels = ("method", "route", "status")
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "HTTP request latency.", labels, LATENCY_BUCKETS
+        )
+        self.request_sql_statements = Histogram(
+            "http_request_sql_statements", "SQL statements executed per HTTP request.", labels, SQL_COUNT_BUCKETS
+        )
+        self.request_db_duration = Histogram(
+            "http_request_db_duration_seconds", "Time spent in SQL per HTTP request.", labels, LATENCY_BUCKETS
+        )
+
+    def observe_request(self, method: str, route: str, status: int, duration: float, stats: RequestStats) -> None:
+        labels = (method, route, str(status))
+        self.request_duration.observe(labels, duration)
+        self.request_sql_statements.observe(labels, stats.sql_count)
+        self.request_db_duration.observe(labels, stats.sql_seconds)
+
+    def render(self, gauges: Optional[Dict[str, float]] = None, counters: Optional[Dict[str, float]] = None) -> str:
+        """Prometheus のテキスト形式で出力（gauges / counters は名前と値の辞書）"""
+        lines: List[str] = []
+        for histogram in (self.request_duration, self.request_sql_statements, self.request_db_duration):
+            lines.extend(histogram.render())
+        for metric_type, values in (("gauge", gauges), ("counter", counters)):
+            for name, value in sorted((values or {}).items()):
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for histogram in (self.request_duration, self.request_sql_statements, self.request_db_duration):
+            histogram.clear()
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    return ",".join(
+        f'{name}="{value.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in zip(names, values)
+    )
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+metrics = MetricsRegistry()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_request_stats.get() is not None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_request_stats.get()
+    starts = conn.info.get(_QUERY_START_KEY)
+    if stats is None or not starts:
+        return
+    stats.sql_count += 1
+    stats.sql_seconds += time.perf_counter() - starts.pop()
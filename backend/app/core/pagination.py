@@ -0,0 +1,71 @@
+"""カーソル（キーセット）ページネーション
+
+一覧APIで `(並び替えキー, id)` の組をカーソルとして使い、
+OFFSET を使わずに次ページを取得する。
+ページの位置に関わらず、インデックスを辿る範囲はページサイズ分だけになる。
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """並び替えキーとIDから不透明なカーソル文字列を作成"""
+    raw = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """カーソル文字列を並び替えキーとIDに戻す"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def is_paginated(limit: Optional[int], cursor: Optional[str]) -> bool:
+    """ページネーションモードで応答するかどうか"""
+    return limit is not None or cursor is not None
+
+
+def paginate_query(
+    query: Select,
+    sort_column: Any,
+    id_column: Any,
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> Select:
+    """
+    クエリに降順のキーセット条件とLIMITを付与
+
+    次ページの有無を判定するため、limit + 1 件を取得する。
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+
+    return query.order_by(sort_column.desc(), id_column.desc()).limit((limit or DEFAULT_PAGE_SIZE) + 1)
+
+
+def build_page(rows: Sequence[Any], sort_attr: str, limit: Optional[int]) -> dict:
+    """取得した行から CursorPage 形式のページと次のカーソルを組み立てる"""
+    page_size = limit or DEFAULT_PAGE_SIZE
+    items = list(rows[:page_size])
+    next_cursor = None
+    if len(rows) > page_size:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_attr), last.id)
+    return {"items": items, "next_cursor": next_cursor}
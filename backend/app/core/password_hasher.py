@@ -0,0 +1,81 @@
+"""パスワードハッシュの非同期実行
+
+bcrypt は1回あたり数百ミリ秒 CPU を使うため、イベントループ上で実行すると
+その間ほかのリクエストがすべて止まる。専用のスレッドプールで実行し、
+イベントループを塞がないようにする（bcrypt は計算中 GIL を解放する）。
+
+待ち行列が上限（PASSWORD_HASH_MAX_QUEUE）を超えたら PasswordHasherBusy を送出し、
+ログインが集中しても待ち時間が際限なく伸びないようにする（API は 503 を返す）。
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasherBusy(Exception):
+    """ハッシュの待ち行列が上限に達した"""
+
+
+class PasswordHasher:
+    """サイズ上限付きのスレッドプールでパスワードのハッシュ化・検証を行う"""
+
+    def __init__(self, max_workers: int, max_queue: int):
+        # max_workers=0 のときはイベントループ上でそのまま実行する（比較・デバッグ用）
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejected = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        """実行中と待機中の件数"""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self.run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(verify_password, plain_password, hashed_password)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """func をプールで実行（上限を超えていたら PasswordHasherBusy）"""
+        if self.max_workers <= 0:
+            return func(*args)
+
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        future = self._executor.submit(func, *args)
+        # リクエストがキャンセルされてもスレッドでの計算は続くため、完了時に件数を戻す
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """スレッドプールを止める（wait=True なら実行中・待機中の計算が終わるまで待つ）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"pending": self._pending, "rejected": self.rejected}
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -0,0 +1,97 @@
+"""読み取りレプリカへの振り分け
+
+GET エンドポイントは get_read_db でレプリカのセッションを使う。
+レプリカは遅れて反映されるため、書き込みをコミットしたユーザーは
+READ_REPLICA_STICKY_SECONDS の間プライマリから読む（自分の書き込みが見えるように）。
+
+書き込みの記録は READ_REPLICA_STICKY_BACKEND のキャッシュバックエンドに保存する。
+memory はプロセス内だけで有効なので、複数ワーカーで動かす場合は redis を使う
+（別ワーカーに振り分けられたリクエストにも反映される）。
+レプリカを設定したまま none にすると書き込んだユーザーにも古いデータを返すため、起動時にエラーにする。
+"""
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, create_cache_backend, run_in_session_hook
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# リクエストのセッションに、認証済みユーザーのIDを保存するキー（get_current_user が設定）
+SESSION_USER_KEY = "user_id"
+
+
+class RecentWriters:
+    """直近に書き込みをコミットしたユーザー"""
+
+    def __init__(self, backend: Optional[CacheBackend], window: int):
+        self.backend = backend
+        self.window = window
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.window > 0
+
+    async def contains(self, user_id: Any) -> bool:
+        if not self.enabled:
+            return False
+        return await self.backend.get(str(user_id)) is not None
+
+    def mark_nowait(self, user_id: Any) -> None:
+        """同期コンテキストから書き込みを記録（外部バックエンドは書き込みが終わるまで待つ）"""
+        if not self.enabled:
+            return
+        if isinstance(self.backend, MemoryCacheBackend):
+            self.backend.put(str(user_id), True, self.window)
+            return
+        try:
+            run_in_session_hook(self.backend.set(str(user_id), True, self.window))
+        except Exception:
+            logger.exception("Failed to record recent writer %s", user_id)
+
+    async def clear(self) -> None:
+        if self.backend is not None:
+            await self.backend.clear()
+
+
+def create_recent_writers(backend: str, window: int, max_size: int, replica_url: Optional[str]) -> RecentWriters:
+    """設定から RecentWriters を作成（レプリカを使うのに書き込みを記録できない設定は RuntimeError）"""
+    if replica_url and window > 0:
+        if backend == "none":
+            raise RuntimeError(
+                "READ_REPLICA_STICKY_BACKEND must be memory or redis when DATABASE_REPLICA_URL is set "
+                "(set READ_REPLICA_STICKY_SECONDS=0 to read stale data from the replica after writes)"
+            )
+        if backend == "memory":
+            logger.warning(
+                "READ_REPLICA_STICKY_BACKEND=memory keeps read-your-writes only within this process; "
+                "use redis when running multiple workers"
+            )
+    return RecentWriters(
+        backend=create_cache_backend(backend, max_size, prefix="asotobase:recent-writer:"),
+        window=window,
+    )
+
+
+recent_writers = create_recent_writers(
+    settings.READ_REPLICA_STICKY_BACKEND,
+    settings.READ_REPLICA_STICKY_SECONDS,
+    settings.READ_REPLICA_STICKY_MAX_SIZE,
+    settings.DATABASE_REPLICA_URL,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _record_writer(session):
+    """
+    コミットしたユーザーを記録
+
+    読み取りのエンドポイントはコミットしないため、コミット＝書き込みとして扱う
+    （Core の insert / update による書き込みも含めるため、フラッシュの有無は見ない）。
+    """
+    user_id = session.info.get(SESSION_USER_KEY)
+    if user_id is not None:
+        recent_writers.mark_nowait(user_id)
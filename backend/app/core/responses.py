@@ -0,0 +1,49 @@
+"""レスポンスの JSON 化
+
+FastAPI の既定では、response_model で検証した値をいったん dict / list に変換してから
+標準の json でエンコードする。大きな一覧ではこの変換とエンコードが CPU の大半を占めるため、
+
+- 既定のレスポンスクラスを ORJSONResponse にする（app.main の default_response_class）
+- 一覧では model_response で response_model と同じ型の検証を1回だけ行い、
+  検証済みの値を JSON 向けの変換（UUID・datetime の文字列化など）をせずに orjson でエンコードする
+  （pydantic-core の dump_json は日本語の多い本文では orjson より遅い）
+
+model_response は Response を返すので FastAPI 側の検証・変換は行われない。
+エンドポイントの response_model は OpenAPI の定義のために残しておく。
+"""
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+JSON_MEDIA_TYPE = "application/json"
+# UTC は pydantic と同じく "Z" で書く
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """orjson がそのまま扱えない値（asyncpg の UUID は uuid.UUID のサブクラス）"""
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+@lru_cache(maxsize=128)
+def _adapter(response_type: Any) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def model_response(response_type: Any, content: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    content を response_type で検証して JSON のレスポンスにする
+
+    ORM のオブジェクト（属性）と dict のどちらも受け付ける。
+    response_type は List[LogResponse] や LogPage のようにエンドポイントの response_model と同じ型を渡す。
+    """
+    adapter = _adapter(response_type)
+    value = adapter.validate_python(content, from_attributes=True)
+    body = orjson.dumps(adapter.dump_python(value), default=_default, option=ORJSON_OPTIONS)
+    return Response(body, status_code=status_code, media_type=JSON_MEDIA_TYPE)
@@ -0,0 +1,82 @@
+"""日本語テキストの全文検索（バイグラム）
+
+日本語は単語の区切りがないため、本文を2文字ずつずらした断片（バイグラム）に分けて
+tsvector にし、GIN インデックスで検索する。
+
+- 文書: search_bigrams() で「今日 日は は晴 晴れ れ」のように区切り、to_tsvector('simple') にする
+  （末尾の1文字も入れるので、1文字の検索語も前方一致で引ける）
+- 検索語: 2文字以上は隣り合うバイグラムのフレーズ（'気づ' <-> 'づき'）、1文字は前方一致（'気':*）
+- 空白で区切った複数の検索語は AND
+
+フレーズの隣接で確かめるので、検索語を部分文字列として含む文書だけが一致する。
+tsvector の位置は 16383 までなので、それより後ろの本文はフレーズで一致しない。
+"""
+import re
+from functools import reduce
+from typing import List, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.sql.elements import ColumnElement
+
+SEARCH_CONFIG = "simple"
+MAX_SEARCH_TERMS = 8
+SNIPPET_WIDTH = 80
+
+# 文書をバイグラムに分ける関数（生成列で使うので IMMUTABLE）
+SEARCH_BIGRAMS_FUNCTION = """
+CREATE OR REPLACE FUNCTION search_bigrams(doc text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT coalesce(string_agg(substr(doc, i, 2), ' ' ORDER BY i), '')
+    FROM generate_series(1, char_length(doc)) AS i
+$$
+"""
+
+
+def search_vector_expression(title: str, content: str) -> str:
+    """タイトル（重み A）と本文（重み B）の tsvector を作る SQL 式"""
+    return (
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, search_bigrams({title})), 'A') || "
+        f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, search_bigrams({content})), 'B')"
+    )
+
+
+def search_terms(q: str) -> List[str]:
+    """検索文字列を空白（全角を含む）で区切り、重複を除く（最大 MAX_SEARCH_TERMS 語）"""
+    return list(dict.fromkeys(q.split()))[:MAX_SEARCH_TERMS]
+
+
+def _term_query(term: str) -> ColumnElement:
+    if len(term) == 1:
+        return func.to_tsquery(SEARCH_CONFIG, func.quote_literal(term).concat(":*"))
+    bigrams = " ".join(term[i:i + 2] for i in range(len(term) - 1))
+    return func.phraseto_tsquery(SEARCH_CONFIG, bigrams)
+
+
+def search_query(terms: List[str]) -> ColumnElement:
+    """検索語（1語以上）をすべて含む文書に一致する tsquery"""
+    return reduce(lambda left, right: left.op("&&")(right), [_term_query(term) for term in terms])
+
+
+def highlight(text: str, terms: List[str], width: int = SNIPPET_WIDTH) -> Tuple[str, List[Tuple[int, int]]]:
+    """
+    最初に検索語が現れる位置の前後を切り出し、切り出した中での検索語の位置を返す
+
+    切り出した前後が続く場合は「…」を付ける（位置は「…」を含めて数える）。
+    改行は空白にする。
+    """
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    matches = list(pattern.finditer(text))
+
+    start = max(0, min(matches[0].start() - width // 4, len(text) - width)) if matches else 0
+    end = min(len(text), start + width)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+
+    snippet = prefix + re.sub(r"[\r\n]", " ", text[start:end]) + suffix
+    offset = len(prefix) - start
+    highlights = [
+        (match.start() + offset, match.end() + offset)
+        for match in matches
+        if start <= match.start() and match.end() <= end
+    ]
+    return snippet, highlights
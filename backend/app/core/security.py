@@ -1,6 +1,15 @@
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
 import bcrypt
 from app.core.config import settings
 
@@ -10,13 +19,22 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 
-def get_password_hash(password: str) -> str:
-    """パスワードをハッシュ化"""
-    salt = bcrypt.gensalt()
+def get_password_hash(password: str, rounds: Optional[int] = None) -> str:
+    """パスワードをハッシュ化（rounds を省略すると BCRYPT_ROUNDS）"""
+    salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """ハッシュのコストが BCRYPT_ROUNDS と異なるか（$2b$12$... の 12 の部分）"""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWTアクセストークンを作成"""
     to_encode = data.copy()
@@ -26,14 +44,129 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, get_jwt_keys().signing_key, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> Optional[dict]:
-    """JWTトークンをデコード"""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    """JWTトークンをデコード（検証済みのトークンは期限まで verified_tokens から返す）"""
+    payload = verified_tokens.get(token)
+    if payload is not None:
         return payload
+
+    try:
+        payload = jwt.decode(token, get_jwt_keys().verification_key, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+
+    verified_tokens.put(token, payload)
+    return payload
+
+
+@dataclass(frozen=True)
+class JWTKeys:
+    """署名・検証用の鍵（PEM の解析などを済ませたもの）"""
+    signing_key: Key
+    verification_key: Key
+
+
+@lru_cache(maxsize=None)
+def get_jwt_keys() -> JWTKeys:
+    """
+    ALGORITHM に応じた鍵を読み込む（プロセスごとに1回）
+
+    HS256 などの HMAC は SECRET_KEY を使う。RS256 / ES256 などの公開鍵方式は
+    JWT_PRIVATE_KEY_FILE（署名）と JWT_PUBLIC_KEY_FILE（検証）の PEM を使う。
+    公開鍵を省略した場合は秘密鍵から作る。
+    """
+    algorithm = settings.ALGORITHM
+    if algorithm not in ALGORITHMS.SUPPORTED:
+        raise ValueError(f"Unsupported JWT algorithm: {algorithm}")
+
+    if algorithm in ALGORITHMS.HMAC:
+        key = jwk.construct(settings.SECRET_KEY, algorithm)
+        return JWTKeys(signing_key=key, verification_key=key)
+
+    if not settings.JWT_PRIVATE_KEY_FILE:
+        raise ValueError(f"JWT_PRIVATE_KEY_FILE is required for {algorithm}")
+    signing_key = jwk.construct(Path(settings.JWT_PRIVATE_KEY_FILE).read_text(), algorithm)
+    if settings.JWT_PUBLIC_KEY_FILE:
+        verification_key = jwk.construct(Path(settings.JWT_PUBLIC_KEY_FILE).read_text(), algorithm)
+    else:
+        verification_key = signing_key.public_key()
+    return JWTKeys(signing_key=signing_key, verification_key=verification_key)
+
+
+class VerifiedTokenCache:
+    """
+    署名を検証済みのトークンの LRU キャッシュ
+
+    同じアクセストークンは期限まで何度も送られてくるため、署名の検証結果を
+    トークンの SHA-256 をキーにして exp まで保持する。
+    失効の確認（token_revocations）はキャッシュに関係なく毎回行われる。
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        if self.max_size <= 0:
+            return None
+
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        # exp のないトークンは期限を判断できないのでキャッシュしない
+        if self.max_size <= 0 or not isinstance(payload.get("exp"), (int, float)):
+            return
+
+        key = _token_key(token)
+        self._entries[key] = (payload["exp"], payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+verified_tokens = VerifiedTokenCache(max_size=settings.JWT_VERIFY_CACHE_SIZE)
+
+
+def generate_refresh_token() -> str:
+    """リフレッシュトークンを生成（JWT ではないランダムな文字列）"""
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    """リフレッシュトークンの保存用ハッシュ"""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
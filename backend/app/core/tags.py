@@ -0,0 +1,78 @@
+"""タグ（JSONB配列）による絞り込みと件数の集計
+
+tags / required_skills などの JSONB 配列カラムを GIN インデックスで検索する。
+
+- all: すべてのタグを含む（@>）
+- any: いずれかのタグを含む（?|）
+
+よく使われているタグの件数は tag_counts に持ち、DB のトリガーで更新する（TAG_COUNTS_FUNCTION）。
+"""
+from typing import List, Optional
+
+from sqlalchemy import Select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import InstrumentedAttribute
+
+TAG_MODE_PATTERN = "^(all|any)$"
+
+
+def normalize_tags(tags: Optional[List[str]]) -> List[str]:
+    """空白を除き、重複を取り除く（順序は維持）"""
+    if not tags:
+        return []
+    return list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
+
+
+def apply_tag_filter(query: Select, column: InstrumentedAttribute, tags: List[str], mode: str = "all") -> Select:
+    """タグの条件をクエリに追加（tags が空なら何もしない）"""
+    if not tags:
+        return query
+    if mode == "any":
+        return query.where(column.has_any(array(tags)))
+    return query.where(column.contains(tags))
+
+
+# よく使われているタグ（GET /tags）は tag_counts に (集計対象, タグ) ごとの件数を持ち、
+# logs / events / projects の変更に合わせて DB のトリガーが増分で更新する。
+# 文ごとのトリガーで変更前後の行（遷移テーブル）の差分をまとめて反映するので、
+# COPY での一括投入や外部キーの CASCADE による削除も反映される。ログは公開ログだけを数える。
+TAG_COUNTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION tag_counts_apply() RETURNS trigger
+LANGUAGE plpgsql AS $fn$
+DECLARE
+    counted text := CASE WHEN TG_TABLE_NAME = 'logs' THEN 'visibility = ''PUBLIC''' ELSE 'true' END;
+    changes text;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        changes := 'SELECT tags, 1 AS sign FROM new_rows WHERE ' || counted;
+    ELSIF TG_OP = 'DELETE' THEN
+        changes := 'SELECT tags, -1 AS sign FROM old_rows WHERE ' || counted;
+    ELSE
+        changes := 'SELECT tags, 1 AS sign FROM new_rows WHERE ' || counted
+            || ' UNION ALL SELECT tags, -1 FROM old_rows WHERE ' || counted;
+    END IF;
+
+    -- 同時に実行される更新同士がデッドロックしないよう、タグの順に更新する
+    EXECUTE 'INSERT INTO tag_counts AS t (source, tag, count)'
+        || ' SELECT $1, tag, SUM(c.sign)'
+        || ' FROM (' || changes || ') AS c, jsonb_array_elements_text(c.tags) AS tag'
+        || ' GROUP BY tag HAVING SUM(c.sign) <> 0 ORDER BY tag'
+        || ' ON CONFLICT (source, tag) DO UPDATE SET count = t.count + EXCLUDED.count'
+    USING TG_TABLE_NAME;
+    DELETE FROM tag_counts WHERE source = TG_TABLE_NAME AND count <= 0;
+    RETURN NULL;
+END
+$fn$
+"""
+
+
+def tag_counts_triggers(table: str) -> List[str]:
+    """table の tag_counts を更新するトリガー（INSERT / UPDATE / DELETE）"""
+    return [
+        f"CREATE TRIGGER {table}_tag_counts_insert AFTER INSERT ON {table} "
+        "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION tag_counts_apply()",
+        f"CREATE TRIGGER {table}_tag_counts_update AFTER UPDATE ON {table} "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION tag_counts_apply()",
+        f"CREATE TRIGGER {table}_tag_counts_delete AFTER DELETE ON {table} "
+        "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION tag_counts_apply()",
+    ]
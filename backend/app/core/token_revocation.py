@@ -0,0 +1,92 @@
+"""アクセストークンの失効
+
+アクセストークンは発行時の users.token_version を ver クレームに持つ。
+ユーザーの無効化や token_version の変更がコミットされたら、その時点の状態を
+ユーザーIDごとに記録し、get_current_user はユーザーを読む前にここで古いトークンを拒否する。
+
+記録はアクセストークンの有効期限の間だけ保持すればよい（それより古いトークンは期限切れになる）。
+キャッシュバックエンド（USER_CACHE_BACKEND）に保存するので、Redis を使えば別ワーカーにも反映される。
+Redis への記録はコミットの中で待つので、await db.commit() が戻った時点で古いトークンは拒否される
+（記録に失敗したらコミットの呼び出し元に例外が伝わり、ログアウトなどは成功を返さない）。
+"""
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, create_cache_backend, run_in_session_hook
+from app.core.config import settings
+from app.models.user import User
+
+_PENDING_KEY = "token_revocations"
+
+
+class TokenRevocations:
+    """ユーザーごとの有効なトークンの条件（is_active と token_version）"""
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.ttl > 0
+
+    async def is_revoked(self, user_id: Any, version: int) -> bool:
+        """token_version が version のトークンが失効しているか"""
+        if not self.enabled:
+            return False
+        state = await self.backend.get(str(user_id))
+        if state is None:
+            return False
+        return not state["is_active"] or version < state["token_version"]
+
+    def record_nowait(self, user_id: Any, is_active: bool, token_version: int) -> None:
+        """同期コンテキストからユーザーの状態を記録（外部バックエンドは書き込みが終わるまで待つ）"""
+        if not self.enabled:
+            return
+        state = {"is_active": is_active, "token_version": token_version}
+        if isinstance(self.backend, MemoryCacheBackend):
+            self.backend.put(str(user_id), state, self.ttl)
+            return
+        run_in_session_hook(self.backend.set(str(user_id), state, self.ttl))
+
+    async def clear(self) -> None:
+        if self.backend is not None:
+            await self.backend.clear()
+
+
+token_revocations = TokenRevocations(
+    backend=create_cache_backend(
+        settings.USER_CACHE_BACKEND,
+        settings.USER_CACHE_MAX_SIZE,
+        prefix="asotobase:token-revocation:",
+    ),
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_revocations(session, flush_context):
+    """is_active / token_version が変わった User を記録"""
+    states: Dict[Any, Dict[str, Any]] = session.info.get(_PENDING_KEY, {})
+    for obj in session.dirty:
+        if not isinstance(obj, User):
+            continue
+        attrs = inspect(obj).attrs
+        if attrs.is_active.history.has_changes() or attrs.token_version.history.has_changes():
+            states[obj.id] = {"is_active": bool(obj.is_active), "token_version": obj.token_version or 0}
+
+    if states:
+        session.info[_PENDING_KEY] = states
+
+
+@event.listens_for(Session, "after_commit")
+def _record_revocations(session):
+    for user_id, state in session.info.pop(_PENDING_KEY, {}).items():
+        token_revocations.record_nowait(user_id, **state)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_revocations(session):
+    session.info.pop(_PENDING_KEY, None)
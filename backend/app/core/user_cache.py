@@ -0,0 +1,155 @@
+"""認証ユーザーのキャッシュ
+
+get_current_user が毎リクエスト発行する users の主キー検索を省くため、
+ユーザー情報をユーザーIDごとに短いTTLでキャッシュする。
+
+User / UserProfile の変更がコミットされたら該当ユーザーのキャッシュを破棄するので、
+is_active やロール、プロフィールの変更は次のリクエストから反映される
+（外部バックエンドでも、破棄が終わってから await db.commit() が戻る）。
+プロセス外（別ワーカーや直接のSQL）での変更はTTLの経過で反映される。
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheBackend, MemoryCacheBackend, create_cache_backend, run_in_session_hook
+from app.core.config import settings
+from app.models.user import User, UserRole
+from app.models.user_profile import UserProfile
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "user_cache_invalidations"
+
+
+class UserCache:
+    """ユーザーIDをキーにしたユーザー情報のキャッシュ"""
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None and self.ttl > 0
+
+    async def get(self, user_id: str) -> Optional[User]:
+        """キャッシュからユーザーを取得（セッションに紐付かない User を返す）"""
+        if not self.enabled:
+            return None
+
+        data = await self.backend.get(str(user_id))
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return _from_snapshot(data)
+
+    async def set(self, user: User) -> None:
+        """ユーザーをキャッシュ（パスワードハッシュは保存しない）"""
+        if not self.enabled:
+            return
+        await self.backend.set(str(user.id), _to_snapshot(user), self.ttl)
+
+    async def invalidate(self, user_id: Any) -> None:
+        """ユーザーのキャッシュを破棄"""
+        if not self.enabled:
+            return
+        await self.backend.delete(str(user_id))
+
+    def invalidate_nowait(self, user_id: Any) -> None:
+        """
+        同期コンテキストからキャッシュを破棄
+
+        プロセス内キャッシュはその場で破棄し、外部バックエンドは破棄が終わるまで待つ
+        （app.core.cache.run_in_session_hook）。破棄に失敗したらログに残し、エントリは TTL で消える。
+        """
+        if not self.enabled:
+            return
+        if isinstance(self.backend, MemoryCacheBackend):
+            self.backend.discard(str(user_id))
+            return
+        try:
+            run_in_session_hook(self.invalidate(user_id))
+        except Exception:
+            logger.exception("Failed to invalidate cached user %s", user_id)
+
+    async def clear(self) -> None:
+        """全エントリと統計を破棄"""
+        self.hits = 0
+        self.misses = 0
+        if self.backend is not None:
+            await self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """ヒット・ミスの件数"""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _to_snapshot(user: User) -> Dict[str, Any]:
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "full_name": user.full_name,
+        "is_active": user.is_active,
+        "role": user.role.value if user.role else None,
+        "token_version": user.token_version or 0,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+def _from_snapshot(data: Dict[str, Any]) -> User:
+    return User(
+        id=UUID(data["id"]),
+        email=data["email"],
+        full_name=data["full_name"],
+        is_active=data["is_active"],
+        role=UserRole(data["role"]) if data["role"] else None,
+        token_version=data.get("token_version", 0),
+        created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+        updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+    )
+
+
+user_cache = UserCache(
+    backend=create_cache_backend(
+        settings.USER_CACHE_BACKEND,
+        settings.USER_CACHE_MAX_SIZE,
+        prefix="asotobase:user:",
+    ),
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_user_changes(session, flush_context):
+    """フラッシュされた User / UserProfile の変更を記録"""
+    user_ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User):
+            user_ids.add(obj.id)
+        elif isinstance(obj, UserProfile):
+            user_ids.add(obj.user_id)
+
+    if user_ids:
+        session.info.setdefault(_PENDING_KEY, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session):
+    """コミットされた変更に対応するキャッシュを破棄"""
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        user_cache.invalidate_nowait(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_users(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -1,6 +1,22 @@
-from fastapi import FastAPI
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, PlainTextResponse
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.database import engine, get_db, pool_status
+from app.core.metrics import metrics
+from app.core.password_hasher import password_hasher
+from app.core.security import get_jwt_keys, verified_tokens
+from app.core.user_cache import user_cache
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.services.dashboard import community_area_cache
+from app.services.point_events import point_event_worker
 from app.api.v1.router import api_router
 
 # API詳細説明
@@ -63,17 +79,40 @@ tags_metadata = [
         "name": "ポイント",
         "description": "貢献度ポイントの確認。活動に応じてポイントが付与されます。",
     },
+    {
+        "name": "ランキング",
+        "description": "貢献度ポイントのランキング（全体・期間別・プロジェクト内）と自分の順位。",
+    },
     {
         "name": "ダッシュボード",
         "description": "個人とコミュニティの全体像を表示。",
     },
+    {
+        "name": "タグ",
+        "description": "ログ・イベント・プロジェクトでよく使われているタグの集計。",
+    },
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """ポイント付与のワーカーをアプリと一緒に起動・停止し、終了時にパスワードハッシュのスレッドを止める"""
+    if settings.POINT_EVENTS_MODE == "worker":
+        point_event_worker.start()
+    yield
+    await point_event_worker.stop()
+    # 実行中のハッシュ計算を待つ間もイベントループを塞がない
+    await asyncio.to_thread(password_hasher.shutdown)
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=description,
     version="0.1.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
+    # レスポンスの JSON 化は orjson（一覧は app.core.responses.model_response で直接 JSON にする）
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -86,6 +125,18 @@ app = FastAPI(
     },
 )
 
+# JWT の鍵は起動時に読み込む（設定の誤りをここで検出する）
+get_jwt_keys()
+
+# レスポンスの圧縮（gzip / brotli）
+app.add_middleware(
+    CompressionMiddleware,
+    encodings=settings.COMPRESSION_ENCODINGS,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
 # CORS設定
 app.add_middleware(
     CORSMiddleware,
@@ -95,6 +146,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# メトリクス（Server-Timing ヘッダーは開発環境のみ）
+app.add_middleware(
+    MetricsMiddleware,
+    registry=metrics,
+    server_timing=lambda: settings.ENVIRONMENT == "development",
+)
+
 # ルーター登録
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
@@ -111,3 +169,48 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/db")
+async def health_check_db(db: AsyncSession = Depends(get_db)):
+    """DB接続の疎通確認と接続プールの使用状況"""
+    started = time.perf_counter()
+    try:
+        await db.execute(text("SELECT 1"))
+    except Exception as e:
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unhealthy", "error": type(e).__name__, "pool": pool_status(db.bind)},
+        )
+
+    return {
+        "status": "healthy",
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+        "pool": pool_status(db.bind),
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics_endpoint():
+    """Prometheus 形式のメトリクス"""
+    gauges = {
+        f"db_pool_{name}": value
+        for name, value in pool_status(engine).items()
+        if isinstance(value, int)
+    }
+    hasher_stats = password_hasher.stats()
+    gauges["password_hasher_pending"] = hasher_stats["pending"]
+    counters = {"password_hasher_rejected_total": hasher_stats["rejected"]}
+    for name, value in verified_tokens.stats().items():
+        counters[f"jwt_verify_cache_{name}_total"] = value
+    for name, value in point_event_worker.stats().items():
+        counters[f"point_events_{name}_total"] = value
+    for name, value in user_cache.stats().items():
+        counters[f"user_cache_{name}_total"] = value
+    for name, value in community_area_cache.stats().items():
+        counters[f"community_area_cache_{name}_total"] = value
+
+    return PlainTextResponse(
+        metrics.render(gauges, counters),
+        media_type="text/plain; version=0.0.4",
+    )
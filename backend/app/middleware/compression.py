@@ -0,0 +1,221 @@
+"""レスポンスを圧縮するミドルウェア（gzip / brotli）
+
+Accept-Encoding でクライアントが受け付ける方式のうち、q 値が最も高いものを使う
+（同じ q 値なら encodings の順＝サーバーの優先順）。
+
+- minimum_size 未満の本文やテキストでない本文（画像など）、すでに圧縮済みの本文はそのまま返す
+- 本文が複数回に分けて送られるレスポンス（StreamingResponse）は、届いた分ずつ圧縮して送る
+- 1回で送られる大きな本文も stream_chunk_size ごとに圧縮して送り、
+  大きな一覧の圧縮でイベントループを長く止めないようにする
+
+brotli（br）を使う場合は brotli パッケージが必要。
+"""
+import asyncio
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# text/* と、サブタイプにこれらを含むもの（application/json, application/x-ndjson, image/svg+xml など）
+COMPRESSIBLE_SUBTYPES = ("json", "javascript", "xml")
+
+
+class Compressor:
+    """1つのレスポンス分の圧縮器"""
+
+    def compress(self, data: bytes) -> bytes:
+        """data を圧縮し、ここまでの分をクライアントが展開できるように出力する"""
+        raise NotImplementedError
+
+    def finish(self) -> bytes:
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor(Compressor):
+    def __init__(self, quality: int):
+        try:
+            import brotli
+        except ImportError as e:
+            raise RuntimeError("Brotli compression requires the 'brotli' package") from e
+
+        self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def compressor_factories(gzip_level: int, brotli_quality: int) -> Dict[str, Callable[[], Compressor]]:
+    """Content-Encoding ごとの圧縮器"""
+    return {
+        "br": lambda: BrotliCompressor(brotli_quality),
+        "gzip": lambda: GzipCompressor(gzip_level),
+    }
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> Optional[str]:
+    """Accept-Encoding（q 値付き）で受け付けられる方式のうち q 値が最も高いもの（同じなら encodings の順）"""
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    chosen: Optional[str] = None
+    best = 0.0
+    for encoding in encodings:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best:
+            chosen, best = encoding, quality
+    return chosen
+
+
+class CompressionMiddleware:
+    """pure ASGI ミドルウェア（レスポンスのストリーミングを妨げない）"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Sequence[str] = ("br", "gzip"),
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        stream_chunk_size: int = 64 * 1024,
+    ):
+        self.app = app
+        self.encodings = list(encodings)
+        self.minimum_size = minimum_size
+        self.stream_chunk_size = stream_chunk_size
+        factories = compressor_factories(gzip_level, brotli_quality)
+        unknown = [encoding for encoding in self.encodings if encoding not in factories]
+        if unknown:
+            raise ValueError(f"Unknown compression encodings: {', '.join(unknown)}")
+        self._factories = {encoding: factories[encoding] for encoding in self.encodings}
+        # 使えない方式（brotli が入っていないなど）は起動時に検出する
+        for factory in self._factories.values():
+            factory()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """1つのレスポンスの送信を包み、最初の本文を見て圧縮するかを決める"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._compressor: Optional[Compressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=list(start["headers"]))
+            if not self._should_compress(headers, body, more_body):
+                self._passthrough = True
+                await self._send({**start, "headers": headers.raw})
+                await self._send(message)
+                return
+
+            self._compressor = self.middleware._factories[self.encoding]()
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "content-length" in headers:
+                del headers["content-length"]
+
+            chunks = _split(body, self.middleware.stream_chunk_size)
+            if not more_body and len(chunks) == 1:
+                # 1回で送る本文は Content-Length を付けて送る
+                compressed = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self._send({**start, "headers": headers.raw})
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            await self._send({**start, "headers": headers.raw})
+            await self._send_chunks(chunks, more_body)
+            return
+
+        if self._passthrough or self._compressor is None:
+            await self._send(message)
+            return
+        await self._send_chunks(_split(body, self.middleware.stream_chunk_size), more_body)
+
+    def _should_compress(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if "content-encoding" in headers:
+            return False
+        if not _is_compressible(headers.get("content-type", "")):
+            return False
+        if not more_body and len(body) < self.middleware.minimum_size:
+            # 小さな本文は圧縮しても縮まないうえ CPU を使うだけ（Vary は付けて共有キャッシュの取り違えを防ぐ）
+            headers.add_vary_header("Accept-Encoding")
+            return False
+        return True
+
+    async def _send_chunks(self, chunks: List[bytes], more_body: bool) -> None:
+        """チャンクごとに圧縮して送る（チャンクの間でほかのリクエストに実行を譲る）"""
+        for index, chunk in enumerate(chunks):
+            if index:
+                await asyncio.sleep(0)
+            compressed = self._compressor.compress(chunk)
+            if compressed:
+                await self._send({"type": "http.response.body", "body": compressed, "more_body": True})
+        if not more_body:
+            await self._send({"type": "http.response.body", "body": self._compressor.finish()})
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    main_type, _, subtype = media_type.partition("/")
+    return main_type == "text" or any(name in subtype for name in COMPRESSIBLE_SUBTYPES)
+
+
+def _split(body: bytes, size: int) -> List[bytes]:
+    if len(body) <= size:
+        return [body]
+    return [body[offset:offset + size] for offset in range(0, len(body), size)]
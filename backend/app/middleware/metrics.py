@@ -0,0 +1,78 @@
+"""リクエストのメトリクスを記録するミドルウェア
+
+ルート（パステンプレート）ごとにレイテンシ、SQLの実行回数、SQLの合計時間を記録する。
+server_timing=True の場合は Server-Timing ヘッダーでブラウザの開発者ツールにも表示する。
+"""
+import time
+from typing import Callable, Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import MetricsRegistry, RequestStats, current_request_stats
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """pure ASGI ミドルウェア（レスポンスのストリーミングを妨げない）"""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry, server_timing: Callable[[], bool] = lambda: False):
+        self.app = app
+        self.registry = registry
+        self.server_timing = server_timing
+        self._route_paths: Dict[Callable, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+        server_timing = self.server_timing()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(stats, started).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_stats.reset(token)
+            self.registry.observe_request(
+                scope["method"],
+                self._route_path(scope),
+                status_code,
+                time.perf_counter() - started,
+                stats,
+            )
+
+    def _route_path(self, scope: Scope) -> str:
+        """マッチしたルートのパステンプレート（/logs/{log_id} など）"""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            router = scope.get("router")
+            for route in getattr(router, "routes", []):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            self._route_paths[endpoint] = path = path or UNMATCHED_ROUTE
+        return path
+
+
+def _server_timing(stats: RequestStats, started: float) -> str:
+    total_ms = (time.perf_counter() - started) * 1000
+    db_ms = stats.sql_seconds * 1000
+    return f'app;dur={total_ms:.1f}, db;dur={db_ms:.1f};desc="{stats.sql_count} queries"'
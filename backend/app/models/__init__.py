@@ -11,6 +11,12 @@ from app.models.project import Project, ProjectCategory, ProjectStatus, ProjectV
 from app.models.project_member import ProjectMember, MemberRole, MemberStatus
 from app.models.project_task import ProjectTask, TaskStatus
 from app.models.point import Point
+from app.models.user_point_balance import UserPointBalance
+from app.models.refresh_token import RefreshToken
+from app.models.point_event import PointEvent
+from app.models.leaderboard import LeaderboardEntry, LeaderboardScoreCount
+from app.models.point_rollup import PointRollup
+from app.models.tag_count import TagCounter
 
 __all__ = [
     "Base",
@@ -39,4 +45,11 @@ __all__ = [
     "ProjectTask",
     "TaskStatus",
     "Point",
+    "UserPointBalance",
+    "RefreshToken",
+    "PointEvent",
+    "LeaderboardEntry",
+    "LeaderboardScoreCount",
+    "PointRollup",
+    "TagCounter",
 ]
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -18,6 +18,12 @@ class EventStatus(str, enum.Enum):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # キーセットページネーション用（start_date, id）
+        Index("ix_events_start_date_id", "start_date", "id"),
+        # タグフィルタ（@> / ?|）
+        Index("ix_events_tags_gin", "tags", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -36,7 +42,7 @@ class Event(Base):
     max_attendees = Column(Integer)
 
     # メタ情報
-    tags = Column(JSON, default=list)  # ["読書会", "オンライン"]
+    tags = Column(JSONB, default=list)  # ["読書会", "オンライン"]
     status = Column(SQLEnum(EventStatus), default=EventStatus.UPCOMING)
 
     # タイムスタンプ
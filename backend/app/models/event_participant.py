@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -17,6 +17,8 @@ class EventParticipant(Base):
     __tablename__ = "event_participants"
     __table_args__ = (
         UniqueConstraint('event_id', 'user_id', name='unique_event_user'),
+        # 参加者一覧（参加中のみ、新しい順）
+        Index("ix_event_participants_event_id_status_joined_at", "event_id", "status", "joined_at"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
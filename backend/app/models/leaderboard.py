@@ -0,0 +1,39 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class LeaderboardEntry(Base):
+    """
+    期間ごとのユーザーの獲得ポイント（ランキング）
+
+    ポイントの反映時に増分で更新する（app.services.leaderboards）。
+    period は "all"（累計）、"2026-10"（月）、"2026-W42"（ISO 週）。
+    """
+    __tablename__ = "leaderboard_entries"
+    __table_args__ = (
+        # 上位 N 件（score の降順に逆方向スキャン）
+        Index("ix_leaderboard_entries_period_score", "period", "score", "user_id"),
+    )
+
+    period = Column(String(16), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Integer, nullable=False, default=0)
+
+    # タイムスタンプ
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class LeaderboardScoreCount(Base):
+    """
+    期間・スコアごとのユーザー数
+
+    順位は「自分より高いスコアのユーザー数 + 1」なので、ユーザー数ではなく
+    スコアの種類の数に比例する集計で求められる。
+    """
+    __tablename__ = "leaderboard_score_counts"
+
+    period = Column(String(16), primary_key=True)
+    score = Column(Integer, primary_key=True)
+    users = Column(Integer, nullable=False, default=0)
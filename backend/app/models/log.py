@@ -1,8 +1,9 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, Computed, DDL, String, Text, DateTime, ForeignKey, Enum as SQLEnum, Index, event, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
+from app.core.search import SEARCH_BIGRAMS_FUNCTION, search_vector_expression
 import uuid
 import enum
 
@@ -15,6 +16,21 @@ class LogVisibility(str, enum.Enum):
 
 class Log(Base):
     __tablename__ = "logs"
+    __table_args__ = (
+        # キーセットページネーション用（created_at, id）
+        Index("ix_logs_created_at_id", "created_at", "id"),
+        # 自分のログ（ダッシュボード、一覧の自分のログ側）
+        Index("ix_logs_user_id_created_at", "user_id", "created_at"),
+        # 公開ログ（コミュニティエリア、一覧の公開ログ側）
+        Index(
+            "ix_logs_public_created_at_id", "created_at", "id",
+            postgresql_where=text("visibility = 'PUBLIC'"),
+        ),
+        # タグフィルタ（@> / ?|）
+        Index("ix_logs_tags_gin", "tags", postgresql_using="gin"),
+        # 全文検索（app.core.search）
+        Index("ix_logs_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -22,9 +38,12 @@ class Log(Base):
     # 基本情報
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)  # Markdown
-    tags = Column(JSON, default=list)  # ["読書会", "気づき"]
+    tags = Column(JSONB, default=list)  # ["読書会", "気づき"]
     visibility = Column(SQLEnum(LogVisibility), default=LogVisibility.PRIVATE)
 
+    # 全文検索用のバイグラム（タイトル・本文の更新に合わせて DB が作り直す。一覧では読まない）
+    search_vector = deferred(Column(TSVECTOR, Computed(search_vector_expression("title", "content"), persisted=True)))
+
     # 関連
     related_event_id = Column(UUID(as_uuid=True), ForeignKey("events.id", ondelete="SET NULL"))
     related_goal_id = Column(UUID(as_uuid=True), ForeignKey("goals.id", ondelete="SET NULL"))
@@ -37,3 +56,7 @@ class Log(Base):
     user = relationship("User", back_populates="logs")
     related_event = relationship("Event", back_populates="logs")
     related_goal = relationship("Goal", back_populates="logs")
+
+
+# 生成列が使う関数をテーブルより先に作る（create_all 用。マイグレーションでは個別に作成）
+event.listen(Log.__table__, "before_create", DDL(SEARCH_BIGRAMS_FUNCTION))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -8,6 +8,12 @@ import uuid
 
 class Point(Base):
     __tablename__ = "points"
+    __table_args__ = (
+        # 履歴（新しい順）と残高の集計
+        Index("ix_points_user_id_created_at", "user_id", "created_at"),
+        # 同じアクションへの重複付与を防ぐ（reference_id が NULL の行は対象外）
+        Index("uq_points_user_id_action_type_reference_id", "user_id", "action_type", "reference_id", unique=True),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
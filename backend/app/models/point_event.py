@@ -0,0 +1,42 @@
+from sqlalchemy import Column, String, Text, BigInteger, Integer, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class PointEvent(Base):
+    """
+    ポイント付与のアウトボックス
+
+    書き込みのエンドポイントは付与したいポイントをここに記録するだけで、
+    points・残高などへの反映はワーカー（app.services.point_events）がまとめて行う。
+
+    反映に失敗し続けたイベントは failed_at を記録してワーカーの対象から外す。
+    原因を直してから再処理するには failed_at と attempts を戻す。
+    """
+    __tablename__ = "point_events"
+    __table_args__ = (
+        # ワーカーが未処理のイベントを古い順に取り出す
+        Index(
+            "ix_point_events_unprocessed", "id",
+            postgresql_where=text("processed_at IS NULL AND failed_at IS NULL"),
+        ),
+    )
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    # アクション（付与量は app.services.point_rules のルールで決まる）
+    action_type = Column(String(50), nullable=False)
+    reference_id = Column(String(255))
+    description = Column(Text)
+    variant = Column(String(50))  # 区分（プロジェクトのカテゴリなど）
+
+    # タイムスタンプ
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    processed_at = Column(DateTime(timezone=True))
+
+    # 反映の失敗（POINT_EVENTS_MAX_ATTEMPTS 回失敗したら failed_at を記録して以後は処理しない）
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text)
+    failed_at = Column(DateTime(timezone=True))
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, Integer, Date, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+
+class PointRollup(Base):
+    """
+    ユーザー・アクションごとの期間別の獲得ポイント
+
+    ポイントの反映時に増分で更新する（app.services.point_rollups）。
+    bucket_start は期間の初日（POINTS_TIMEZONE の日付。週は月曜日）。
+    """
+    __tablename__ = "point_rollups"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    granularity = Column(String(8), primary_key=True)  # "day" / "week"
+    bucket_start = Column(Date, primary_key=True)
+    action_type = Column(String(50), primary_key=True)
+
+    # 集計
+    total = Column(Integer, nullable=False, default=0)  # 獲得ポイントの合計
+    count = Column(Integer, nullable=False, default=0)  # 付与の回数
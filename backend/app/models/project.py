@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -30,6 +30,13 @@ class ProjectVisibility(str, enum.Enum):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        # キーセットページネーション用（created_at, id）
+        Index("ix_projects_created_at_id", "created_at", "id"),
+        # タグ・必要スキルでの絞り込み（@> / ?|）
+        Index("ix_projects_tags_gin", "tags", postgresql_using="gin"),
+        Index("ix_projects_required_skills_gin", "required_skills", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -52,10 +59,10 @@ class Project(Base):
     # メンバー募集
     is_recruiting = Column(Boolean, default=False)
     max_members = Column(Integer)
-    required_skills = Column(JSON, default=list)  # ["農業知識", "写真撮影"]
+    required_skills = Column(JSONB, default=list)  # ["農業知識", "写真撮影"]
 
     # メタ情報
-    tags = Column(JSON, default=list)  # ["農業", "地域", "暮らし"]
+    tags = Column(JSONB, default=list)  # ["農業", "地域", "暮らし"]
     visibility = Column(SQLEnum(ProjectVisibility), default=ProjectVisibility.PUBLIC)
 
     # タイムスタンプ
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum as SQLEnum, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -24,6 +24,8 @@ class ProjectMember(Base):
     __tablename__ = "project_members"
     __table_args__ = (
         UniqueConstraint('project_id', 'user_id', name='unique_project_user'),
+        # プロジェクト内のランキング（貢献度順）
+        Index('ix_project_members_project_id_contribution_points', 'project_id', 'contribution_points'),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+import uuid
+
+
+class RefreshToken(Base):
+    """リフレッシュトークン（トークン本体は保存せず SHA-256 のハッシュのみ保存）"""
+    __tablename__ = "refresh_tokens"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    # ログインごとの系列。ローテーションで発行したトークンは同じ系列になる
+    family_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False)
+    # 発行時の users.token_version（ユーザーの値と異なれば無効）
+    token_version = Column(Integer, nullable=False)
+
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    # ローテーション済み・失効済みなら設定される
+    revoked_at = Column(DateTime(timezone=True))
+
+    # タイムスタンプ
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # リレーション
+    user = relationship("User", back_populates="refresh_tokens")
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, DDL, String, Text, Integer, Index, event
+from app.core.database import Base
+from app.core.tags import TAG_COUNTS_FUNCTION, tag_counts_triggers
+from app.models.event import Event
+from app.models.log import Log
+from app.models.project import Project
+
+
+class TagCounter(Base):
+    """
+    集計対象（logs / events / projects）ごとのタグの件数
+
+    logs / events / projects の変更に合わせて DB のトリガーが増分で更新する（app.core.tags）。
+    件数が 0 になったタグの行は削除する。
+    """
+    __tablename__ = "tag_counts"
+
+    source = Column(String(16), primary_key=True)
+    tag = Column(Text, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# よく使われているタグ（count の降順、同数はタグ順）の上位 N 件
+Index("ix_tag_counts_source_count", TagCounter.source, TagCounter.count.desc(), TagCounter.tag)
+
+# 件数を更新するトリガー（create_all 用。マイグレーションでは個別に作成）
+for _table in (Log.__table__, Event.__table__, Project.__table__):
+    event.listen(_table, "after_create", DDL(TAG_COUNTS_FUNCTION))
+    for _statement in tag_counts_triggers(_table.name):
+        event.listen(_table, "after_create", DDL(_statement))
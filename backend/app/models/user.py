@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -23,6 +23,9 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     role = Column(SQLEnum(UserRole), default=UserRole.USER)
 
+    # 上げると発行済みのアクセストークン・リフレッシュトークンがすべて無効になる
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # タイムスタンプ
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -37,3 +40,5 @@ class User(Base):
     project_memberships = relationship("ProjectMember", back_populates="user", cascade="all, delete-orphan")
     assigned_tasks = relationship("ProjectTask", back_populates="assignee")
     points = relationship("Point", back_populates="user", cascade="all, delete-orphan")
+    point_balance = relationship("UserPointBalance", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.core.database import Base
+
+
+class UserPointBalance(Base):
+    """ユーザーごとのポイント残高（points の累計を書き込み時に更新）"""
+    __tablename__ = "user_point_balances"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    # 累計ポイント
+    balance = Column(Integer, nullable=False, default=0)
+
+    # タイムスタンプ
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # リレーション
+    user = relationship("User", back_populates="point_balance")
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -8,6 +8,11 @@ import uuid
 
 class UserProfile(Base):
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        # スキル・興味での絞り込み（@> / ?|）
+        Index("ix_user_profiles_skills_gin", "skills", postgresql_using="gin"),
+        Index("ix_user_profiles_interests_gin", "interests", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
@@ -15,8 +20,8 @@ class UserProfile(Base):
     # プロフィール情報
     bio = Column(Text)
     avatar_url = Column(String(500))
-    skills = Column(JSON, default=list)  # ["Python", "React", "デザイン"]
-    interests = Column(JSON, default=list)  # ["農業", "AI", "地域活性化"]
+    skills = Column(JSONB, default=list)  # ["Python", "React", "デザイン"]
+    interests = Column(JSONB, default=list)  # ["農業", "AI", "地域活性化"]
     available_time = Column(Integer)  # 週あたり活動可能時間（分）
 
     # タイムスタンプ
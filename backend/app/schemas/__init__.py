@@ -1,21 +1,26 @@
 """Pydantic Schemas"""
-from app.schemas.user import UserBase, UserCreate, UserLogin, UserResponse, Token, TokenData
+from app.schemas.user import UserBase, UserCreate, UserLogin, UserResponse, Token, TokenData, RefreshTokenRequest, LogoutRequest
 from app.schemas.user_profile import UserProfileBase, UserProfileUpdate, UserProfileResponse
 from app.schemas.goal import GoalBase, GoalCreate, GoalUpdate, GoalResponse
 from app.schemas.step import StepBase, StepCreate, StepUpdate, StepResponse
-from app.schemas.log import LogBase, LogCreate, LogUpdate, LogResponse
-from app.schemas.event import EventBase, EventCreate, EventUpdate, EventResponse
+from app.schemas.log import LogBase, LogCreate, LogUpdate, LogResponse, LogSummary, LogPage, LogSearchHit, LogSearchPage
+from app.schemas.event import EventBase, EventCreate, EventUpdate, EventResponse, EventSummary, EventPage
 from app.schemas.project import (
     ProjectBase,
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
+    ProjectSummary,
+    ProjectPage,
     ProjectTaskBase,
     ProjectTaskCreate,
     ProjectTaskUpdate,
     ProjectTaskResponse,
 )
-from app.schemas.point import PointBase, PointCreate, PointResponse, PointSummary
+from app.schemas.point import PointBase, PointCreate, PointResponse, PointSummary, PointSeriesBucket, PointSeries
+from app.schemas.leaderboard import LeaderboardEntry, LeaderboardResponse
+from app.schemas.pagination import CursorPage
+from app.schemas.tag import TagCount
 from app.schemas.dashboard import DashboardResponse, PersonalAreaResponse, CommunityAreaResponse
 
 __all__ = [
@@ -26,6 +31,8 @@ __all__ = [
     "UserResponse",
     "Token",
     "TokenData",
+    "RefreshTokenRequest",
+    "LogoutRequest",
     # UserProfile
     "UserProfileBase",
     "UserProfileUpdate",
@@ -45,16 +52,24 @@ __all__ = [
     "LogCreate",
     "LogUpdate",
     "LogResponse",
+    "LogSummary",
+    "LogPage",
+    "LogSearchHit",
+    "LogSearchPage",
     # Event
     "EventBase",
     "EventCreate",
     "EventUpdate",
     "EventResponse",
+    "EventSummary",
+    "EventPage",
     # Project
     "ProjectBase",
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectResponse",
+    "ProjectSummary",
+    "ProjectPage",
     "ProjectTaskBase",
     "ProjectTaskCreate",
     "ProjectTaskUpdate",
@@ -64,6 +79,15 @@ __all__ = [
     "PointCreate",
     "PointResponse",
     "PointSummary",
+    "PointSeriesBucket",
+    "PointSeries",
+    # Leaderboard
+    "LeaderboardEntry",
+    "LeaderboardResponse",
+    # Pagination
+    "CursorPage",
+    # Tag
+    "TagCount",
     # Dashboard
     "DashboardResponse",
     "PersonalAreaResponse",
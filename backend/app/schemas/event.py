@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid import UUID
 from app.models.enums import LocationType
 from app.models.event import EventStatus
+from app.schemas.pagination import CursorPage
 
 
 class EventBase(BaseModel):
@@ -46,3 +47,22 @@ class EventResponse(EventBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class EventSummary(BaseModel):
+    """イベントの要約（一覧の fields=summary。説明を含まない）"""
+    id: UUID
+    owner_id: UUID
+    title: str
+    start_date: datetime
+    end_date: Optional[datetime] = None
+    location_type: LocationType
+    status: EventStatus
+    tags: List[str] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EventPage(CursorPage[EventResponse]):
+    """イベント一覧のカーソルページ"""
+    pass
@@ -0,0 +1,21 @@
+"""ランキング関連のスキーマ"""
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from uuid import UUID
+
+
+class LeaderboardEntry(BaseModel):
+    """ランキングの1行"""
+    rank: int
+    user_id: UUID
+    full_name: Optional[str] = None
+    score: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LeaderboardResponse(BaseModel):
+    """ランキングスキーマ"""
+    period: Optional[str] = None  # 期間のキー（"all" / "2026-10" / "2026-W42"）
+    entries: List[LeaderboardEntry]
+    me: Optional[LeaderboardEntry] = None  # 自分の順位（ランキングにいなければ null）
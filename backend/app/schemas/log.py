@@ -1,9 +1,10 @@
 """内省ログ（Log）関連のスキーマ"""
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from uuid import UUID
 from app.models.log import LogVisibility
+from app.schemas.pagination import CursorPage
 
 
 class LogBase(BaseModel):
@@ -39,3 +40,33 @@ class LogResponse(LogBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class LogSummary(BaseModel):
+    """ログの要約（一覧の fields=summary。本文を含まない）"""
+    id: UUID
+    user_id: UUID
+    title: str
+    tags: List[str] = Field(default_factory=list)
+    visibility: LogVisibility
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LogPage(CursorPage[LogResponse]):
+    """ログ一覧のカーソルページ"""
+    pass
+
+
+class LogSearchHit(LogResponse):
+    """ログ検索の結果"""
+    rank: float
+    snippet: str  # 本文の検索語の前後
+    highlights: List[Tuple[int, int]]  # snippet 内の検索語の位置（開始, 終了）
+
+
+class LogSearchPage(BaseModel):
+    """ログ検索の結果ページ（関連度順）"""
+    items: List[LogSearchHit]
+    next_offset: Optional[int] = None
@@ -0,0 +1,11 @@
+"""ページネーション関連のスキーマ"""
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """カーソルページのレスポンススキーマ"""
+    items: List[T]
+    next_cursor: Optional[str] = None
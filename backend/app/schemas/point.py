@@ -1,7 +1,7 @@
 """ポイント（Point）関連のスキーマ"""
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import date, datetime
 from uuid import UUID
 
 
@@ -31,3 +31,19 @@ class PointSummary(BaseModel):
     """ポイント集計スキーマ"""
     user_id: UUID
     total_points: int
+
+
+class PointSeriesBucket(BaseModel):
+    """ポイント推移の1期間"""
+    bucket_start: date
+    total: int
+    count: int
+    by_action: Dict[str, int]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PointSeries(BaseModel):
+    """ポイント推移スキーマ"""
+    granularity: str
+    buckets: List[PointSeriesBucket]
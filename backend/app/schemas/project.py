@@ -5,6 +5,7 @@ from datetime import datetime
 from uuid import UUID
 from app.models.enums import LocationType
 from app.models.project import ProjectCategory, ProjectStatus, ProjectVisibility
+from app.schemas.pagination import CursorPage
 
 
 class ProjectBase(BaseModel):
@@ -58,6 +59,27 @@ class ProjectResponse(ProjectBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProjectSummary(BaseModel):
+    """プロジェクトの要約（一覧の fields=summary。説明を含まない）"""
+    id: UUID
+    owner_id: UUID
+    title: str
+    category: ProjectCategory
+    status: ProjectStatus
+    start_date: datetime
+    location_type: LocationType
+    is_recruiting: bool = False
+    tags: List[str] = Field(default_factory=list)
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectPage(CursorPage[ProjectResponse]):
+    """プロジェクト一覧のカーソルページ"""
+    pass
+
+
 class ProjectTaskBase(BaseModel):
     """プロジェクトタスクベーススキーマ"""
     title: str = Field(..., min_length=1, max_length=255)
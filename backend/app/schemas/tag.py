@@ -0,0 +1,8 @@
+"""タグ関連のスキーマ"""
+from pydantic import BaseModel
+
+
+class TagCount(BaseModel):
+    """タグと件数"""
+    tag: str
+    count: int
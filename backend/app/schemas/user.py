@@ -34,6 +34,18 @@ class Token(BaseModel):
     """トークンレスポンス"""
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None  # アクセストークンの有効期間（秒）
+
+
+class RefreshTokenRequest(BaseModel):
+    """トークン更新リクエスト"""
+    refresh_token: str
+
+
+class LogoutRequest(RefreshTokenRequest):
+    """ログアウトリクエスト"""
+    everywhere: bool = False  # True なら全端末のトークンを無効にする
 
 
 class TokenData(BaseModel):
@@ -0,0 +1,363 @@
+"""ダッシュボードの組み立て
+
+ダッシュボードは互いに独立した5つのクエリ（パート）で構成される。
+DASHBOARD_QUERY_STRATEGY で実行方法を切り替えられる。
+
+- sequential: 同じセッションで順番に実行
+- concurrent: クエリごとにプールから別の接続を取り、並行に実行
+- single: JSON集約を使った1つのSQLにまとめ、1往復で取得
+
+コミュニティエリアは全ユーザー共通のため、community_area_cache で共有キャッシュする。
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Type
+from uuid import UUID
+
+from sqlalchemy import Select, select, func, literal_column, type_coerce, event, inspect, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models.goal import Goal, GoalStatus
+from app.models.log import Log, LogVisibility
+from app.models.event import Event
+from app.services.points import balance_query
+from app.schemas.dashboard import DashboardResponse, PersonalAreaResponse, CommunityAreaResponse
+
+_CHANGED_KEY = "community_area_changed"
+
+PERSONAL_PARTS = ("active_goals", "recent_logs", "total_points")
+COMMUNITY_PARTS = ("upcoming_events", "recent_public_logs")
+
+
+def active_goals_query(user_id: UUID) -> Select:
+    """進行中の目標（最大3件）"""
+    return (
+        select(Goal)
+        .where(
+            Goal.user_id == user_id,
+            Goal.status == GoalStatus.ACTIVE
+        )
+        .order_by(Goal.created_at.desc())
+        .limit(3)
+    )
+
+
+def recent_logs_query(user_id: UUID) -> Select:
+    """最近のログ（最大3件）"""
+    return (
+        select(Log)
+        .where(Log.user_id == user_id)
+        .order_by(Log.created_at.desc())
+        .limit(3)
+    )
+
+
+def upcoming_events_query(now: datetime) -> Select:
+    """今後のイベント（最大5件、開始日時が現在より未来のもの）"""
+    return (
+        select(Event)
+        .where(Event.start_date >= now)
+        .order_by(Event.start_date.asc())
+        .limit(5)
+    )
+
+
+def recent_public_logs_query() -> Select:
+    """最近の公開ログ（最大5件）"""
+    return (
+        select(Log)
+        .where(Log.visibility == LogVisibility.PUBLIC)
+        .order_by(Log.created_at.desc())
+        .limit(5)
+    )
+
+
+@dataclass
+class _Part:
+    """ダッシュボードの1パート（model が None の場合はスカラー値）"""
+    query: Select
+    model: Optional[Type[Base]] = None
+    json_order_by: Optional[Callable[[Any], Any]] = None
+
+
+def _parts(user_id: Optional[UUID], names: Sequence[str]) -> Dict[str, _Part]:
+    now = datetime.now()
+    builders = {
+        "active_goals": lambda: _Part(active_goals_query(user_id), Goal, lambda q: q.c.created_at.desc()),
+        "recent_logs": lambda: _Part(recent_logs_query(user_id), Log, lambda q: q.c.created_at.desc()),
+        "total_points": lambda: _Part(balance_query(user_id)),
+        "upcoming_events": lambda: _Part(upcoming_events_query(now), Event, lambda q: q.c.start_date.asc()),
+        "recent_public_logs": lambda: _Part(recent_public_logs_query(), Log, lambda q: q.c.created_at.desc()),
+    }
+    return {name: builders[name]() for name in names}
+
+
+async def _fetch_part(session: AsyncSession, part: _Part) -> Any:
+    result = await session.execute(part.query)
+    if part.model is None:
+        return result.scalar()
+    return result.scalars().all()
+
+
+async def _fetch_sequential(db: AsyncSession, parts: Dict[str, _Part]) -> Dict[str, Any]:
+    return {name: await _fetch_part(db, part) for name, part in parts.items()}
+
+
+async def _fetch_concurrent(db: AsyncSession, parts: Dict[str, _Part]) -> Dict[str, Any]:
+    # リクエストのセッションと同じエンジン（接続プール）から、クエリごとにセッションを作る
+    session_maker = async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+
+    async def fetch(part: _Part) -> Any:
+        async with session_maker() as session:
+            return await _fetch_part(session, part)
+
+    values = await asyncio.gather(*(fetch(part) for part in parts.values()))
+    return dict(zip(parts.keys(), values))
+
+
+def _json_rows(part: _Part, name: str):
+    """クエリ結果を1つのJSON配列にまとめるスカラーサブクエリ"""
+    subquery = part.query.subquery(name)
+    row = literal_column(name)
+    aggregated = func.coalesce(
+        func.json_agg(aggregate_order_by(row, part.json_order_by(subquery))),
+        literal_column("'[]'::json"),
+    )
+    return type_coerce(select(aggregated).select_from(subquery).scalar_subquery(), JSON)
+
+
+def _decode_rows(model: Type[Base], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """JSONの行をモデルの値に戻す（Enumは名前で保存されているため変換する）"""
+    enum_columns = [
+        column for column in model.__table__.columns
+        if isinstance(column.type, SQLEnum) and column.type.enum_class is not None
+    ]
+    for row in rows:
+        for column in enum_columns:
+            value = row.get(column.name)
+            if value is not None:
+                row[column.name] = column.type.enum_class[value]
+    return rows
+
+
+async def _fetch_single(db: AsyncSession, parts: Dict[str, _Part]) -> Dict[str, Any]:
+    columns = []
+    for name, part in parts.items():
+        if part.model is None:
+            columns.append(part.query.scalar_subquery().label(name))
+        else:
+            columns.append(_json_rows(part, name).label(name))
+    row = (await db.execute(select(*columns))).one()
+
+    return {
+        name: row[index] if part.model is None else _decode_rows(part.model, row[index])
+        for index, (name, part) in enumerate(parts.items())
+    }
+
+
+_FETCHERS = {
+    "sequential": _fetch_sequential,
+    "concurrent": _fetch_concurrent,
+    "single": _fetch_single,
+}
+STRATEGIES = tuple(_FETCHERS)
+
+
+def _get_fetcher(strategy: str):
+    try:
+        return _FETCHERS[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown dashboard query strategy: {strategy}")
+
+
+async def load_community_area(db: AsyncSession, strategy: str = "sequential") -> CommunityAreaResponse:
+    """コミュニティエリアをDBから組み立てる"""
+    values = await _get_fetcher(strategy)(db, _parts(None, COMMUNITY_PARTS))
+    return CommunityAreaResponse(**values)
+
+
+@dataclass
+class _CacheEntry:
+    version: int
+    computed_at: float
+    value: CommunityAreaResponse
+    stale_since: Optional[float] = None  # invalidate() された時刻
+
+
+class CommunityAreaCache:
+    """
+    コミュニティエリアの共有キャッシュ
+
+    - invalidate() でバージョンを進め、保持しているエントリを古いものとして扱う
+    - 古いエントリは stale_ttl の間はそのまま返し、裏で1回だけ再計算する（stale-while-revalidate）
+    - エントリがない・古すぎる場合も再計算は1回にまとめ、同時に来たリクエストはその結果を待つ
+
+    キャッシュはプロセスごと。他のワーカーで行われた更新は ttl の経過で反映される。
+    """
+
+    def __init__(self, ttl: int, stale_ttl: int):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.version = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.recomputes = 0
+        self._entry: Optional[_CacheEntry] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def invalidate(self) -> None:
+        """イベント・公開ログの変更時に呼び出す"""
+        self.version += 1
+        if self._entry is not None and self._entry.stale_since is None:
+            self._entry.stale_since = time.monotonic()
+
+    async def get(
+        self,
+        session_factory: Callable[[], Any],
+        loader: Callable[[AsyncSession], Awaitable[CommunityAreaResponse]],
+    ) -> CommunityAreaResponse:
+        """
+        コミュニティエリアを取得
+
+        再計算はリクエストのセッションではなく session_factory で作ったセッションで行う
+        （リクエストが先に終わっても再計算を続けられるように）。
+        """
+        entry = self._entry
+        if entry is not None:
+            now = time.monotonic()
+            stale_since = entry.stale_since if entry.stale_since is not None else entry.computed_at + self.ttl
+            if now < stale_since:
+                self.hits += 1
+                return entry.value
+            if now < stale_since + self.stale_ttl:
+                self.stale_hits += 1
+                self._start_refresh(session_factory, loader)
+                return entry.value
+
+        return await asyncio.shield(self._start_refresh(session_factory, loader))
+
+    def _start_refresh(self, session_factory, loader) -> asyncio.Task:
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh(session_factory, loader))
+            self._refresh_task.add_done_callback(_consume_exception)
+        return self._refresh_task
+
+    async def _refresh(self, session_factory, loader) -> CommunityAreaResponse:
+        # 再計算中に invalidate() された場合は、次の get で再度古いとみなされる
+        version = self.version
+        async with session_factory() as session:
+            value = await loader(session)
+        now = time.monotonic()
+        self.recomputes += 1
+        self._entry = _CacheEntry(
+            version=version,
+            computed_at=now,
+            value=value,
+            stale_since=now if version != self.version else None,
+        )
+        return value
+
+    async def clear(self) -> None:
+        """エントリと統計を破棄（実行中の再計算はキャンセル）"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        self._refresh_task = None
+        self._entry = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.recomputes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """ヒット・期限切れヒット・再計算の件数"""
+        return {"hits": self.hits, "stale_hits": self.stale_hits, "recomputes": self.recomputes}
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # 裏で失敗した再計算は次の get でやり直すので、例外は回収だけしておく
+    if not task.cancelled():
+        task.exception()
+
+
+community_area_cache = CommunityAreaCache(
+    ttl=settings.COMMUNITY_CACHE_TTL_SECONDS,
+    stale_ttl=settings.COMMUNITY_CACHE_STALE_SECONDS,
+)
+
+
+def _affects_community_area(obj: Any) -> bool:
+    if isinstance(obj, Event):
+        return True
+    if isinstance(obj, Log):
+        # 公開ログ、または公開から非公開に変わったログ（公開設定が未ロードなら念のため対象にする）
+        history = inspect(obj).attrs.visibility.history
+        values = list(history.added) + list(history.unchanged) + list(history.deleted)
+        return not values or LogVisibility.PUBLIC in values
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_community_changes(session, flush_context):
+    """フラッシュされたイベント・公開ログの変更を記録"""
+    if any(_affects_community_area(obj) for obj in list(session.new) + list(session.dirty) + list(session.deleted)):
+        session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_community_area(session):
+    if session.info.pop(_CHANGED_KEY, False):
+        community_area_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_community_changes(session):
+    session.info.pop(_CHANGED_KEY, None)
+
+
+async def load_dashboard(
+    db: AsyncSession,
+    user_id: UUID,
+    strategy: str = "sequential",
+    community_bind: Optional[AsyncEngine] = None,
+) -> DashboardResponse:
+    """
+    指定した実行方法でダッシュボードを組み立てる
+
+    community_bind はコミュニティエリアのキャッシュを再計算する接続先（省略時は db と同じ）。
+    db がレプリカの場合、無効化直後の再計算がレプリカの遅れを拾ってキャッシュされないよう、プライマリを渡す。
+    """
+    fetch = _get_fetcher(strategy)
+
+    if community_area_cache.enabled:
+        values = await fetch(db, _parts(user_id, PERSONAL_PARTS))
+        session_factory = async_sessionmaker(community_bind or db.bind, class_=AsyncSession, expire_on_commit=False)
+        community_area = await community_area_cache.get(
+            session_factory,
+            lambda session: load_community_area(session, strategy),
+        )
+    else:
+        values = await fetch(db, _parts(user_id, PERSONAL_PARTS + COMMUNITY_PARTS))
+        community_area = CommunityAreaResponse(
+            upcoming_events=values["upcoming_events"],
+            recent_public_logs=values["recent_public_logs"]
+        )
+
+    personal_area = PersonalAreaResponse(
+        active_goals=values["active_goals"],
+        recent_logs=values["recent_logs"],
+        total_points=values["total_points"] or 0
+    )
+
+    return DashboardResponse(
+        personal=personal_area,
+        community=community_area
+    )
@@ -0,0 +1,280 @@
+"""ポイントのランキング
+
+ポイントを反映するたびに（on_points_awarded）、付与日の期間（累計・月・週）ごとに
+leaderboard_entries のスコアと leaderboard_score_counts のスコア別ユーザー数を増分で更新する。
+points を集計し直さないので、上位 N 件も自分の順位もユーザー数によらず一定のコストで返せる。
+
+- 上位 N 件: (period, score) のインデックスを降順にたどる
+- 自分の順位: 自分より高いスコアのユーザー数 + 1（同点は同順位）
+
+期間の区切りは POINTS_TIMEZONE。プロジェクト内のランキングは
+ProjectMember.contribution_points を使う。貢献度はプロジェクトに紐づくポイントを
+反映するたびに、そのプロジェクトのメンバーに加算する。いまプロジェクトに紐づくのは
+プロジェクトの作成（オーナー）だけなので、オーナー以外のメンバーの貢献度は 0 のまま。
+"""
+import enum
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal_column, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.models.leaderboard import LeaderboardEntry, LeaderboardScoreCount
+from app.models.point import Point
+from app.models.project_member import MemberStatus, ProjectMember
+from app.models.user import User
+from app.services.point_events import on_points_awarded
+from app.services.point_rules import day_start
+
+
+# プロジェクトの貢献度に加算するアクション（reference_id はプロジェクトの ID）
+PROJECT_ACTION = "project_create"
+
+
+class LeaderboardPeriod(str, enum.Enum):
+    """ランキングの期間"""
+    ALL = "all"  # 累計
+    MONTH = "month"  # 今月
+    WEEK = "week"  # 今週（月曜始まり）
+
+
+@dataclass
+class RankedUser:
+    """ランキングの1行"""
+    rank: int
+    user_id: UUID
+    full_name: Optional[str]
+    score: int
+
+
+def period_key(period: LeaderboardPeriod, moment: datetime) -> str:
+    """moment を含む期間のキー（"all" / "2026-10" / "2026-W42"）"""
+    if period == LeaderboardPeriod.ALL:
+        return "all"
+    local_date = day_start(moment).date()
+    if period == LeaderboardPeriod.MONTH:
+        return local_date.strftime("%Y-%m")
+    iso = local_date.isocalendar()
+    return f"{iso.year}-W{iso.week:02d}"
+
+
+@on_points_awarded
+async def update_leaderboards(db: AsyncSession, points: List[Point]) -> None:
+    """付与したポイントをランキングに加算"""
+    deltas: Dict[Tuple[str, UUID], int] = defaultdict(int)
+    for point in points:
+        for period in LeaderboardPeriod:
+            deltas[(period_key(period, point.created_at), point.user_id)] += point.amount
+    deltas = {key: amount for key, amount in deltas.items() if amount}
+    if not deltas:
+        return
+
+    # 同時に実行されるバッチ同士がデッドロックしないよう、キー順に更新する
+    stmt = insert(LeaderboardEntry).values([
+        {"period": period, "user_id": user_id, "score": amount}
+        for (period, user_id), amount in sorted(deltas.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LeaderboardEntry.period, LeaderboardEntry.user_id],
+        set_={"score": LeaderboardEntry.score + stmt.excluded.score, "updated_at": func.now()},
+    ).returning(
+        LeaderboardEntry.period,
+        LeaderboardEntry.user_id,
+        LeaderboardEntry.score,
+        # 新しく作られた行は xmax が 0
+        literal_column("xmax = 0"),
+    )
+    result = await db.execute(stmt)
+
+    # 更新後のスコアから、移動前後のスコアのユーザー数を増減する
+    counts: Dict[Tuple[str, int], int] = defaultdict(int)
+    for period, user_id, score, inserted in result:
+        if not inserted:
+            counts[(period, score - deltas[(period, user_id)])] -= 1
+        counts[(period, score)] += 1
+    counts = {key: users for key, users in counts.items() if users}
+    if not counts:
+        return
+
+    stmt = insert(LeaderboardScoreCount).values([
+        {"period": period, "score": score, "users": users}
+        for (period, score), users in sorted(counts.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LeaderboardScoreCount.period, LeaderboardScoreCount.score],
+        set_={"users": LeaderboardScoreCount.users + stmt.excluded.users},
+    )
+    await db.execute(stmt)
+
+    emptied = [key for key, users in counts.items() if users < 0]
+    if emptied:
+        await db.execute(
+            delete(LeaderboardScoreCount).where(
+                tuple_(LeaderboardScoreCount.period, LeaderboardScoreCount.score).in_(emptied),
+                LeaderboardScoreCount.users <= 0,
+            )
+        )
+
+
+@on_points_awarded
+async def update_project_contributions(db: AsyncSession, points: List[Point]) -> None:
+    """プロジェクトの作成で付与したポイントを、そのプロジェクトのオーナーの貢献度に加算"""
+    deltas: Dict[Tuple[UUID, UUID], int] = defaultdict(int)
+    for point in points:
+        if point.action_type == PROJECT_ACTION:
+            deltas[(UUID(point.reference_id), point.user_id)] += point.amount
+
+    # 同時に実行されるバッチ同士がデッドロックしないよう、キー順に更新する
+    for (project_id, user_id), amount in sorted(deltas.items()):
+        if not amount:
+            continue
+        await db.execute(
+            update(ProjectMember)
+            .where(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
+            .values(contribution_points=func.coalesce(ProjectMember.contribution_points, 0) + amount)
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def rebuild_leaderboards(db: AsyncSession) -> None:
+    """
+    ランキングを points から作り直す
+
+    全体を集計し直すので、ポイントの反映を止めた状態（データ投入・復旧時）で使う。
+    コミットは呼び出し側で行う。
+    """
+    await db.execute(delete(LeaderboardScoreCount))
+    await db.execute(delete(LeaderboardEntry))
+    await db.execute(
+        text("""
+            INSERT INTO leaderboard_entries (period, user_id, score, updated_at)
+            SELECT k.period, p.user_id, SUM(p.amount), now()
+            FROM points p
+            CROSS JOIN LATERAL (VALUES
+                ('all'),
+                (to_char(timezone(:tz, p.created_at), 'YYYY-MM')),
+                (to_char(timezone(:tz, p.created_at), 'IYYY-"W"IW'))
+            ) AS k(period)
+            GROUP BY k.period, p.user_id
+        """),
+        {"tz": settings.POINTS_TIMEZONE},
+    )
+    await db.execute(text("""
+        INSERT INTO leaderboard_score_counts (period, score, users)
+        SELECT period, score, COUNT(*)
+        FROM leaderboard_entries
+        GROUP BY period, score
+    """))
+
+
+async def rebuild_project_contributions(db: AsyncSession) -> None:
+    """
+    プロジェクトの貢献度を points から作り直す
+
+    rebuild_leaderboards と同じく、ポイントの反映を止めた状態で使う。コミットは呼び出し側で行う。
+    """
+    await db.execute(
+        text("""
+            UPDATE project_members pm
+            SET contribution_points = COALESCE((
+                SELECT SUM(p.amount)
+                FROM points p
+                WHERE p.user_id = pm.user_id
+                  AND p.action_type = :project_action
+                  AND p.reference_id = pm.project_id::text
+            ), 0)
+        """),
+        {"project_action": PROJECT_ACTION},
+    )
+
+
+def _ranked(rows) -> List[RankedUser]:
+    """スコアの降順に並んだ先頭からの行に順位を付ける（同点は同順位）"""
+    ranked: List[RankedUser] = []
+    for position, (user_id, full_name, score) in enumerate(rows, start=1):
+        rank = ranked[-1].rank if ranked and ranked[-1].score == score else position
+        ranked.append(RankedUser(rank=rank, user_id=user_id, full_name=full_name, score=score))
+    return ranked
+
+
+async def get_top(db: AsyncSession, period: str, limit: int) -> List[RankedUser]:
+    """期間の上位 limit 人"""
+    result = await db.execute(
+        select(LeaderboardEntry.user_id, User.full_name, LeaderboardEntry.score)
+        .join(User, User.id == LeaderboardEntry.user_id)
+        .where(LeaderboardEntry.period == period)
+        .order_by(LeaderboardEntry.score.desc(), LeaderboardEntry.user_id.desc())
+        .limit(limit)
+    )
+    return _ranked(result.all())
+
+
+async def get_rank(db: AsyncSession, period: str, user: User) -> Optional[RankedUser]:
+    """期間のユーザーの順位（ポイントがなければ None）"""
+    higher = (
+        select(func.coalesce(func.sum(LeaderboardScoreCount.users), 0))
+        .where(
+            LeaderboardScoreCount.period == period,
+            LeaderboardScoreCount.score > LeaderboardEntry.score,
+        )
+        .scalar_subquery()
+    )
+    row = (await db.execute(
+        select(LeaderboardEntry.score, higher).where(
+            LeaderboardEntry.period == period,
+            LeaderboardEntry.user_id == user.id,
+        )
+    )).first()
+    if row is None:
+        return None
+
+    score, higher_users = row
+    return RankedUser(rank=higher_users + 1, user_id=user.id, full_name=user.full_name, score=score)
+
+
+async def get_project_top(db: AsyncSession, project_id: UUID, limit: int) -> List[RankedUser]:
+    """プロジェクトの参加中メンバーの貢献度上位 limit 人"""
+    score = func.coalesce(ProjectMember.contribution_points, 0)
+    result = await db.execute(
+        select(ProjectMember.user_id, User.full_name, score)
+        .join(User, User.id == ProjectMember.user_id)
+        .where(ProjectMember.project_id == project_id, ProjectMember.status == MemberStatus.ACTIVE)
+        .order_by(score.desc(), ProjectMember.user_id.desc())
+        .limit(limit)
+    )
+    return _ranked(result.all())
+
+
+async def get_project_rank(db: AsyncSession, project_id: UUID, user: User) -> Optional[RankedUser]:
+    """プロジェクト内のユーザーの順位（参加中でなければ None）"""
+    score = func.coalesce(ProjectMember.contribution_points, 0)
+    # プロジェクトのメンバー数は限られているので、上位のメンバーを数える
+    other = aliased(ProjectMember)
+    higher = (
+        select(func.count())
+        .select_from(other)
+        .where(
+            other.project_id == project_id,
+            other.status == MemberStatus.ACTIVE,
+            func.coalesce(other.contribution_points, 0) > score,
+        )
+        .scalar_subquery()
+    )
+    row = (await db.execute(
+        select(score, higher).where(
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == user.id,
+            ProjectMember.status == MemberStatus.ACTIVE,
+        )
+    )).first()
+    if row is None:
+        return None
+
+    score, higher_members = row
+    return RankedUser(rank=higher_members + 1, user_id=user.id, full_name=user.full_name, score=score)
@@ -0,0 +1,71 @@
+"""ログの全文検索の候補
+
+検索語に一致するログのうち、新しい順に SEARCH_CANDIDATES 件までを関連度付きで返す。
+関連度（ts_rank_cd）も一致の確認（フレーズの位置）も行ごとに tsvector を読むため、
+一致する全行を作成日時で並べ替えると、よく使われる語では一致の件数に比例して遅くなる。
+
+フレーズの一致件数はバイグラムごとの頻度の積で見積もられ、長い語ほど少なく見積もられる。
+プランナーに任せると、よく使われる長い語でも GIN インデックスから一致の全件を取って並べ替えてしまう。
+
+- バイグラムが MAX_ESTIMATED_BIGRAMS 個までなら見積もりが近いので、プランナーに任せる
+- それより多ければ、GIN インデックスで一致を SEARCH_PROBE 件まで数える。
+  満たなければプランナーに任せ（まれな語なので GIN インデックスを使う）、
+  満たせばよく使われる語なので、作成日時のインデックスを新しい順にたどり、最初の SEARCH_CANDIDATES 件を取る
+  （たどる行数は SEARCH_WINDOW まで）
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.search import search_query
+from app.models.log import Log
+
+SEARCH_CANDIDATES = 1000
+SEARCH_PROBE = 5000
+SEARCH_WINDOW = 100_000
+# バイグラムがこの数までなら、一致件数の見積もりが近いので経路をプランナーに任せる
+MAX_ESTIMATED_BIGRAMS = 2
+
+
+def _bigrams(terms: List[str]) -> int:
+    return sum(max(1, len(term) - 1) for term in terms)
+
+
+async def _count_matches(db: AsyncSession, visible: ColumnElement, matches: ColumnElement) -> int:
+    """一致の件数（SEARCH_PROBE で打ち切る）"""
+    return (await db.execute(
+        select(func.count()).select_from(select(Log.id).where(visible, matches).limit(SEARCH_PROBE).subquery())
+    )).scalar()
+
+
+@dataclass
+class SearchCandidate:
+    """検索に一致したログ"""
+    id: UUID
+    created_at: datetime
+    rank: float
+
+
+async def find_candidates(db: AsyncSession, visible: ColumnElement, terms: List[str]) -> List[SearchCandidate]:
+    """visible（閲覧できるログの条件）のうち検索語に一致する新しいログ（最大 SEARCH_CANDIDATES 件、新しい順）"""
+    ts_query = search_query(terms)
+    matches = Log.search_vector.bool_op("@@")(ts_query)
+
+    source = select(Log.id, Log.created_at, Log.search_vector).where(visible)
+    if _bigrams(terms) > MAX_ESTIMATED_BIGRAMS and await _count_matches(db, visible, matches) >= SEARCH_PROBE:
+        # LIMIT 付きのサブクエリは平坦化されないので、作成日時のインデックスを新しい順にたどる
+        source = source.order_by(Log.created_at.desc(), Log.id.desc()).limit(SEARCH_WINDOW)
+    source = source.subquery()
+
+    rows = (await db.execute(
+        select(source.c.id, source.c.created_at, func.ts_rank_cd(source.c.search_vector, ts_query))
+        .where(source.c.search_vector.bool_op("@@")(ts_query))
+        .order_by(source.c.created_at.desc(), source.c.id.desc())
+        .limit(SEARCH_CANDIDATES)
+    )).all()
+    return [SearchCandidate(id=row[0], created_at=row[1], rank=row[2]) for row in rows]
@@ -0,0 +1,274 @@
+"""ポイント付与のアウトボックスとワーカー
+
+書き込みのエンドポイントは enqueue_point_event で point_events に記録するだけにし、
+付与ルールの適用（app.services.point_rules）・残高の更新・その他の後続処理は
+ワーカーがまとめて反映する。
+point_events はリクエストと同じトランザクションで書き込むので、
+ロールバックされた操作のポイントが付与されることはない。
+
+POINT_EVENTS_MODE:
+    worker: アプリのバックグラウンドタスクが反映する（複数ワーカーでも SKIP LOCKED で重複しない）
+    inline: enqueue_point_event の中で即座に反映する（テスト・スクリプト用）
+
+後続処理（バッジ、通知、集計など）は on_points_awarded で登録する。
+ハンドラーは反映と同じトランザクション内で、実際に付与したポイントの一覧を受け取る
+（上限や重複で付与しなかったアクションは含まれない）。
+
+反映に失敗するイベント（ルールが消えた、ハンドラーが例外を出すなど）があると
+バッチ全体がロールバックされるので、ワーカーは1件ずつ反映し直して失敗するイベントを切り分ける。
+失敗したイベントは attempts と last_error を記録し、POINT_EVENTS_MAX_ATTEMPTS 回に達したら
+failed_at を記録して以後のポーリングの対象から外す（後ろのイベントは止まらない）。
+原因を直したあとで再処理するには failed_at を NULL、attempts を 0 に戻す。
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import case, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.point import Point
+from app.models.point_event import PointEvent
+from app.services.point_rules import PointAction, point_rule_engine
+from app.services.points import add_to_balances
+
+logger = logging.getLogger(__name__)
+
+_ENQUEUED_KEY = "point_events_enqueued"
+_MAX_ERROR_LENGTH = 1000
+
+PointAwardHandler = Callable[[AsyncSession, List[Point]], Awaitable[None]]
+point_award_handlers: List[PointAwardHandler] = []
+
+
+def on_points_awarded(handler: PointAwardHandler) -> PointAwardHandler:
+    """ポイント反映後の処理を登録（デコレーター）"""
+    point_award_handlers.append(handler)
+    return handler
+
+
+async def enqueue_point_event(
+    db: AsyncSession,
+    user_id: UUID,
+    action_type: str,
+    reference_id: Optional[str] = None,
+    description: Optional[str] = None,
+    variant: Optional[str] = None,
+) -> PointEvent:
+    """
+    ポイント付与の対象となるアクションを記録する
+
+    ルールのないアクションは UnknownPointAction。コミットは呼び出し側で行う。
+    """
+    point_rule_engine.rule_for(action_type)
+    point_event = PointEvent(
+        user_id=user_id,
+        action_type=action_type,
+        reference_id=reference_id,
+        description=description,
+        variant=variant,
+        created_at=datetime.now(timezone.utc),
+    )
+    db.add(point_event)
+
+    if settings.POINT_EVENTS_MODE == "inline":
+        await apply_point_events(db, [point_event])
+    else:
+        db.info[_ENQUEUED_KEY] = True
+    return point_event
+
+
+async def apply_point_events(db: AsyncSession, point_events: Sequence[PointEvent]) -> List[Point]:
+    """
+    イベントにルールを適用して points と残高に反映し、処理済みにする
+
+    コミットは呼び出し側で行う。
+    """
+    points = await point_rule_engine.apply(db, [
+        PointAction(
+            user_id=point_event.user_id,
+            action_type=point_event.action_type,
+            occurred_at=point_event.created_at,
+            reference_id=point_event.reference_id,
+            description=point_event.description,
+            variant=point_event.variant,
+        )
+        for point_event in point_events
+    ])
+
+    processed_at = datetime.now(timezone.utc)
+    for point_event in point_events:
+        point_event.processed_at = processed_at
+
+    amounts: Dict[UUID, int] = defaultdict(int)
+    for point in points:
+        amounts[point.user_id] += point.amount
+    await add_to_balances(db, amounts)
+    for handler in point_award_handlers:
+        await handler(db, points)
+    await db.flush()
+    return points
+
+
+class PointEventWorker:
+    """未処理の point_events をバッチで反映するバックグラウンドタスク"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int = 5,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.processed = 0
+        self.batches = 0
+        self.errors = 0
+        self.failed = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        """新しいイベントがコミットされた（ポーリングを待たずに処理する）"""
+        self._wakeup.set()
+
+    @staticmethod
+    def _pending():
+        return (
+            select(PointEvent)
+            .where(PointEvent.processed_at.is_(None), PointEvent.failed_at.is_(None))
+            .order_by(PointEvent.id)
+            .with_for_update(skip_locked=True)
+        )
+
+    async def run_once(self) -> int:
+        """
+        未処理のイベントを1バッチ反映し、件数を返す
+
+        バッチの反映に失敗したら、1件ずつのトランザクションで反映し直す。
+        """
+        async with self.session_factory() as db:
+            result = await db.execute(self._pending().limit(self.batch_size))
+            point_events = result.scalars().all()
+            if not point_events:
+                return 0
+
+            event_ids = [point_event.id for point_event in point_events]
+            try:
+                await apply_point_events(db, point_events)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.warning("Failed to apply a batch of %d point events; retrying one by one", len(event_ids))
+            else:
+                self.processed += len(event_ids)
+                self.batches += 1
+                return len(event_ids)
+
+        for event_id in event_ids:
+            await self._apply_one(event_id)
+        self.batches += 1
+        return len(event_ids)
+
+    async def _apply_one(self, event_id: int) -> None:
+        """1件を反映する。失敗したら attempts・last_error（上限に達したら failed_at）を記録する"""
+        async with self.session_factory() as db:
+            result = await db.execute(self._pending().where(PointEvent.id == event_id))
+            point_event = result.scalar_one_or_none()
+            if point_event is None:
+                # ほかのワーカーが処理中か処理済み
+                return
+
+            try:
+                async with db.begin_nested():
+                    await apply_point_events(db, [point_event])
+            except Exception as e:
+                # セーブポイントまで戻し、行ロックを持ったまま失敗を記録する
+                attempts = PointEvent.attempts + 1
+                result = await db.execute(
+                    update(PointEvent)
+                    .where(PointEvent.id == event_id)
+                    .values(
+                        attempts=attempts,
+                        last_error=f"{type(e).__name__}: {e}"[:_MAX_ERROR_LENGTH],
+                        failed_at=case((attempts >= self.max_attempts, func.now()), else_=None),
+                    )
+                    .returning(PointEvent.attempts, PointEvent.failed_at)
+                )
+                attempts, failed_at = result.one()
+                await db.commit()
+                if failed_at is not None:
+                    self.failed += 1
+                    logger.error("Point event %d failed %d times and was skipped", event_id, attempts, exc_info=e)
+                else:
+                    logger.warning("Failed to apply point event %d (attempt %d)", event_id, attempts, exc_info=e)
+                return
+
+            await db.commit()
+        self.processed += 1
+
+    async def run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                count = await self.run_once()
+            except Exception:
+                self.errors += 1
+                logger.exception("Failed to apply point events")
+                count = 0
+
+            if count < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "processed": self.processed,
+            "batches": self.batches,
+            "errors": self.errors,
+            "failed": self.failed,
+        }
+
+
+point_event_worker = PointEventWorker(
+    AsyncSessionLocal,
+    batch_size=settings.POINT_EVENTS_BATCH_SIZE,
+    poll_interval=settings.POINT_EVENTS_POLL_SECONDS,
+    max_attempts=settings.POINT_EVENTS_MAX_ATTEMPTS,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_worker(session):
+    if session.info.pop(_ENQUEUED_KEY, False):
+        point_event_worker.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_enqueued(session):
+    session.info.pop(_ENQUEUED_KEY, None)
@@ -0,0 +1,145 @@
+"""ポイントの期間別集計（日別・週別）
+
+ポイントを反映するたびに（on_points_awarded）、ユーザー・アクションごとの日別・週別の
+合計を point_rollups に加算する。推移のグラフは points を走査せず、期間の数だけの行を読む。
+
+期間の区切りは POINTS_TIMEZONE（週は月曜始まり）。既存の points からの作り直しは
+scripts/backfill_point_rollups.py（rebuild_point_rollups）で行う。
+"""
+import enum
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.point import Point
+from app.models.point_rollup import PointRollup
+from app.services.point_events import on_points_awarded
+from app.services.point_rules import day_start, lock_users
+
+
+class PointGranularity(str, enum.Enum):
+    """集計の単位"""
+    DAY = "day"
+    WEEK = "week"
+
+
+@dataclass
+class SeriesBucket:
+    """推移の1期間"""
+    bucket_start: date
+    total: int = 0
+    count: int = 0
+    by_action: Dict[str, int] = field(default_factory=dict)
+
+
+def bucket_start(granularity: PointGranularity, day: date) -> date:
+    """day を含む期間の初日"""
+    if granularity == PointGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+@on_points_awarded
+async def update_point_rollups(db: AsyncSession, points: List[Point]) -> None:
+    """付与したポイントを日別・週別の集計に加算"""
+    deltas: Dict[Tuple[UUID, str, date, str], List[int]] = defaultdict(lambda: [0, 0])
+    for point in points:
+        day = day_start(point.created_at).date()
+        for granularity in PointGranularity:
+            delta = deltas[(point.user_id, granularity.value, bucket_start(granularity, day), point.action_type)]
+            delta[0] += point.amount
+            delta[1] += 1
+    if not deltas:
+        return
+
+    # 同時に実行されるバッチ同士がデッドロックしないよう、キー順に更新する
+    stmt = insert(PointRollup).values([
+        {
+            "user_id": user_id,
+            "granularity": granularity,
+            "bucket_start": start,
+            "action_type": action_type,
+            "total": total,
+            "count": count,
+        }
+        for (user_id, granularity, start, action_type), (total, count) in sorted(deltas.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PointRollup.user_id, PointRollup.granularity, PointRollup.bucket_start, PointRollup.action_type],
+        set_={
+            "total": PointRollup.total + stmt.excluded.total,
+            "count": PointRollup.count + stmt.excluded.count,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def get_series(
+    db: AsyncSession,
+    user_id: UUID,
+    granularity: PointGranularity,
+    start: date,
+    end: date,
+) -> List[SeriesBucket]:
+    """start から end までの期間ごとの獲得ポイント（ポイントのない期間は 0）"""
+    first = bucket_start(granularity, start)
+    step = timedelta(days=7 if granularity == PointGranularity.WEEK else 1)
+
+    buckets: Dict[date, SeriesBucket] = {}
+    current = first
+    while current <= end:
+        buckets[current] = SeriesBucket(bucket_start=current)
+        current += step
+
+    result = await db.execute(
+        select(PointRollup.bucket_start, PointRollup.action_type, PointRollup.total, PointRollup.count)
+        .where(
+            PointRollup.user_id == user_id,
+            PointRollup.granularity == granularity.value,
+            PointRollup.bucket_start >= first,
+            PointRollup.bucket_start <= end,
+        )
+    )
+    for start_date, action_type, total, count in result:
+        bucket = buckets[start_date]
+        bucket.total += total
+        bucket.count += count
+        bucket.by_action[action_type] = total
+
+    return list(buckets.values())
+
+
+async def rebuild_point_rollups(db: AsyncSession, user_ids: Sequence[UUID]) -> None:
+    """
+    ユーザーの集計を points から作り直す
+
+    作り直しの間にポイントが反映されないよう、ユーザーごとのロックを取ってから集計する
+    （points・point_rollups のテーブルはロックしない）。コミットは呼び出し側で行う。
+    """
+    if not user_ids:
+        return
+    await lock_users(db, user_ids)
+
+    await db.execute(delete(PointRollup).where(PointRollup.user_id.in_(user_ids)))
+    await db.execute(
+        text("""
+            INSERT INTO point_rollups (user_id, granularity, bucket_start, action_type, total, count)
+            SELECT p.user_id, g.granularity, g.bucket_start, p.action_type, SUM(p.amount), COUNT(*)
+            FROM points p
+            CROSS JOIN LATERAL (SELECT CAST(timezone(:tz, p.created_at) AS date) AS day) d
+            CROSS JOIN LATERAL (VALUES
+                ('day', d.day),
+                ('week', CAST(date_trunc('week', d.day) AS date))
+            ) AS g(granularity, bucket_start)
+            WHERE p.user_id = ANY(:user_ids)
+            GROUP BY p.user_id, g.granularity, g.bucket_start, p.action_type
+        """),
+        {"tz": settings.POINTS_TIMEZONE, "user_ids": list(user_ids)},
+    )
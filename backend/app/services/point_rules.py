@@ -0,0 +1,200 @@
+"""ポイントの付与ルール
+
+アクションごとの付与量と1日の上限を POINT_RULES で宣言し、PointRuleEngine が
+アクションのバッチにまとめて適用する。
+
+同じ (user_id, action_type, reference_id) には1回しか付与しない。
+points の一意インデックスと INSERT ... ON CONFLICT DO NOTHING で保証するので、
+二重送信や同時実行でも重複して付与されることはない。
+"""
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.point import Point
+
+
+@dataclass(frozen=True)
+class PointRule:
+    """アクションの付与ルール"""
+    action_type: str
+    amount: int
+    # 区分ごとの付与量（プロジェクトのカテゴリなど）。該当しなければ amount
+    variants: Mapping[str, int] = field(default_factory=dict)
+    # 1日（POINTS_TIMEZONE）にこのアクションで付与するポイントの上限
+    daily_cap: Optional[int] = None
+
+    def amount_for(self, variant: Optional[str]) -> int:
+        return self.variants.get(variant, self.amount) if variant else self.amount
+
+
+POINT_RULES = [
+    PointRule("log_create", 5, daily_cap=50),
+    PointRule("step_complete", 10, daily_cap=100),
+    PointRule("event_create", 50),
+    PointRule("event_join", 10),
+    PointRule("project_create", 30, variants={"asoto": 50, "asobi": 30}),
+]
+
+
+@dataclass
+class PointAction:
+    """ポイントの対象となるアクション"""
+    user_id: UUID
+    action_type: str
+    occurred_at: datetime
+    reference_id: Optional[str] = None
+    description: Optional[str] = None
+    variant: Optional[str] = None
+
+
+class UnknownPointAction(ValueError):
+    """ルールが定義されていないアクション"""
+
+
+class PointRuleEngine:
+    """アクションのバッチにルールを適用して points に記録する"""
+
+    def __init__(self, rules: Iterable[PointRule]):
+        self.rules: Dict[str, PointRule] = {rule.action_type: rule for rule in rules}
+
+    def rule_for(self, action_type: str) -> PointRule:
+        rule = self.rules.get(action_type)
+        if rule is None:
+            raise UnknownPointAction(action_type)
+        return rule
+
+    async def apply(self, db: AsyncSession, actions: Sequence[PointAction]) -> List[Point]:
+        """
+        アクションを評価し、付与したポイントを返す
+
+        上限を超える分と、付与済み・バッチ内で重複したアクションは付与しない。
+        コミットは呼び出し側で行う。
+        """
+        rows = []
+        seen: Set[Tuple[UUID, str, str]] = set()
+        for action in actions:
+            if action.reference_id is not None:
+                key = (action.user_id, action.action_type, action.reference_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+            rows.append(action)
+
+        if not rows:
+            return []
+        await lock_users(db, {action.user_id for action in rows})
+
+        rows = await self._apply_daily_caps(db, rows)
+        if not rows:
+            return []
+
+        stmt = insert(Point).values([
+            {
+                "user_id": action.user_id,
+                "amount": self.rule_for(action.action_type).amount_for(action.variant),
+                "action_type": action.action_type,
+                "reference_id": action.reference_id,
+                "description": action.description,
+                "created_at": action.occurred_at,
+            }
+            for action in rows
+        ])
+        stmt = stmt.on_conflict_do_nothing(
+            index_elements=[Point.user_id, Point.action_type, Point.reference_id]
+        ).returning(Point)
+        result = await db.scalars(stmt)
+        return list(result)
+
+    async def _apply_daily_caps(self, db: AsyncSession, actions: List[PointAction]) -> List[PointAction]:
+        capped = [action for action in actions if self.rule_for(action.action_type).daily_cap is not None]
+        if not capped:
+            return actions
+
+        # バッチ内の最も古いアクションの日から、日ごとの付与済みポイントを集計
+        local_date = func.date(func.timezone(settings.POINTS_TIMEZONE, Point.created_at))
+        pairs = {(action.user_id, action.action_type) for action in capped}
+        result = await db.execute(
+            select(Point.user_id, Point.action_type, local_date, func.sum(Point.amount))
+            .where(
+                tuple_(Point.user_id, Point.action_type).in_(pairs),
+                Point.created_at >= day_start(min(action.occurred_at for action in capped)),
+            )
+            .group_by(Point.user_id, Point.action_type, local_date)
+        )
+        awarded: Dict[Tuple[UUID, str, date], int] = {}
+        for user_id, action_type, day, total in result:
+            awarded[(user_id, action_type, day)] = total
+
+        # 付与済みのアクションは上限の計算に含めない
+        existing = await self._existing_keys(db, capped)
+
+        allowed = []
+        for action in actions:
+            rule = self.rule_for(action.action_type)
+            if rule.daily_cap is None:
+                allowed.append(action)
+                continue
+            if (action.user_id, action.action_type, action.reference_id) in existing:
+                continue
+
+            key = (action.user_id, action.action_type, day_start(action.occurred_at).date())
+            amount = rule.amount_for(action.variant)
+            if awarded.get(key, 0) + amount > rule.daily_cap:
+                continue
+            awarded[key] = awarded.get(key, 0) + amount
+            allowed.append(action)
+        return allowed
+
+    async def _existing_keys(self, db: AsyncSession, actions: List[PointAction]) -> Set[Tuple[UUID, str, str]]:
+        keys = {
+            (action.user_id, action.action_type, action.reference_id)
+            for action in actions
+            if action.reference_id is not None
+        }
+        if not keys:
+            return set()
+        result = await db.execute(
+            select(Point.user_id, Point.action_type, Point.reference_id)
+            .where(tuple_(Point.user_id, Point.action_type, Point.reference_id).in_(keys))
+        )
+        return {tuple(row) for row in result}
+
+
+async def lock_users(db: AsyncSession, user_ids: Iterable[UUID]) -> None:
+    """
+    ユーザーごとのポイントの反映を直列化する（トランザクション終了まで保持）
+
+    同じユーザーのバッチが同時に上限を判定したり、集計の再計算
+    （scripts/backfill_point_rollups.py）と付与が重なったりしないようにする。
+    デッドロックしないよう、キーの順にロックする。
+    """
+    keys = sorted(f"points:{user_id}" for user_id in user_ids)
+    if not keys:
+        return
+    await db.execute(
+        text("""
+            SELECT pg_advisory_xact_lock(hashtextextended(k, 0))
+            FROM (SELECT unnest(CAST(:keys AS text[])) AS k ORDER BY k) AS ordered
+        """),
+        {"keys": keys},
+    )
+
+
+def day_start(moment: datetime) -> datetime:
+    """moment を含む日（POINTS_TIMEZONE）の開始時刻"""
+    tz = ZoneInfo(settings.POINTS_TIMEZONE)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    local = moment.astimezone(tz)
+    return datetime.combine(local.date(), time.min, tzinfo=tz)
+
+
+point_rule_engine = PointRuleEngine(POINT_RULES)
@@ -0,0 +1,124 @@
+"""ポイント付与・残高管理"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Select, select, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.point import Point
+from app.models.user_point_balance import UserPointBalance
+
+
+@dataclass
+class BalanceDrift:
+    """残高テーブルと points の累計のずれ"""
+    user_id: UUID
+    recorded: int
+    actual: int
+
+
+async def award_points(
+    db: AsyncSession,
+    user_id: UUID,
+    amount: int,
+    action_type: str,
+    reference_id: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Point:
+    """
+    ポイントを付与し、同じトランザクション内で残高を更新する
+
+    コミットは呼び出し側で行う。
+    """
+    point = Point(
+        user_id=user_id,
+        amount=amount,
+        action_type=action_type,
+        reference_id=reference_id,
+        description=description,
+    )
+    db.add(point)
+    await add_to_balances(db, {user_id: amount})
+    return point
+
+
+async def add_to_balances(db: AsyncSession, amounts: Dict[UUID, int]) -> None:
+    """
+    ユーザーごとの増分を残高に加算（1文で upsert）
+
+    同時に実行されるバッチ同士がデッドロックしないよう、ユーザーID順に更新する。
+    """
+    if not amounts:
+        return
+
+    stmt = insert(UserPointBalance).values([
+        {"user_id": user_id, "balance": amount}
+        for user_id, amount in sorted(amounts.items())
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserPointBalance.user_id],
+        set_={
+            "balance": UserPointBalance.balance + stmt.excluded.balance,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+def balance_query(user_id: UUID) -> Select:
+    """ユーザーのポイント残高を取得するクエリ"""
+    return select(UserPointBalance.balance).where(UserPointBalance.user_id == user_id)
+
+
+async def get_balance(db: AsyncSession, user_id: UUID) -> int:
+    """ユーザーのポイント残高を取得"""
+    result = await db.execute(balance_query(user_id))
+    return result.scalar() or 0
+
+
+async def reconcile_balances(db: AsyncSession, fix: bool = False) -> List[BalanceDrift]:
+    """
+    points の累計から残高を一括で再計算し、ずれを報告する
+
+    fix=True の場合は残高テーブルを再計算結果で上書きする。
+    集計中に付与された分を取りこぼさないよう、残高テーブルをロックしてから集計する。
+    コミットは呼び出し側で行う。
+    """
+    if fix:
+        await db.execute(text("LOCK TABLE user_point_balances IN SHARE ROW EXCLUSIVE MODE"))
+
+    result = await db.execute(text("""
+        SELECT
+            COALESCE(b.user_id, a.user_id) AS user_id,
+            COALESCE(b.balance, 0) AS recorded,
+            COALESCE(a.total, 0) AS actual
+        FROM user_point_balances b
+        FULL OUTER JOIN (
+            SELECT user_id, SUM(amount) AS total
+            FROM points
+            GROUP BY user_id
+        ) a ON a.user_id = b.user_id
+        WHERE COALESCE(b.balance, 0) <> COALESCE(a.total, 0)
+    """))
+    drifts = [BalanceDrift(user_id=row.user_id, recorded=row.recorded, actual=row.actual) for row in result]
+
+    if fix and drifts:
+        await db.execute(text("""
+            INSERT INTO user_point_balances (user_id, balance, updated_at)
+            SELECT user_id, SUM(amount), now()
+            FROM points
+            GROUP BY user_id
+            ON CONFLICT (user_id) DO UPDATE
+            SET balance = EXCLUDED.balance, updated_at = EXCLUDED.updated_at
+            WHERE user_point_balances.balance <> EXCLUDED.balance
+        """))
+        await db.execute(text("""
+            UPDATE user_point_balances b
+            SET balance = 0, updated_at = now()
+            WHERE b.balance <> 0
+              AND NOT EXISTS (SELECT 1 FROM points p WHERE p.user_id = b.user_id)
+        """))
+
+    return drifts
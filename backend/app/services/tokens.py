@@ -0,0 +1,102 @@
+"""アクセストークン・リフレッシュトークンの発行
+
+リフレッシュトークンは使うたびに新しいものと交換する（ローテーション）。
+交換済みのトークンが再び使われたら漏洩とみなし、同じ系列のトークンをすべて失効させる。
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import create_access_token, generate_refresh_token, hash_refresh_token
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+
+
+class RefreshTokenError(Exception):
+    """リフレッシュトークンが無効・期限切れ・再利用された"""
+
+
+async def issue_tokens(db: AsyncSession, user: User, family_id: Optional[UUID] = None) -> Dict[str, Any]:
+    """アクセストークンとリフレッシュトークンを発行してコミット"""
+    refresh_token = generate_refresh_token()
+    db.add(RefreshToken(
+        user_id=user.id,
+        family_id=family_id or uuid.uuid4(),
+        token_hash=hash_refresh_token(refresh_token),
+        token_version=user.token_version or 0,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+    ))
+    await db.commit()
+
+    access_token = create_access_token(data={"sub": str(user.id), "ver": user.token_version or 0})
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+
+async def _find_refresh_token(db: AsyncSession, refresh_token: str) -> RefreshToken:
+    result = await db.execute(
+        select(RefreshToken)
+        .where(RefreshToken.token_hash == hash_refresh_token(refresh_token))
+        .with_for_update()
+    )
+    token = result.scalar_one_or_none()
+    if token is None:
+        raise RefreshTokenError()
+    return token
+
+
+async def _revoke_family(db: AsyncSession, family_id: UUID) -> None:
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+async def rotate_refresh_token(db: AsyncSession, refresh_token: str) -> Dict[str, Any]:
+    """リフレッシュトークンを新しいトークンの組と交換"""
+    token = await _find_refresh_token(db, refresh_token)
+
+    if token.revoked_at is not None:
+        # 交換済みのトークンの再利用（漏洩の可能性）
+        await _revoke_family(db, token.family_id)
+        await db.commit()
+        raise RefreshTokenError()
+
+    user = await db.get(User, token.user_id)
+    if (
+        token.expires_at <= datetime.now(timezone.utc)
+        or user is None
+        or not user.is_active
+        or token.token_version != (user.token_version or 0)
+    ):
+        raise RefreshTokenError()
+
+    token.revoked_at = datetime.now(timezone.utc)
+    return await issue_tokens(db, user, family_id=token.family_id)
+
+
+async def revoke_refresh_token(db: AsyncSession, refresh_token: str, everywhere: bool = False) -> None:
+    """
+    ログアウト
+
+    リフレッシュトークンの系列を失効させる。everywhere なら token_version を上げ、
+    発行済みのアクセストークン・リフレッシュトークンをすべて無効にする。
+    """
+    token = await _find_refresh_token(db, refresh_token)
+    await _revoke_family(db, token.family_id)
+
+    if everywhere:
+        user = await db.get(User, token.user_id)
+        user.token_version = (user.token_version or 0) + 1
+
+    await db.commit()
@@ -0,0 +1,144 @@
+"""ログイン集中時のパスワードハッシュのベンチマーク
+
+ログインを並行して送り続けながら、認証を使わないエンドポイント（/health）の
+レイテンシを測ります。bcrypt をイベントループ上で実行する場合（inline）と
+スレッドプールで実行する場合（pool）を比べ、ログインが他のリクエストを
+止めていないかを p50 / p99 で確認します。
+
+アプリはプロセス内（ASGI）で動かすので、DATABASE_URL のデータベースを使います。
+ベンチマーク用の空のデータベースを指定してください（--reset で全テーブルを作り直します）。
+
+使い方:
+    docker compose exec backend python benchmarks/auth_offload.py --reset
+    docker compose exec backend python benchmarks/auth_offload.py --logins 8 --duration 10 --json result.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from httpx import AsyncClient
+
+from app.api.v1 import auth
+from app.core.config import settings
+from app.core.database import Base, engine
+from app.core.password_hasher import PasswordHasher
+from app.main import app
+from app.models import *  # noqa: F401,F403 - メタデータに全テーブルを登録
+
+EMAIL = "bench-login@example.com"
+PASSWORD = "password123"
+
+
+def percentile(samples, pct):
+    """サンプルのパーセンタイル（ミリ秒）"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+async def reset(client: AsyncClient) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"email": EMAIL, "password": PASSWORD, "full_name": "Bench"},
+    )
+    response.raise_for_status()
+
+
+async def run_mode(client: AsyncClient, args) -> dict:
+    """ログインを送り続けながら /health を一定間隔で叩き、そのレイテンシを返す"""
+    stop = asyncio.Event()
+    logins = {"ok": 0, "busy": 0}
+
+    async def login_loop():
+        while not stop.is_set():
+            response = await client.post(
+                "/api/v1/auth/login",
+                data={"username": EMAIL, "password": PASSWORD},
+            )
+            if response.status_code == 503:
+                logins["busy"] += 1
+                await asyncio.sleep(0.05)
+            else:
+                response.raise_for_status()
+                logins["ok"] += 1
+
+    async def probe_loop(samples):
+        # 予定時刻から測る（ループが止まっていて送れなかった時間もレイテンシに含める）
+        scheduled = time.perf_counter()
+        while not stop.is_set():
+            await client.get("/health")
+            samples.append(time.perf_counter() - scheduled)
+            scheduled += args.probe_interval
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+
+    samples = []
+    tasks = [asyncio.ensure_future(login_loop()) for _ in range(args.logins)]
+    tasks.append(asyncio.ensure_future(probe_loop(samples)))
+    await asyncio.sleep(args.duration)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    return {
+        "probes": len(samples),
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        "logins_ok": logins["ok"],
+        "logins_busy": logins["busy"],
+    }
+
+
+async def main(args) -> None:
+    settings.BCRYPT_ROUNDS = args.rounds
+    modes = {
+        "inline": PasswordHasher(max_workers=0, max_queue=0),
+        "pool": PasswordHasher(max_workers=args.workers, max_queue=args.max_queue),
+    }
+
+    report = {}
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        if args.reset:
+            print("🌱 ベンチマーク用ユーザーを作成中...")
+            await reset(client)
+
+        for mode in args.modes:
+            auth.password_hasher = modes[mode]
+            report[mode] = await run_mode(client, args)
+            modes[mode].shutdown()
+
+    await engine.dispose()
+
+    print(f"\n📊 /health のレイテンシ（ログイン並行数={args.logins}, bcrypt rounds={args.rounds}）")
+    print(f"  {'mode':<8}{'p50 (ms)':>10}{'p99 (ms)':>10}{'mean (ms)':>11}{'logins':>9}{'503':>6}")
+    for mode, stats in report.items():
+        print(
+            f"  {mode:<8}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['mean_ms']:>11}"
+            f"{stats['logins_ok']:>9}{stats['logins_busy']:>6}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ログイン集中時のパスワードハッシュのベンチマーク")
+    parser.add_argument("--reset", action="store_true", help="全テーブルを作り直してユーザーを作成する")
+    parser.add_argument("--modes", nargs="+", choices=["inline", "pool"], default=["inline", "pool"])
+    parser.add_argument("--rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument("--max-queue", type=int, default=settings.PASSWORD_HASH_MAX_QUEUE)
+    parser.add_argument("--logins", type=int, default=8, help="並行してログインを送り続ける数")
+    parser.add_argument("--duration", type=float, default=10.0, help="各モードの計測時間（秒）")
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    parser.add_argument("--json", help="結果をJSONで保存するパス")
+    asyncio.run(main(parser.parse_args()))
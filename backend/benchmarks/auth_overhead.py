@@ -0,0 +1,125 @@
+"""認証（get_current_user）のオーバーヘッドのベンチマーク
+
+毎回 users を検索する場合（db: ユーザーキャッシュ・失効記録なし）と、
+ユーザーキャッシュと token_revocations を使う場合（cached）で、
+get_current_user 1回あたりの所要時間と発行される SQL の数を比べます。
+
+ベンチマーク用の空のデータベースを指定してください（--reset で全テーブルを作り直します）。
+
+使い方:
+    docker compose exec backend python benchmarks/auth_overhead.py --reset
+    docker compose exec backend python benchmarks/auth_overhead.py --iterations 5000 --json result.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base
+from app.core.dependencies import get_current_user
+from app.core.metrics import RequestStats, current_request_stats
+from app.core.security import create_access_token, get_password_hash
+from app.core.token_revocation import token_revocations
+from app.core.user_cache import user_cache
+from app.models import *  # noqa: F401,F403 - メタデータに全テーブルを登録
+from app.models.user import User
+
+EMAIL = "bench-auth@example.com"
+
+
+def percentile(samples, pct):
+    """サンプルのパーセンタイル（マイクロ秒）"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1_000_000
+
+
+async def reset(engine, session_maker) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with session_maker() as session:
+        session.add(User(email=EMAIL, hashed_password=get_password_hash("password123", rounds=4), full_name="Bench"))
+        await session.commit()
+
+
+async def run_mode(session_maker, credentials, iterations) -> dict:
+    """get_current_user を iterations 回呼び、各回の所要時間と SQL の数を返す"""
+    samples = []
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        async with session_maker() as session:
+            for _ in range(iterations):
+                started = time.perf_counter()
+                await get_current_user(credentials, session)
+                samples.append(time.perf_counter() - started)
+    finally:
+        current_request_stats.reset(token)
+
+    return {
+        "iterations": len(samples),
+        "p50_us": round(percentile(samples, 50), 1),
+        "p99_us": round(percentile(samples, 99), 1),
+        "mean_us": round(statistics.mean(samples) * 1_000_000, 1),
+        "queries_per_call": round(stats.sql_count / len(samples), 3),
+    }
+
+
+async def main(args) -> None:
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    if args.reset:
+        print("🌱 ベンチマーク用ユーザーを作成中...")
+        await reset(engine, session_maker)
+
+    async with session_maker() as session:
+        user = (await session.execute(select(User).where(User.email == EMAIL))).scalar_one_or_none()
+    if user is None:
+        raise SystemExit("ユーザーがいません。--reset でデータを投入してください")
+
+    access_token = create_access_token(data={"sub": str(user.id), "ver": user.token_version})
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access_token)
+
+    cache_ttl, revocation_ttl = user_cache.ttl, token_revocations.ttl
+    modes = {"db": (0, 0), "cached": (cache_ttl, revocation_ttl)}
+
+    report = {}
+    for mode in args.modes:
+        user_cache.ttl, token_revocations.ttl = modes[mode]
+        await user_cache.clear()
+        # ウォームアップ
+        await run_mode(session_maker, credentials, min(100, args.iterations))
+        report[mode] = await run_mode(session_maker, credentials, args.iterations)
+
+    await engine.dispose()
+
+    print("\n📊 get_current_user 1回あたり")
+    print(f"  {'mode':<8}{'p50 (µs)':>10}{'p99 (µs)':>10}{'mean (µs)':>11}{'SQL/call':>10}")
+    for mode, stats in report.items():
+        print(f"  {mode:<8}{stats['p50_us']:>10}{stats['p99_us']:>10}{stats['mean_us']:>11}{stats['queries_per_call']:>10}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="認証のオーバーヘッドのベンチマーク")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--reset", action="store_true", help="全テーブルを作り直してユーザーを作成する")
+    parser.add_argument("--modes", nargs="+", choices=["db", "cached"], default=["db", "cached"])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", help="結果をJSONで保存するパス")
+    asyncio.run(main(parser.parse_args()))
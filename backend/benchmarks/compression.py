@@ -0,0 +1,108 @@
+"""レスポンス圧縮のベンチマーク（ルートごとの転送量と CPU）
+
+実データのレスポンス本文を取得し、CompressionMiddleware と同じ圧縮器で
+方式・レベルごとに圧縮後のサイズと圧縮にかかる CPU 時間を比べます。
+最後に、アプリ経由（ミドルウェアを通した）のレイテンシを圧縮なし / 設定の方式で比べます。
+
+先に scripts/generate_data.py でデータを投入してください。
+
+使い方:
+    docker compose exec backend python benchmarks/compression.py
+    docker compose exec backend python benchmarks/compression.py --levels gzip:1 gzip:6 br:4 br:11 --repeat 50
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.main import app
+from app.middleware.compression import compressor_factories, negotiate_encoding
+
+PASSWORD = "password123"
+ROUTES = [
+    "/api/v1/logs?limit=100",
+    "/api/v1/logs?limit=100&fields=summary",
+    "/api/v1/logs/search?q=気づき&limit=50",
+    "/api/v1/events?limit=100",
+    "/api/v1/projects?limit=100",
+    "/api/v1/dashboard",
+    "/api/v1/goals",
+]
+DEFAULT_LEVELS = ["gzip:1", "gzip:6", "gzip:9", "br:1", "br:4", "br:6", "br:11"]
+
+
+def compress(encoding: str, level: int, body: bytes) -> bytes:
+    factory = compressor_factories(gzip_level=level, brotli_quality=level)[encoding]
+    compressor = factory()
+    return compressor.compress(body) + compressor.finish()
+
+
+def cpu_ms(run, repeat: int) -> float:
+    """1回あたりの CPU 時間の中央値（ms）"""
+    samples = []
+    for _ in range(repeat):
+        started = time.process_time()
+        run()
+        samples.append((time.process_time() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def latency_ms(client: AsyncClient, path: str, headers: dict, repeat: int) -> float:
+    await client.get(path, headers=headers)
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await client.get(path, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def run(args) -> None:
+    levels = [(name, int(level)) for name, level in (item.split(":") for item in args.levels)]
+    encoding = negotiate_encoding("br, gzip", settings.COMPRESSION_ENCODINGS)
+
+    async with AsyncClient(app=app, base_url="http://bench") as client:
+        response = await client.post("/api/v1/auth/login", data={"username": args.email, "password": PASSWORD})
+        if response.status_code != 200:
+            raise SystemExit(f"{args.email} でログインできません。scripts/generate_data.py でデータを投入してください")
+        auth = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        print(f"\n📊 圧縮後のサイズ（KB）と圧縮の CPU 時間（ms、{args.repeat} 回の中央値）")
+        print(f"  {'route':<42}{'raw KB':>8}" + "".join(f"{f'{name}:{level}':>16}" for name, level in levels))
+        for path in args.routes:
+            response = await client.get(path, headers={**auth, "Accept-Encoding": "identity"})
+            body = response.content
+            cells = []
+            for name, level in levels:
+                size = len(compress(name, level, body))
+                elapsed = cpu_ms(lambda: compress(name, level, body), args.repeat)
+                cells.append(f"{size / 1024:>7.1f} {elapsed:>6.2f}ms")
+            print(f"  {path:<42}{len(body) / 1024:>8.1f}" + "".join(f"{cell:>16}" for cell in cells))
+
+        print(f"\n📊 アプリ経由のレイテンシ（ms、{args.repeat} 回の中央値。{encoding} は設定のレベル）")
+        print(f"  {'route':<42}{'identity':>9}{encoding or '-':>8}")
+        for path in args.routes:
+            identity = await latency_ms(client, path, {**auth, "Accept-Encoding": "identity"}, args.repeat)
+            compressed = await latency_ms(client, path, {**auth, "Accept-Encoding": encoding or "identity"}, args.repeat)
+            print(f"  {path:<42}{identity:>9.1f}{compressed:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="レスポンス圧縮のベンチマーク")
+    parser.add_argument("--routes", nargs="+", default=ROUTES)
+    parser.add_argument("--levels", nargs="+", default=DEFAULT_LEVELS, help="方式:レベル（gzip:1-9 / br:0-11）")
+    parser.add_argument("--email", default="user0@example.com", help="ログインするユーザー")
+    parser.add_argument("--repeat", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""ダッシュボードのクエリ実行方法ベンチマーク
+
+sequential / concurrent / single の3つの実行方法で load_dashboard を繰り返し実行し、
+p50 / p99 レイテンシを比較します。
+
+ベンチマーク用の空のデータベースを指定してください（--reset で全テーブルを作り直します）。
+
+使い方:
+    docker compose exec backend python benchmarks/dashboard_strategies.py --reset
+    docker compose exec backend python benchmarks/dashboard_strategies.py --iterations 1000 --concurrency 20 --json result.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base
+from app.models import *  # noqa: F401,F403 - メタデータに全テーブルを登録
+from app.services.dashboard import STRATEGIES, community_area_cache, load_dashboard
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO users (id, email, hashed_password, full_name, is_active, role, created_at, updated_at)
+    SELECT gen_random_uuid(), 'bench' || i || '@example.com', 'x', 'Bench ' || i, true, 'USER', now(), now()
+    FROM generate_series(1, :users) AS i
+    """,
+    """
+    INSERT INTO goals (id, user_id, title, category, status, progress, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, 'ベンチ目標' || g, 'ACTIVITY',
+           (CASE WHEN g % 3 = 0 THEN 'COMPLETED' ELSE 'ACTIVE' END)::goalstatus,
+           0, now() - g * interval '1 day', now()
+    FROM users u, generate_series(1, :goals_per_user) AS g
+    """,
+    """
+    INSERT INTO logs (id, user_id, title, content, tags, visibility, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, 'ベンチログ' || l, repeat('今日の気づき。', 40), '["ベンチ"]'::jsonb,
+           (CASE WHEN random() < 0.3 THEN 'PUBLIC' ELSE 'PRIVATE' END)::logvisibility,
+           now() - random() * interval '365 days', now()
+    FROM users u, generate_series(1, :logs_per_user) AS l
+    """,
+    """
+    INSERT INTO events (id, owner_id, title, start_date, location_type, tags, status, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, 'ベンチイベント' || e,
+           now() + (random() * 60 - 30) * interval '1 day', 'ONLINE', '[]'::jsonb, 'UPCOMING', now(), now()
+    FROM generate_series(1, :events) AS e
+    JOIN (SELECT id, row_number() OVER () AS rn FROM users) u ON u.rn = (e % :users) + 1
+    """,
+    """
+    INSERT INTO user_point_balances (user_id, balance, updated_at)
+    SELECT id, (random() * 1000)::int, now() FROM users
+    """,
+]
+
+
+def percentile(samples, pct):
+    """サンプルのパーセンタイル（ミリ秒）"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+async def seed(engine, args) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        params = {
+            "users": args.users,
+            "goals_per_user": args.goals_per_user,
+            "logs_per_user": args.logs_per_user,
+            "events": args.events,
+        }
+        for statement in SEED_STATEMENTS:
+            await conn.execute(text(statement), params)
+        await conn.execute(text("ANALYZE"))
+
+
+async def run_strategy(session_maker, user_ids, strategy, iterations, concurrency):
+    """1つの実行方法で iterations 回ダッシュボードを組み立て、各回の所要時間を返す"""
+    samples = []
+    queue = asyncio.Queue()
+    for i in range(iterations):
+        queue.put_nowait(user_ids[i % len(user_ids)])
+
+    async def worker():
+        while not queue.empty():
+            user_id = queue.get_nowait()
+            async with session_maker() as session:
+                started = time.perf_counter()
+                await load_dashboard(session, user_id, strategy)
+                samples.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples
+
+
+async def main(args) -> None:
+    # concurrent は1リクエストで最大5接続使うため、プールを大きめに取る
+    engine = create_async_engine(
+        args.database_url,
+        pool_size=args.concurrency * 5,
+        max_overflow=0,
+    )
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    # 実行方法そのものを比べるため、既定ではコミュニティエリアのキャッシュを使わない
+    if not args.community_cache:
+        community_area_cache.ttl = 0
+
+    if args.reset:
+        print("🌱 ベンチマーク用データを投入中...")
+        await seed(engine, args)
+
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT id FROM users ORDER BY random() LIMIT 500"))
+        user_ids = [row.id for row in result]
+    if not user_ids:
+        raise SystemExit("ユーザーがいません。--reset でデータを投入してください")
+
+    report = {}
+    for strategy in args.strategies:
+        await community_area_cache.clear()
+        # ウォームアップ
+        await run_strategy(session_maker, user_ids, strategy, min(50, args.iterations), args.concurrency)
+        samples = await run_strategy(session_maker, user_ids, strategy, args.iterations, args.concurrency)
+        report[strategy] = {
+            "iterations": len(samples),
+            "p50_ms": round(percentile(samples, 50), 2),
+            "p99_ms": round(percentile(samples, 99), 2),
+            "mean_ms": round(statistics.mean(samples) * 1000, 2),
+        }
+
+    await engine.dispose()
+
+    print(f"\n📊 ダッシュボード（concurrency={args.concurrency}）")
+    print(f"  {'strategy':<12}{'p50 (ms)':>10}{'p99 (ms)':>10}{'mean (ms)':>11}")
+    for strategy, stats in report.items():
+        print(f"  {strategy:<12}{stats['p50_ms']:>10}{stats['p99_ms']:>10}{stats['mean_ms']:>11}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ダッシュボードのクエリ実行方法ベンチマーク")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--reset", action="store_true", help="全テーブルを作り直してデータを投入する")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--goals-per-user", type=int, default=5)
+    parser.add_argument("--logs-per-user", type=int, default=20)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--community-cache", action="store_true", help="コミュニティエリアのキャッシュを有効にする")
+    parser.add_argument("--json", help="結果をJSONで保存するパス")
+    asyncio.run(main(parser.parse_args()))
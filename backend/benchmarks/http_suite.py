@@ -0,0 +1,311 @@
+"""v1 API の HTTP ベンチマーク
+
+シナリオ（benchmarks/scenarios.py）ごとに仮想ユーザーを並行して動かし、
+ルートごとの RPS と p50 / p95 / p99 を測って JSON のレポートにします。
+コミットごとのレポートを diff で比べると、遅くなったルートを検出できます。
+
+アプリはプロセス内（ASGI）で動かし、DATABASE_URL のデータベースを使います
+（レイテンシにはクライアント側の処理も含まれるので、比べるのは同じ環境のレポート同士にしてください）。
+先に scripts/generate_data.py でデータを投入してください。仮想ユーザーは生成された
+user{N}@example.com（パスワード password123）でログインします。
+
+使い方:
+    docker compose exec backend python benchmarks/http_suite.py run --json before.json
+    docker compose exec backend python benchmarks/http_suite.py run --scenarios dashboard log_timeline --concurrency 20
+    docker compose exec backend python benchmarks/http_suite.py diff before.json after.json --threshold 0.1
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from httpx import AsyncClient, Response
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+from app.main import app
+from scenarios import SCENARIOS
+
+PASSWORD = "password123"
+
+
+def percentile(samples, pct):
+    """サンプルのパーセンタイル（ミリ秒）"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+class RouteStats:
+    """ルートごとのレイテンシとステータス"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self.errors = 0
+        self.statuses: Counter = Counter()
+
+    def summary(self, elapsed: float) -> dict:
+        return {
+            "requests": len(self.samples),
+            "errors": self.errors,
+            "rps": round(len(self.samples) / elapsed, 1),
+            "p50_ms": round(percentile(self.samples, 50), 2),
+            "p95_ms": round(percentile(self.samples, 95), 2),
+            "p99_ms": round(percentile(self.samples, 99), 2),
+            "mean_ms": round(statistics.mean(self.samples) * 1000, 2),
+            "statuses": {str(code): count for code, count in sorted(self.statuses.items())},
+        }
+
+
+class VirtualUser:
+    """1人分の利用者（ログイン済みのクライアント）"""
+
+    def __init__(self, client: AsyncClient, routes: Dict[str, RouteStats], seen: Set[str], email: str, seed: int):
+        self.client = client
+        self.routes = routes
+        # 準備・片付けも含めて送ったルート（カバレッジの確認用）
+        self.seen = seen
+        self.email = email
+        self.password = PASSWORD
+        self.rng = random.Random(seed)
+        self.recording = False
+        self.access_token: Optional[str] = None
+        self.user_id: Optional[str] = None
+        # シナリオが使う値（setup で作ったプロジェクトなど）
+        self.state: dict = {}
+
+    async def sign_in(self) -> None:
+        response = await self.client.post("/api/v1/auth/login", data={"username": self.email, "password": self.password})
+        if response.status_code != 200:
+            raise SystemExit(f"{self.email} でログインできません（{response.status_code}）。scripts/generate_data.py でデータを投入してください")
+        self.access_token = response.json()["access_token"]
+        me = await self.client.get("/api/v1/auth/me", headers={"Authorization": f"Bearer {self.access_token}"})
+        self.user_id = me.json()["id"]
+
+    async def request(
+        self,
+        method: str,
+        route: str,
+        path: Optional[dict] = None,
+        expected=(200,),
+        auth: bool = True,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> Response:
+        """route（テンプレート）に path を埋めて送り、テンプレートごとに記録する"""
+        headers = dict(headers or {})
+        if auth:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        started = time.perf_counter()
+        response = await self.client.request(method, route.format(**(path or {})), headers=headers, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        self.seen.add(f"{method} {route}")
+        if self.recording:
+            stats = self.routes[f"{method} {route}"]
+            stats.samples.append(elapsed)
+            stats.statuses[response.status_code] += 1
+            if response.status_code not in expected:
+                stats.errors += 1
+        return response
+
+
+async def run_scenario(client: AsyncClient, name: str, args, seen: Set[str]) -> dict:
+    """仮想ユーザーを concurrency 人動かし、ウォームアップ後の duration 秒を計測する"""
+    scenario, setup, teardown = SCENARIOS[name]
+    routes: Dict[str, RouteStats] = defaultdict(RouteStats)
+    vus = [
+        VirtualUser(client, routes, seen, f"user{args.user_offset + i}@example.com", seed=args.seed * 1000 + i)
+        for i in range(args.concurrency)
+    ]
+    for vu in vus:
+        await vu.sign_in()
+        if setup:
+            await setup(vu)
+
+    stop = asyncio.Event()
+    iterations = Counter()
+
+    async def loop(vu: VirtualUser):
+        while not stop.is_set():
+            try:
+                await scenario(vu)
+            except Exception:
+                # 想定外のレスポンス（本文の形が違うなど）。エラーのステータスは request で記録済み
+                iterations["failed"] += 1
+            else:
+                iterations["ok"] += 1 if vu.recording else 0
+
+    tasks = [asyncio.ensure_future(loop(vu)) for vu in vus]
+    await asyncio.sleep(args.warmup)
+    for vu in vus:
+        vu.recording = True
+    started = time.perf_counter()
+    await asyncio.sleep(args.duration)
+    for vu in vus:
+        vu.recording = False
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    if teardown:
+        for vu in vus:
+            await teardown(vu)
+
+    requests = sum(len(stats.samples) for stats in routes.values())
+    return {
+        "iterations": iterations["ok"],
+        "failed_iterations": iterations["failed"],
+        "requests": requests,
+        "errors": sum(stats.errors for stats in routes.values()),
+        "rps": round(requests / elapsed, 1),
+        "routes": {route: routes[route].summary(elapsed) for route in sorted(routes)},
+    }
+
+
+def v1_routes() -> List[str]:
+    """アプリの v1 ルート（"GET /api/v1/logs" の形）"""
+    routes = []
+    for route in app.routes:
+        if getattr(route, "methods", None) and route.path.startswith(settings.API_V1_PREFIX):
+            routes.extend(f"{method} {route.path}" for method in sorted(route.methods - {"HEAD"}))
+    return sorted(routes)
+
+
+def git_revision() -> dict:
+    def git(*command) -> str:
+        try:
+            return subprocess.run(["git", *command], capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+async def dataset_size() -> dict:
+    """比べるレポートが同じ規模のデータか確かめるための件数（統計情報の推定値）"""
+    async with engine.connect() as conn:
+        result = await conn.execute(text("""
+            SELECT relname, reltuples::bigint FROM pg_class
+            WHERE relname IN ('users', 'logs', 'events', 'projects', 'points') ORDER BY relname
+        """))
+        return {name: count for name, count in result}
+
+
+async def run(args) -> None:
+    report = {
+        "meta": {
+            **git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "params": {
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "warmup": args.warmup,
+                "seed": args.seed,
+            },
+            "dataset": await dataset_size(),
+        },
+        "scenarios": {},
+    }
+
+    seen: Set[str] = set()
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(app=app, base_url="http://bench") as client:
+            for name in args.scenarios:
+                print(f"🏃 {name}（{args.concurrency}人 × {args.duration:g}秒）...")
+                report["scenarios"][name] = await run_scenario(client, name, args, seen)
+    await engine.dispose()
+
+    report["uncovered_routes"] = [route for route in v1_routes() if route not in seen]
+
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+def print_report(report: dict) -> None:
+    for name, scenario in report["scenarios"].items():
+        print(f"\n📊 {name}: {scenario['rps']} req/s, {scenario['iterations']} 回, エラー {scenario['errors']}")
+        print(f"  {'route':<52}{'req/s':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'err':>6}")
+        for route, stats in scenario["routes"].items():
+            print(
+                f"  {route:<52}{stats['rps']:>8}{stats['p50_ms']:>9}{stats['p95_ms']:>9}"
+                f"{stats['p99_ms']:>9}{stats['errors']:>6}"
+            )
+    if report.get("uncovered_routes"):
+        print(f"\n⚠️  計測していないルート: {', '.join(report['uncovered_routes'])}")
+
+
+def diff(args) -> int:
+    """2つのレポートのルートごとの p95・RPS を比べ、悪化したルートがあれば 1 を返す"""
+    before = json.loads(Path(args.before).read_text())
+    after = json.loads(Path(args.after).read_text())
+
+    if before["meta"].get("dataset") != after["meta"].get("dataset"):
+        print("⚠️  データの件数が異なります（同じ条件で生成したデータで比べてください）")
+
+    regressions = []
+    print(f"  {'scenario / route':<64}{'p95 before':>12}{'after':>9}{'change':>9}{'rps change':>12}")
+    for name, scenario in after["scenarios"].items():
+        for route, stats in scenario["routes"].items():
+            base = before["scenarios"].get(name, {}).get("routes", {}).get(route)
+            if base is None:
+                print(f"  {name + ' ' + route:<64}{'-':>12}{stats['p95_ms']:>9}{'new':>9}")
+                continue
+
+            p95_change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+            rps_change = (stats["rps"] - base["rps"]) / base["rps"] if base["rps"] else 0.0
+            slower = p95_change > args.threshold and stats["p95_ms"] - base["p95_ms"] > args.min_ms
+            failing = stats["errors"] > base["errors"]
+            mark = " ❌" if slower or failing else ""
+            if mark:
+                regressions.append(f"{name} {route}")
+            print(
+                f"  {name + ' ' + route:<64}{base['p95_ms']:>12}{stats['p95_ms']:>9}"
+                f"{p95_change:>+9.0%}{rps_change:>+12.0%}{mark}"
+            )
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} ルートが悪化しました（p95 +{args.threshold:.0%} かつ +{args.min_ms}ms 超、またはエラー増）")
+        return 1
+    print("\n✅ 悪化したルートはありません")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="v1 API の HTTP ベンチマーク")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="シナリオを実行してレポートを作る")
+    run_parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    run_parser.add_argument("--concurrency", type=int, default=10, help="シナリオごとの仮想ユーザー数")
+    run_parser.add_argument("--duration", type=float, default=15.0, help="各シナリオの計測時間（秒）")
+    run_parser.add_argument("--warmup", type=float, default=3.0, help="計測前のウォームアップ（秒）")
+    run_parser.add_argument("--user-offset", type=int, default=0, help="仮想ユーザーに使う user{N} の開始番号")
+    run_parser.add_argument("--seed", type=int, default=1, help="シナリオの乱数のシード")
+    run_parser.add_argument("--json", help="レポートを保存するパス")
+
+    diff_parser = subparsers.add_parser("diff", help="2つのレポートを比べる")
+    diff_parser.add_argument("before")
+    diff_parser.add_argument("after")
+    diff_parser.add_argument("--threshold", type=float, default=0.1, help="悪化とみなす p95 の増加率")
+    diff_parser.add_argument("--min-ms", type=float, default=1.0, help="悪化とみなす p95 の最小の増加（ミリ秒）")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        asyncio.run(run(args))
+    else:
+        sys.exit(diff(args))
@@ -0,0 +1,114 @@
+"""JWT 検証のマイクロベンチマーク
+
+1コアで1秒あたりに検証できるトークン数を、鍵の扱い・アルゴリズムごとに比べます。
+
+- hs256-raw: 毎回 SECRET_KEY の文字列を渡す（鍵の解釈を毎回行う）
+- hs256 / rs256 / es256: 読み込み済みの鍵で検証する
+- cached: 検証済みトークンのキャッシュ（VerifiedTokenCache）に当たる場合
+
+データベースは使いません。
+
+使い方:
+    docker compose exec backend python benchmarks/jwt_verify.py
+    docker compose exec backend python benchmarks/jwt_verify.py --duration 3 --json result.json
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwk, jwt
+
+from app.core.security import VerifiedTokenCache
+
+SECRET = "benchmark-secret-key"
+CASES = ["hs256-raw", "hs256", "rs256", "es256", "cached"]
+
+
+def _pem(private_key) -> str:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+def build_case(name):
+    """(トークン, 検証関数) を作る"""
+    claims = {"sub": "123e4567-e89b-12d3-a456-426614174000", "ver": 0, "exp": datetime.utcnow() + timedelta(hours=1)}
+
+    if name == "hs256-raw":
+        token = jwt.encode(claims, SECRET, algorithm="HS256")
+        return token, lambda: jwt.decode(token, SECRET, algorithms=["HS256"])
+
+    if name in ("hs256", "cached"):
+        key = jwk.construct(SECRET, "HS256")
+        token = jwt.encode(claims, key, algorithm="HS256")
+        if name == "hs256":
+            return token, lambda: jwt.decode(token, key, algorithms=["HS256"])
+
+        cache = VerifiedTokenCache(max_size=10000)
+        cache.put(token, jwt.decode(token, key, algorithms=["HS256"]))
+        return token, lambda: cache.get(token)
+
+    if name == "rs256":
+        private_key = jwk.construct(_pem(rsa.generate_private_key(public_exponent=65537, key_size=2048)), "RS256")
+        algorithm = "RS256"
+    else:
+        private_key = jwk.construct(_pem(ec.generate_private_key(ec.SECP256R1())), "ES256")
+        algorithm = "ES256"
+    public_key = private_key.public_key()
+    token = jwt.encode(claims, private_key, algorithm=algorithm)
+    return token, lambda: jwt.decode(token, public_key, algorithms=[algorithm])
+
+
+def measure(verify, duration) -> dict:
+    """duration 秒の間 verify を繰り返し、1秒あたりの回数を返す"""
+    # ウォームアップ
+    for _ in range(100):
+        verify()
+
+    count = 0
+    started = time.perf_counter()
+    deadline = started + duration
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            verify()
+        count += 100
+    elapsed = time.perf_counter() - started
+
+    return {
+        "verified": count,
+        "per_second": round(count / elapsed),
+        "us_per_token": round(elapsed / count * 1_000_000, 2),
+    }
+
+
+def main(args) -> None:
+    report = {}
+    for name in args.cases:
+        _, verify = build_case(name)
+        report[name] = measure(verify, args.duration)
+
+    print("\n📊 JWT 検証（1コア）")
+    print(f"  {'case':<11}{'tokens/s':>12}{'µs/token':>11}")
+    for name, stats in report.items():
+        print(f"  {name:<11}{stats['per_second']:>12}{stats['us_per_token']:>11}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JWT 検証のマイクロベンチマーク")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--duration", type=float, default=2.0, help="各ケースの計測時間（秒）")
+    parser.add_argument("--json", help="結果をJSONで保存するパス")
+    main(parser.parse_args())
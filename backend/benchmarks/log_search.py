@@ -0,0 +1,120 @@
+"""ログ検索のベンチマーク（バイグラムの全文検索インデックスと ILIKE の比較）
+
+GET /logs/search と同じ検索（app.services.log_search: 自分のログ OR 公開ログ、新しい一致の中で関連度順の上位 limit 件）と、
+インデックスを使わない ILIKE '%語%'（作成日時の降順）を検索語ごとに繰り返し実行し、
+一致件数とレイテンシの中央値・p95 を比べます。
+
+先に scripts/generate_data.py でデータを投入してください（本文は generate_data の WORDS から作られます）。
+
+使い方:
+    docker compose exec backend python benchmarks/log_search.py
+    docker compose exec backend python benchmarks/log_search.py --terms 気づき "畑 収穫" --repeat 20
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, or_, select
+
+from app.core.database import AsyncSessionLocal
+from app.core.search import search_query, search_terms
+from app.models.log import Log, LogVisibility
+from app.models.user import User
+from app.services.log_search import find_candidates
+
+# よく出る語・ほどほどの語・まれな語（本文中の隣り合う語）・1文字・複数語・出てこない語
+DEFAULT_TERMS = ["今日", "気づき", "ワークショップ", "発見今日", "海", "畑 収穫", "古民家サウナ"]
+
+
+def visible(user_id):
+    return or_(Log.user_id == user_id, Log.visibility == LogVisibility.PUBLIC)
+
+
+def match_count_query(user_id, terms):
+    """一致件数（候補の上限を付けずに数える）"""
+    return select(func.count()).where(visible(user_id), Log.search_vector.bool_op("@@")(search_query(terms)))
+
+
+def ilike_conditions(terms):
+    return [or_(Log.title.ilike(f"%{term}%"), Log.content.ilike(f"%{term}%")) for term in terms]
+
+
+def ilike_query(user_id, terms, limit):
+    return (
+        select(Log.id)
+        .where(visible(user_id), *ilike_conditions(terms))
+        .order_by(Log.created_at.desc(), Log.id.desc())
+        .limit(limit)
+    )
+
+
+def ilike_count_query(user_id, terms):
+    return select(func.count()).where(visible(user_id), *ilike_conditions(terms))
+
+
+async def measure(run_once, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run_once()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))],
+    }
+
+
+async def run(args) -> None:
+    async with AsyncSessionLocal() as db:
+        total = (await db.execute(select(func.count()).select_from(Log))).scalar()
+        user_id = (await db.execute(select(User.id).where(User.email == args.email))).scalar()
+        if user_id is None:
+            raise SystemExit(f"{args.email} がいません。scripts/generate_data.py でデータを投入してください")
+        print(f"logs: {total:,} 件 / {args.email} / limit {args.limit} / {args.repeat} 回\n")
+        print(f"{'term':<16} {'matches':>9} {'fulltext p50':>13} {'p95':>9} {'ilike p50':>11} {'p95':>9} {'speedup':>8}")
+
+        for q in args.terms:
+            terms = search_terms(q)
+            async def fulltext():
+                candidates = await find_candidates(db, visible(user_id), terms)
+                return sorted(candidates, key=lambda candidate: candidate.rank, reverse=True)[:args.limit]
+
+            async def ilike():
+                return (await db.execute(ilike_query(user_id, terms, args.limit))).all()
+
+            matches = (await db.execute(match_count_query(user_id, terms))).scalar()
+            ilike_matches = (await db.execute(ilike_count_query(user_id, terms))).scalar()
+            if matches != ilike_matches:
+                print(f"⚠️  {q}: 一致件数が ILIKE と違います（{matches} / {ilike_matches}）")
+
+            # 1回目はキャッシュの温め
+            await measure(fulltext, 1)
+            await measure(ilike, 1)
+            fulltext_stats = await measure(fulltext, args.repeat)
+            ilike_stats = await measure(ilike, args.repeat)
+
+            print(
+                f"{q:<16} {matches:>9,} {fulltext_stats['p50_ms']:>13.1f} {fulltext_stats['p95_ms']:>9.1f} "
+                f"{ilike_stats['p50_ms']:>11.1f} {ilike_stats['p95_ms']:>9.1f} "
+                f"{ilike_stats['p50_ms'] / fulltext_stats['p50_ms']:>7.1f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ログ検索のベンチマーク（全文検索インデックス vs ILIKE）")
+    parser.add_argument("--terms", nargs="+", default=DEFAULT_TERMS, help="検索語（空白区切りで AND）")
+    parser.add_argument("--email", default="user0@example.com", help="検索するユーザー")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""HTTP ベンチマーク（http_suite.py）のシナリオ
+
+シナリオは仮想ユーザー（VirtualUser）1人分の操作を1回分行う非同期関数です。
+setup があれば計測の前に1回だけ呼びます。
+
+リクエストは vu.request(メソッド, ルートのテンプレート, path=パスパラメータ, ...) で送ります。
+集計はテンプレート（"GET /api/v1/logs/{log_id}" など）ごとに行います。
+expected に含まれないステータスはエラーとして数えます。
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+TAGS = ["読書会", "農業", "地域", "写真", "食", "環境"]
+SEARCH_TERMS = ["気づき", "収穫", "ワークショップ", "海", "読書 仲間"]
+
+
+async def login(vu) -> None:
+    """ログイン・トークンの更新・ログアウト（10回に1回は新規登録）"""
+    if vu.rng.random() < 0.1:
+        await vu.request(
+            "POST", "/api/v1/auth/register", expected=(201,),
+            json={"email": f"bench-{uuid.UUID(int=vu.rng.getrandbits(128))}@example.com", "password": "password123"},
+        )
+
+    response = await vu.request(
+        "POST", "/api/v1/auth/login", auth=False,
+        data={"username": vu.email, "password": vu.password},
+    )
+    if response.status_code != 200:
+        return
+    tokens = response.json()
+    await vu.request("GET", "/api/v1/auth/me", headers={"Authorization": f"Bearer {tokens['access_token']}"}, auth=False)
+
+    response = await vu.request(
+        "POST", "/api/v1/auth/refresh", auth=False, json={"refresh_token": tokens["refresh_token"]},
+    )
+    if response.status_code == 200:
+        await vu.request(
+            "POST", "/api/v1/auth/logout", expected=(204,),
+            json={"refresh_token": response.json()["refresh_token"]},
+        )
+
+
+async def dashboard(vu) -> None:
+    """ダッシュボードを開いたときに読むもの"""
+    await vu.request("GET", "/api/v1/dashboard")
+    await vu.request("GET", "/api/v1/users/me/points")
+    await vu.request("GET", "/api/v1/users/me/points/history")
+    await vu.request("GET", "/api/v1/users/me/points/series", params={"granularity": vu.rng.choice(["day", "week"])})
+    await vu.request("GET", "/api/v1/leaderboards/{period}", path={"period": vu.rng.choice(["all", "month", "week"])})
+    await vu.request("GET", "/api/v1/tags", params={"source": vu.rng.choice(["logs", "events", "projects"])})
+
+
+async def log_timeline(vu) -> None:
+    """ログの一覧をたどって読み、5回に1回は検索・書く"""
+    params = {"limit": 20}
+    if vu.rng.random() < 0.3:
+        params["tags"] = vu.rng.choice(TAGS)
+    page = None
+    for _ in range(vu.rng.randint(1, 3)):
+        response = await vu.request("GET", "/api/v1/logs", params=params)
+        page = response.json()
+        if not page.get("next_cursor"):
+            break
+        params = {**params, "cursor": page["next_cursor"]}
+
+    if page and page.get("items"):
+        log = vu.rng.choice(page["items"])
+        await vu.request("GET", "/api/v1/logs/{log_id}", path={"log_id": log["id"]})
+
+    if vu.rng.random() < 0.2:
+        await vu.request("GET", "/api/v1/logs/search", params={"q": vu.rng.choice(SEARCH_TERMS)})
+
+    if vu.rng.random() < 0.2:
+        response = await vu.request(
+            "POST", "/api/v1/logs", expected=(201,),
+            json={"title": "ベンチマーク", "content": "今日の気づき", "tags": [vu.rng.choice(TAGS)], "visibility": "public"},
+        )
+        if response.status_code == 201:
+            log_id = response.json()["id"]
+            await vu.request("PATCH", "/api/v1/logs/{log_id}", path={"log_id": log_id}, json={"content": "追記しました"})
+            await vu.request("DELETE", "/api/v1/logs/{log_id}", path={"log_id": log_id}, expected=(204,))
+
+
+async def event_join(vu) -> None:
+    """イベントを探して参加・離脱する（10回に1回は主催する）"""
+    response = await vu.request("GET", "/api/v1/events", params={"limit": 20})
+    events = response.json().get("items", [])
+    if events:
+        event_id = vu.rng.choice(events)["id"]
+        await vu.request("GET", "/api/v1/events/{event_id}", path={"event_id": event_id})
+        await vu.request("POST", "/api/v1/events/{event_id}/join", path={"event_id": event_id}, expected=(200, 400))
+        await vu.request("GET", "/api/v1/events/{event_id}/participants", path={"event_id": event_id})
+        await vu.request("DELETE", "/api/v1/events/{event_id}/leave", path={"event_id": event_id}, expected=(204, 404))
+
+    if vu.rng.random() < 0.1:
+        start_date = datetime.now(timezone.utc) + timedelta(days=vu.rng.randint(1, 30))
+        response = await vu.request(
+            "POST", "/api/v1/events", expected=(201,),
+            json={"title": "ベンチマーク会", "start_date": start_date.isoformat(), "location_type": "online", "tags": [vu.rng.choice(TAGS)]},
+        )
+        if response.status_code == 201:
+            event_id = response.json()["id"]
+            await vu.request("PATCH", "/api/v1/events/{event_id}", path={"event_id": event_id}, json={"max_attendees": 20})
+            await vu.request("DELETE", "/api/v1/events/{event_id}", path={"event_id": event_id}, expected=(204,))
+
+
+async def project_tasks_setup(vu) -> None:
+    """タスクを回すための自分のプロジェクトを作る"""
+    response = await vu.request(
+        "POST", "/api/v1/projects", expected=(201,),
+        json={
+            "title": "ベンチマークプロジェクト",
+            "category": vu.rng.choice(["asoto", "asobi"]),
+            "start_date": datetime.now(timezone.utc).isoformat(),
+            "location_type": "online",
+        },
+    )
+    vu.state["project_id"] = response.json()["id"]
+
+
+async def project_tasks(vu) -> None:
+    """自分のプロジェクトのタスクを作って進めて消す。ほかのプロジェクトも眺める"""
+    project_id = vu.state["project_id"]
+    await vu.request("GET", "/api/v1/projects/{project_id}", path={"project_id": project_id})
+
+    response = await vu.request(
+        "POST", "/api/v1/projects/{project_id}/tasks", path={"project_id": project_id}, expected=(201,),
+        json={"title": "タスク", "assignee_id": vu.user_id},
+    )
+    if response.status_code == 201:
+        path = {"project_id": project_id, "task_id": response.json()["id"]}
+        for task_status in ("in_progress", "done"):
+            await vu.request("PATCH", "/api/v1/projects/{project_id}/tasks/{task_id}", path=path, json={"status": task_status})
+        await vu.request("DELETE", "/api/v1/projects/{project_id}/tasks/{task_id}", path=path, expected=(204,))
+
+    if vu.rng.random() < 0.2:
+        await vu.request("PATCH", "/api/v1/projects/{project_id}", path={"project_id": project_id}, json={"frequency": "週1回"})
+
+    response = await vu.request("GET", "/api/v1/projects", params={"limit": 20})
+    projects = response.json().get("items", [])
+    if projects:
+        other_id = vu.rng.choice(projects)["id"]
+        await vu.request("GET", "/api/v1/projects/{project_id}/leaderboard", path={"project_id": other_id})
+        if vu.rng.random() < 0.1:
+            await vu.request("POST", "/api/v1/projects/{project_id}/join", path={"project_id": other_id}, expected=(200, 400))
+
+
+async def project_tasks_teardown(vu) -> None:
+    await vu.request(
+        "DELETE", "/api/v1/projects/{project_id}", path={"project_id": vu.state["project_id"]}, expected=(204,),
+    )
+
+
+async def goals(vu) -> None:
+    """目標とステップを作って完了させ、片付ける"""
+    await vu.request("GET", "/api/v1/goals")
+    response = await vu.request(
+        "POST", "/api/v1/goals", expected=(201,), json={"title": "ベンチマーク目標", "category": "activity"},
+    )
+    if response.status_code != 201:
+        return
+    goal_id = response.json()["id"]
+
+    step_ids = []
+    for order in range(3):
+        response = await vu.request(
+            "POST", "/api/v1/goals/{goal_id}/steps", path={"goal_id": goal_id}, expected=(201,),
+            json={"title": f"ステップ{order + 1}", "order": order},
+        )
+        if response.status_code == 201:
+            step_ids.append(response.json()["id"])
+
+    if step_ids:
+        await vu.request("PATCH", "/api/v1/steps/{step_id}", path={"step_id": step_ids[0]}, json={"notes": "メモ"})
+        await vu.request("POST", "/api/v1/steps/{step_id}/complete", path={"step_id": step_ids[0]})
+        await vu.request("DELETE", "/api/v1/steps/{step_id}", path={"step_id": step_ids[-1]}, expected=(204,))
+
+    await vu.request("GET", "/api/v1/goals/{goal_id}", path={"goal_id": goal_id})
+    await vu.request("PATCH", "/api/v1/goals/{goal_id}", path={"goal_id": goal_id}, json={"description": "更新"})
+    await vu.request("DELETE", "/api/v1/goals/{goal_id}", path={"goal_id": goal_id}, expected=(204,))
+
+
+async def profile(vu) -> None:
+    """プロフィールを読んで更新する"""
+    await vu.request("GET", "/api/v1/users/me/profile", expected=(200, 404))
+    await vu.request("PATCH", "/api/v1/users/me/profile", json={"bio": "ベンチマーク中"})
+    await vu.request("GET", "/api/v1/users/{user_id}/profile", path={"user_id": vu.user_id})
+
+
+# 名前: (1回分の操作, 計測前の準備, 計測後の片付け)
+SCENARIOS = {
+    "login": (login, None, None),
+    "dashboard": (dashboard, None, None),
+    "log_timeline": (log_timeline, None, None),
+    "event_join": (event_join, None, None),
+    "project_tasks": (project_tasks, project_tasks_setup, project_tasks_teardown),
+    "goals": (goals, None, None),
+    "profile": (profile, None, None),
+}
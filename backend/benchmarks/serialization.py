@@ -0,0 +1,112 @@
+"""レスポンスの JSON 化のマイクロベンチマーク
+
+ログ1000件（ORM のオブジェクト）を GET /logs と同じ型でレスポンスにする時間を比べます。
+
+- default: FastAPI の既定（response_model で検証 → dict に変換 → 標準の json）
+- orjson: 検証と dict への変換は同じで、エンコードだけ ORJSONResponse
+- model_response: app.core.responses.model_response（検証1回 → pydantic-core で直接 JSON）
+
+出力の JSON が同じであることも確かめます。データベースは使いません。
+
+使い方:
+    docker compose exec backend python benchmarks/serialization.py
+    docker compose exec backend python benchmarks/serialization.py --rows 100 --repeat 200
+"""
+import argparse
+import asyncio
+import gc
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Union
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.responses import model_response
+from app.models.log import Log, LogVisibility
+from app.schemas.log import LogPage, LogResponse
+
+CASES = ["default", "orjson", "model_response"]
+
+
+def build_logs(count: int) -> List[Log]:
+    """データベースに入れないログ（generate_data と同じくらいの長さの本文）"""
+    user_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    return [
+        Log(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            title=f"今日の振り返り {i}",
+            content="今日は畑で収穫のワークショップに参加した。新しい気づきがあった。\n" * 6,
+            tags=["農業", "ワークショップ"],
+            visibility=LogVisibility.PUBLIC,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+def build_case(name, logs, loop):
+    """1回分のレスポンスの本文を作る関数"""
+    # GET /logs の response_model
+    field = create_response_field(name="response", type_=Union[LogPage, List[LogResponse]], mode="serialization")
+
+    if name == "model_response":
+        return lambda: model_response(List[LogResponse], logs).body
+
+    response_class = JSONResponse if name == "default" else ORJSONResponse
+
+    def render():
+        content = loop.run_until_complete(serialize_response(field=field, response_content=logs))
+        return response_class(content).body
+    return render
+
+
+def measure(render, repeat: int) -> dict:
+    render()  # ウォームアップ
+    samples = []
+    for _ in range(repeat):
+        gc.collect()  # 前の回のゴミの回収を計測に含めない
+        started = time.perf_counter()
+        render()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"p50_ms": statistics.median(samples), "min_ms": min(samples)}
+
+
+def main(args) -> None:
+    logs = build_logs(args.rows)
+    loop = asyncio.new_event_loop()
+    renders = {name: build_case(name, logs, loop) for name in args.cases}
+
+    bodies = {name: json.loads(render()) for name, render in renders.items()}
+    expected = next(iter(bodies.values()))
+    for name, body in bodies.items():
+        if body != expected:
+            print(f"⚠️  {name}: 出力の JSON が違います")
+
+    print(f"\n📊 ログ {args.rows} 件のレスポンス化（{args.repeat} 回）")
+    print(f"  {'case':<16}{'p50 ms':>9}{'min ms':>9}{'speedup':>9}")
+    baseline = None
+    for name, render in renders.items():
+        stats = measure(render, args.repeat)
+        baseline = baseline or stats["p50_ms"]
+        print(f"  {name:<16}{stats['p50_ms']:>9.2f}{stats['min_ms']:>9.2f}{baseline / stats['p50_ms']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="レスポンスの JSON 化のマイクロベンチマーク")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    main(parser.parse_args())
@@ -0,0 +1,67 @@
+"""ポイントの期間別集計（point_rollups）の作成スクリプト
+
+既存の points から日別・週別の集計を作り直します。
+ユーザーID順に --batch-size 人ずつ別々のトランザクションで処理し、
+テーブルはロックしません（処理中のユーザーのポイント反映だけを待たせます）。
+途中で止めた場合は --after に最後に表示されたユーザーIDを渡すと続きから再開できます。
+
+使い方:
+    docker compose exec backend python scripts/backfill_point_rollups.py
+    docker compose exec backend python scripts/backfill_point_rollups.py --batch-size 200 --after <user_id>
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+from uuid import UUID
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.models.user_point_balance import UserPointBalance
+from app.services.point_rollups import rebuild_point_rollups
+
+
+async def backfill(batch_size: int, after: Optional[UUID]) -> int:
+    """ユーザーをバッチに分けて集計を作り直す"""
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    users = 0
+    started = time.perf_counter()
+    while True:
+        async with async_session() as session:
+            # ポイントを持つユーザーは user_point_balances に1行ずつある
+            query = select(UserPointBalance.user_id).order_by(UserPointBalance.user_id).limit(batch_size)
+            if after is not None:
+                query = query.where(UserPointBalance.user_id > after)
+            user_ids = (await session.execute(query)).scalars().all()
+            if not user_ids:
+                break
+
+            await rebuild_point_rollups(session, user_ids)
+            await session.commit()
+
+        users += len(user_ids)
+        after = user_ids[-1]
+        print(f"  {users}人 ... {after}")
+
+    await engine.dispose()
+
+    print(f"✅ {users}人の集計を作成しました（{time.perf_counter() - started:.1f}秒）")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ポイントの期間別集計の作成")
+    parser.add_argument("--batch-size", type=int, default=500, help="1トランザクションで処理するユーザー数")
+    parser.add_argument("--after", type=UUID, help="このユーザーIDより後から再開する")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(backfill(args.batch_size, args.after)))
@@ -0,0 +1,380 @@
+"""ベンチマーク用の大量データ生成スクリプト
+
+ユーザー数などを指定して、本番規模のデータを COPY でまとめて投入します。
+同じ --seed なら同じデータになります（UUID・日時を含めて再現可能。基準日時は --now）。
+
+- ユーザーの活動量はパレート分布で偏らせます（一部のユーザーがログ・参加の大半を占める）
+- 日時は直近ほど多くなるように --days 日の範囲で分布させます
+- タグ・本文の単語は Zipf 分布で選びます
+- points は付与ルール（app.services.point_rules）どおりに作り、残高・ランキング・
+  期間別集計は投入後に points から作り直します
+
+マイグレーション済みのデータベースを指定してください（--truncate で既存のデータを全削除します）。
+
+使い方:
+    docker compose exec backend python scripts/generate_data.py --truncate
+    docker compose exec backend python scripts/generate_data.py --truncate --users 50000 --seed 7
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+import asyncpg
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.models.user_point_balance import UserPointBalance
+from app.services.leaderboards import rebuild_leaderboards
+from app.services.point_rollups import rebuild_point_rollups
+from app.services.point_rules import day_start, point_rule_engine
+from app.services.points import reconcile_balances
+
+TAGS = [
+    "読書会", "農業", "地域", "写真", "食", "環境", "アート", "音楽", "旅", "子育て",
+    "プログラミング", "デザイン", "キャンプ", "料理", "ヨガ", "映画", "哲学", "ボランティア",
+    "教育", "ランニング", "釣り", "陶芸", "古民家", "DIY", "サウナ", "登山", "茶道", "落語",
+]
+SKILLS = ["農業", "写真撮影", "ライティング", "デザイン", "Python", "React", "イベント企画", "料理", "大工仕事", "動画編集"]
+WORDS = [
+    "今日", "は", "朝", "から", "畑", "に", "行って", "みんな", "と", "一緒", "収穫", "した",
+    "読書", "会", "で", "新しい", "気づき", "が", "あった", "地域", "の", "人", "話", "を", "聞いた",
+    "写真", "撮影", "散歩", "海", "山", "川", "イベント", "準備", "ワークショップ", "参加",
+    "楽しかった", "次回", "も", "ぜひ", "やりたい", "振り返り", "目標", "ステップ", "進んだ",
+    "小さな", "一歩", "仲間", "感謝", "学び", "挑戦", "料理", "野菜", "季節", "自然", "発見",
+]
+LOCATION_TYPES = ["ONLINE", "OFFLINE", "HYBRID"]
+
+
+def zipf_weights(n: int) -> List[float]:
+    """先頭ほど選ばれやすい累積重み（random.choices の cum_weights）"""
+    return list(accumulate(1 / (rank + 1) for rank in range(n)))
+
+
+TAG_WEIGHTS = zipf_weights(len(TAGS))
+WORD_WEIGHTS = zipf_weights(len(WORDS))
+
+
+class TableWriter:
+    """レコードをためて COPY でまとめて書き込む"""
+
+    def __init__(self, conn: asyncpg.Connection, table: str, columns: Sequence[str], batch_size: int,
+                 parents: Sequence["TableWriter"] = ()):
+        self.conn = conn
+        self.table = table
+        self.columns = list(columns)
+        self.batch_size = batch_size
+        # 外部キーの参照先（先に書き込む）
+        self.parents = list(parents)
+        self.records: List[tuple] = []
+        self.rows = 0
+
+    async def add(self, record: tuple) -> None:
+        self.records.append(record)
+        if len(self.records) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self.records:
+            return
+        for parent in self.parents:
+            await parent.flush()
+        await self.conn.copy_records_to_table(self.table, records=self.records, columns=self.columns)
+        self.rows += len(self.records)
+        self.records = []
+
+
+class Generator:
+    """シードから決まる乱数でテーブルごとのレコードを作る"""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.now = args.now
+        self.writers: Dict[str, TableWriter] = {}
+        # 1日の上限の判定用（ユーザー, アクション, 日付）ごとの付与済みポイント
+        self.awarded: Dict[Tuple[uuid.UUID, str, object], int] = defaultdict(int)
+
+    def uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def recent(self, days: Optional[float] = None) -> datetime:
+        """直近ほど多くなる日時（now から days 日前まで）"""
+        days = self.args.days if days is None else days
+        return self.now - timedelta(seconds=days * 86400 * self.rng.random() ** 2)
+
+    def tags(self, k: int) -> str:
+        """よく使われるタグほど選ばれやすい k 個以下のタグ（JSON）"""
+        chosen = self.rng.choices(TAGS, cum_weights=TAG_WEIGHTS, k=k)
+        return json.dumps(list(dict.fromkeys(chosen)), ensure_ascii=False)
+
+    def text(self, min_words: int, max_words: int) -> str:
+        words = self.rng.choices(WORDS, cum_weights=WORD_WEIGHTS, k=self.rng.randint(min_words, max_words))
+        return "".join(words)
+
+    def count_around(self, mean: float, weight: float) -> int:
+        """平均 mean をユーザーの活動量 weight で偏らせた件数"""
+        return int(self.rng.expovariate(1 / max(mean * weight, 1e-9)))
+
+    async def point(self, user_id, action_type: str, reference_id, created_at: datetime, variant=None) -> None:
+        """付与ルールどおりに points を作る（1日の上限を超える分は付与しない）"""
+        rule = point_rule_engine.rule_for(action_type)
+        amount = rule.amount_for(variant)
+        if rule.daily_cap is not None:
+            key = (user_id, action_type, day_start(created_at).date())
+            if self.awarded[key] + amount > rule.daily_cap:
+                return
+            self.awarded[key] += amount
+        await self.writers["points"].add(
+            (self.uuid(), user_id, amount, action_type, str(reference_id), None, created_at)
+        )
+
+    async def run(self, conn: asyncpg.Connection) -> Dict[str, int]:
+        args = self.args
+        columns = {
+            "users": ["id", "email", "hashed_password", "full_name", "is_active", "role", "created_at", "updated_at"],
+            "user_profiles": ["id", "user_id", "bio", "skills", "interests", "available_time", "created_at", "updated_at"],
+            "goals": ["id", "user_id", "title", "category", "status", "progress", "created_at", "updated_at"],
+            "steps": ["id", "goal_id", "order", "title", "status", "completed_at", "created_at", "updated_at"],
+            "logs": ["id", "user_id", "title", "content", "tags", "visibility", "created_at", "updated_at"],
+            "events": [
+                "id", "owner_id", "title", "description", "start_date", "location_type", "max_attendees",
+                "tags", "status", "created_at", "updated_at",
+            ],
+            "event_participants": ["id", "event_id", "user_id", "status", "joined_at", "created_at"],
+            "projects": [
+                "id", "owner_id", "title", "description", "category", "status", "start_date", "location_type",
+                "is_recruiting", "max_members", "required_skills", "tags", "visibility", "created_at", "updated_at",
+            ],
+            "project_members": [
+                "id", "project_id", "user_id", "role", "status", "contribution_points", "joined_at",
+                "created_at", "updated_at",
+            ],
+            "points": ["id", "user_id", "amount", "action_type", "reference_id", "description", "created_at"],
+        }
+        parents = {
+            "user_profiles": ["users"],
+            "goals": ["users"],
+            "steps": ["goals"],
+            "logs": ["users"],
+            "events": ["users"],
+            "event_participants": ["events"],
+            "projects": ["users"],
+            "project_members": ["projects"],
+            "points": ["users"],
+        }
+        w = self.writers
+        for table, cols in columns.items():
+            w[table] = TableWriter(conn, table, cols, args.batch_size, [w[parent] for parent in parents.get(table, [])])
+
+        # ユーザー（パスワードは全員 password123。ハッシュは1回だけ計算する）
+        hashed_password = get_password_hash("password123")
+        user_ids = [self.uuid() for _ in range(args.users)]
+        weights = [self.rng.paretovariate(1.16) for _ in user_ids]
+        mean_weight = sum(weights) / len(weights)
+        weights = [weight / mean_weight for weight in weights]
+        cum_weights = list(accumulate(weights))
+        for i, user_id in enumerate(user_ids):
+            created_at = self.recent(args.days * 2)
+            await w["users"].add((
+                user_id, f"user{i}@example.com", hashed_password, f"ユーザー{i}", True,
+                "ADMIN" if i == 0 else "USER", created_at, created_at,
+            ))
+            await w["user_profiles"].add((
+                self.uuid(), user_id, self.text(5, 20),
+                json.dumps(self.rng.sample(SKILLS, self.rng.randint(0, 3)), ensure_ascii=False),
+                self.tags(self.rng.randint(0, 4)),
+                self.rng.choice([60, 120, 300, 600, 1200]), created_at, created_at,
+            ))
+
+        # 目標・ステップ（完了したステップに step_complete）
+        for user_id, weight in zip(user_ids, weights):
+            for _ in range(self.count_around(args.goals_per_user, weight)):
+                goal_id = self.uuid()
+                created_at = self.recent()
+                steps = max(1, self.count_around(args.steps_per_goal, 1))
+                completed = self.rng.randint(0, steps)
+                await w["goals"].add((
+                    goal_id, user_id, self.text(2, 6), self.rng.choice(["ACTIVITY", "SENSITIVITY"]),
+                    "COMPLETED" if completed == steps else "ACTIVE", completed * 100 // steps,
+                    created_at, created_at,
+                ))
+                for order in range(steps):
+                    step_id = self.uuid()
+                    completed_at = None
+                    if order < completed:
+                        completed_at = min(self.now, created_at + timedelta(days=self.rng.uniform(0, 14)))
+                        await self.point(user_id, "step_complete", step_id, completed_at)
+                    await w["steps"].add((
+                        step_id, goal_id, order + 1, self.text(2, 6),
+                        "COMPLETED" if completed_at else "PENDING", completed_at, created_at, created_at,
+                    ))
+
+        # ログ（log_create）
+        for user_id, weight in zip(user_ids, weights):
+            for _ in range(self.count_around(args.logs_per_user, weight)):
+                log_id = self.uuid()
+                created_at = self.recent()
+                await w["logs"].add((
+                    log_id, user_id, self.text(2, 8), self.text(20, 200),
+                    self.tags(self.rng.randint(0, 3)),
+                    "PUBLIC" if self.rng.random() < args.public_ratio else "PRIVATE",
+                    created_at, created_at,
+                ))
+                await self.point(user_id, "log_create", log_id, created_at)
+
+        # イベント・参加者（event_create / event_join。活動量の多いユーザーほど主催・参加する）
+        for _ in range(args.events):
+            event_id = self.uuid()
+            owner_id = self.rng.choices(user_ids, cum_weights=cum_weights)[0]
+            created_at = self.recent()
+            start_date = created_at + timedelta(days=self.rng.uniform(1, 60))
+            max_attendees = self.rng.choice([None, 10, 20, 50, 100])
+            await w["events"].add((
+                event_id, owner_id, self.text(2, 8), self.text(10, 60), start_date,
+                self.rng.choice(LOCATION_TYPES), max_attendees,
+                self.tags(self.rng.randint(1, 3)),
+                "COMPLETED" if start_date < self.now else "UPCOMING", created_at, created_at,
+            ))
+            await self.point(owner_id, "event_create", event_id, created_at)
+
+            attendees = self.count_around(args.participants_per_event, 1)
+            if max_attendees:
+                attendees = min(attendees, max_attendees)
+            participants = set(self.rng.choices(user_ids, cum_weights=cum_weights, k=attendees)) - {owner_id}
+            for user_id in participants:
+                joined = min(self.now, created_at + timedelta(days=self.rng.uniform(0, 30)))
+                await w["event_participants"].add((self.uuid(), event_id, user_id, "JOINED", joined, joined))
+                await self.point(user_id, "event_join", event_id, joined)
+
+        # プロジェクト・メンバー（project_create。貢献度はメンバーごとに偏らせる）
+        for _ in range(args.projects):
+            project_id = self.uuid()
+            owner_id = self.rng.choices(user_ids, cum_weights=cum_weights)[0]
+            created_at = self.recent()
+            category = self.rng.choice(["asoto", "asobi"])
+            is_recruiting = self.rng.random() < 0.5
+            await w["projects"].add((
+                project_id, owner_id, self.text(2, 8), self.text(10, 60), category.upper(),
+                "RECRUITING" if is_recruiting else "ACTIVE", created_at, self.rng.choice(LOCATION_TYPES),
+                is_recruiting, self.rng.choice([None, 10, 20, 50]),
+                json.dumps(self.rng.sample(SKILLS, self.rng.randint(0, 2)), ensure_ascii=False),
+                self.tags(self.rng.randint(1, 3)),
+                "PUBLIC", created_at, created_at,
+            ))
+            await self.point(owner_id, "project_create", project_id, created_at, variant=category)
+
+            members = set(self.rng.choices(user_ids, cum_weights=cum_weights, k=self.count_around(args.members_per_project, 1)))
+            members.discard(owner_id)
+            await w["project_members"].add((
+                self.uuid(), project_id, owner_id, "OWNER", "ACTIVE",
+                int(self.rng.paretovariate(1.5) * 20), created_at, created_at, created_at,
+            ))
+            for user_id in members:
+                joined = min(self.now, created_at + timedelta(days=self.rng.uniform(0, 30)))
+                active = self.rng.random() < 0.8
+                await w["project_members"].add((
+                    self.uuid(), project_id, user_id, "MEMBER", "ACTIVE" if active else "PENDING",
+                    int(self.rng.paretovariate(1.5) * 10) if active else 0,
+                    joined if active else None, joined, joined,
+                ))
+
+        for writer in w.values():
+            await writer.flush()
+        return {table: writer.rows for table, writer in w.items()}
+
+
+async def rebuild_derived(args) -> None:
+    """points から残高・ランキング・期間別集計を作り直す"""
+    engine = create_async_engine(args.database_url, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        await reconcile_balances(session, fix=True)
+        await rebuild_leaderboards(session)
+        await session.commit()
+
+        user_ids = (await session.execute(select(UserPointBalance.user_id).order_by(UserPointBalance.user_id))).scalars().all()
+        for start in range(0, len(user_ids), 1000):
+            await rebuild_point_rollups(session, user_ids[start:start + 1000])
+            await session.commit()
+
+    await engine.dispose()
+
+
+async def main(args) -> None:
+    conn = await asyncpg.connect(args.database_url.replace("postgresql+asyncpg://", "postgresql://"))
+    try:
+        if args.truncate:
+            print("🧹 既存のデータを削除中...")
+            await conn.execute("TRUNCATE users, leaderboard_score_counts, tag_counts CASCADE")
+
+        print(f"🌱 データを生成中（users={args.users}, seed={args.seed}）...")
+        started = time.perf_counter()
+        async with conn.transaction():
+            counts = await Generator(args).run(conn)
+        loaded = time.perf_counter() - started
+    finally:
+        await conn.close()
+
+    print("🔁 残高・ランキング・期間別集計を作成中...")
+    await rebuild_derived(args)
+
+    conn = await asyncpg.connect(args.database_url.replace("postgresql+asyncpg://", "postgresql://"))
+    try:
+        await conn.execute("ANALYZE")
+    finally:
+        await conn.close()
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    print("\n📊 投入したレコード")
+    for table, rows in counts.items():
+        print(f"  {table:<20}{rows:>12,}")
+    print(f"  {'合計':<18}{total:>12,}")
+    print(f"\n✅ 投入 {loaded:.1f}秒（{total / loaded:,.0f} 行/秒）、集計・ANALYZE を含めて {elapsed:.1f}秒")
+
+
+def _datetime(value: str) -> datetime:
+    moment = datetime.fromisoformat(value)
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ベンチマーク用の大量データ生成")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument("--truncate", action="store_true", help="既存のデータを全削除してから投入する")
+    parser.add_argument("--seed", type=int, default=42, help="乱数のシード（同じ値なら同じデータ）")
+    parser.add_argument("--now", type=_datetime, default=datetime(2026, 10, 1, tzinfo=timezone.utc),
+                        help="基準日時（ISO 8601）。データはこれ以前に分布する")
+    parser.add_argument("--days", type=int, default=180, help="活動を分布させる日数")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--logs-per-user", type=float, default=20, help="ユーザーあたりのログ数（平均）")
+    parser.add_argument("--goals-per-user", type=float, default=3, help="ユーザーあたりの目標数（平均）")
+    parser.add_argument("--steps-per-goal", type=float, default=5, help="目標あたりのステップ数（平均）")
+    parser.add_argument("--events", type=int, help="イベント数（省略時は users / 20）")
+    parser.add_argument("--participants-per-event", type=float, default=30, help="イベントあたりの参加者数（平均）")
+    parser.add_argument("--projects", type=int, help="プロジェクト数（省略時は users / 50）")
+    parser.add_argument("--members-per-project", type=float, default=8, help="プロジェクトあたりのメンバー数（平均）")
+    parser.add_argument("--public-ratio", type=float, default=0.6, help="公開ログの割合")
+    parser.add_argument("--batch-size", type=int, default=20000, help="1回の COPY で送るレコード数")
+    args = parser.parse_args()
+    if args.events is None:
+        args.events = max(1, args.users // 20)
+    if args.projects is None:
+        args.projects = max(1, args.users // 50)
+    asyncio.run(main(args))
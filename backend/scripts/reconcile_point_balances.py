@@ -0,0 +1,54 @@
+"""ポイント残高の再計算スクリプト
+
+points テーブルの累計と user_point_balances のずれを検出します。
+--fix を付けると、points の累計で残高を一括更新します。
+
+使い方:
+    docker compose exec backend python scripts/reconcile_point_balances.py
+    docker compose exec backend python scripts/reconcile_point_balances.py --fix
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+sys.path.append(str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.services.points import reconcile_balances
+
+
+async def reconcile(fix: bool) -> int:
+    """残高のずれを報告し、必要に応じて修正する"""
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        drifts = await reconcile_balances(session, fix=fix)
+        await session.commit()
+
+    await engine.dispose()
+
+    if not drifts:
+        print("✅ ポイント残高のずれはありません")
+        return 0
+
+    print(f"⚠️  {len(drifts)}人のポイント残高にずれがあります")
+    for drift in drifts:
+        print(f"  - {drift.user_id}: 残高 {drift.recorded} / 実績 {drift.actual} (差分 {drift.actual - drift.recorded:+d})")
+
+    if fix:
+        print("✅ 残高を points の累計で更新しました")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ポイント残高の再計算")
+    parser.add_argument("--fix", action="store_true", help="ずれを修正する")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(reconcile(args.fix)))
@@ -19,6 +19,7 @@ from uuid import uuid4
 
 from app.core.config import settings
 from app.core.security import get_password_hash
+from app.services.points import reconcile_balances
 from app.models import (
     User, UserRole, UserProfile,
     Goal, GoalCategory, GoalStatus,
@@ -373,6 +374,10 @@ async def seed_data():
         await session.commit()
         print(f"✅ {len(points)}件のポイントを作成しました")
 
+        # ポイント残高を points の累計から作成
+        await reconcile_balances(session, fix=True)
+        await session.commit()
+
         print("\n🎉 サンプルデータの投入が完了しました！")
         print("\n📊 作成されたデータ:")
         print(f"  - ユーザー: {len(users)}人")
@@ -1,14 +1,24 @@
 import pytest
 import asyncio
-from typing import AsyncGenerator
+from contextlib import contextmanager
+from typing import AsyncGenerator, Iterator, List
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from httpx import AsyncClient
 
+from app.core.config import settings
 from app.core.database import Base, get_db
 from app.main import app
 from app.models.user import User
-from app.core.security import get_password_hash, create_access_token
+from app.core.security import get_password_hash, create_access_token, verified_tokens
+from app.core.replica import recent_writers
+from app.core.token_revocation import token_revocations
+from app.core.user_cache import user_cache
+from app.services.dashboard import community_area_cache
+
+# ポイント付与はリクエスト内で反映する（ワーカーのテストは個別に切り替える）
+settings.POINT_EVENTS_MODE = "inline"
 
 # テスト用データベースURL（PostgreSQL）
 # Docker Compose環境のPostgreSQLを使用
@@ -62,6 +72,11 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield test_db
 
     app.dependency_overrides[get_db] = override_get_db
+    await user_cache.clear()
+    await community_area_cache.clear()
+    await recent_writers.clear()
+    await token_revocations.clear()
+    verified_tokens.clear()
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -112,3 +127,51 @@ def auth_headers2(test_user2: User) -> dict:
     """認証ヘッダー（ユーザー2）"""
     token = create_access_token(data={"sub": str(test_user2.id)})
     return {"Authorization": f"Bearer {token}"}
+
+
+class QueryCounter:
+    """
+    テスト用エンジンで実行された SQL を数える
+
+    N+1 や余分な存在確認を検出するため、リクエストごとのクエリ数に上限を設けて確かめる::
+
+        with query_counter.count() as queries:
+            await client.get("/api/v1/dashboard", headers=auth_headers)
+        queries.assert_at_most(2)
+    """
+
+    def __init__(self):
+        self.statements: List[str] = []
+        self._active = False
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self._active:
+            self.statements.append(statement)
+
+    @contextmanager
+    def count(self) -> Iterator["QueryCounter"]:
+        """ブロック内で実行された SQL だけを数える"""
+        self.statements = []
+        self._active = True
+        try:
+            yield self
+        finally:
+            self._active = False
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def assert_at_most(self, budget: int) -> None:
+        assert len(self.statements) <= budget, (
+            f"{len(self.statements)} queries (budget {budget}):\n" + "\n---\n".join(self.statements)
+        )
+
+
+@pytest.fixture
+def query_counter(test_db: AsyncSession) -> Iterator[QueryCounter]:
+    """SQL の実行回数を数えるフィクスチャ"""
+    counter = QueryCounter()
+    engine = test_db.bind.sync_engine
+    event.listen(engine, "after_cursor_execute", counter._after_cursor_execute)
+    yield counter
+    event.remove(engine, "after_cursor_execute", counter._after_cursor_execute)
@@ -1,7 +1,44 @@
 """認証API の統合テスト"""
+import asyncio
+import threading
+
 import pytest
 from httpx import AsyncClient
 from app.models.user import User
+from app.core.cache import CacheBackend
+from app.core.config import settings
+from app.core.password_hasher import PasswordHasher
+from app.core.security import get_password_hash
+from app.core.token_revocation import token_revocations
+from app.core.user_cache import user_cache
+
+
+class RemoteCacheBackend(CacheBackend):
+    """Redis の代わりに使う、操作のたびにイベントループに制御を戻すバックエンド"""
+
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+
+    async def _roundtrip(self):
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("cache backend is unavailable")
+
+    async def get(self, key):
+        await self._roundtrip()
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl):
+        await self._roundtrip()
+        self.data[key] = value
+
+    async def delete(self, key):
+        await self._roundtrip()
+        self.data.pop(key, None)
+
+    async def clear(self):
+        self.data.clear()
 
 
 @pytest.mark.integration
@@ -147,3 +184,267 @@ async def test_get_current_user_invalid_token(client: AsyncClient):
     )
 
     assert response.status_code == 401
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_current_user_is_cached(client: AsyncClient, test_user: User, auth_headers: dict):
+    """2回目以降のリクエストはユーザーキャッシュから取得されるテスト"""
+    first = await client.get("/api/v1/goals", headers=auth_headers)
+    second = await client.get("/api/v1/goals", headers=auth_headers)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert user_cache.stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_deactivated_user_rejected_after_cache(client: AsyncClient, test_db, test_user: User, auth_headers: dict):
+    """無効化されたユーザーはキャッシュ済みでも拒否されるテスト"""
+    response = await client.get("/api/v1/goals", headers=auth_headers)
+    assert response.status_code == 200
+
+    # ユーザーを無効化（コミット時にキャッシュが破棄される）
+    test_user.is_active = False
+    await test_db.commit()
+
+    response = await client.get("/api/v1/goals", headers=auth_headers)
+    assert response.status_code == 401
+    assert await token_revocations.is_revoked(test_user.id, 0) is True
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_remote_user_cache_invalidated_on_commit(
+    client: AsyncClient, test_db, test_user: User, auth_headers: dict, monkeypatch, caplog
+):
+    """外部バックエンドのキャッシュは、コミットが戻る前に破棄されるテスト（失敗はログに残す）"""
+    backend = RemoteCacheBackend()
+    monkeypatch.setattr(user_cache, "backend", backend)
+    await client.get("/api/v1/goals", headers=auth_headers)
+    assert str(test_user.id) in backend.data
+
+    test_user.full_name = "変更後"
+    await test_db.commit()
+    assert str(test_user.id) not in backend.data
+
+    await client.get("/api/v1/goals", headers=auth_headers)
+    backend.fail = True
+    test_user.full_name = "再変更"
+    await test_db.commit()
+    assert "Failed to invalidate cached user" in caplog.text
+
+
+LOGIN_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_login_rehashes_with_new_cost(client: AsyncClient, test_db, test_user: User, monkeypatch):
+    """BCRYPT_ROUNDS と異なるコストのハッシュはログイン時にハッシュし直すテスト"""
+    test_user.hashed_password = get_password_hash("password123", rounds=4)
+    await test_db.commit()
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": test_user.email, "password": "password123"},
+        headers=LOGIN_HEADERS
+    )
+
+    assert response.status_code == 200
+    await test_db.refresh(test_user)
+    assert test_user.hashed_password.startswith("$2b$05$")
+
+    # 新しいハッシュでもログインできる
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": test_user.email, "password": "password123"},
+        headers=LOGIN_HEADERS
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_login_returns_503_when_hasher_busy(client: AsyncClient, test_user: User, monkeypatch):
+    """ハッシュの待ち行列が上限に達したら 503 を返すテスト"""
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    monkeypatch.setattr("app.api.v1.auth.password_hasher", hasher)
+    release = threading.Event()
+    blocker = asyncio.ensure_future(hasher.run(release.wait))
+
+    try:
+        response = await client.post(
+            "/api/v1/auth/login",
+            data={"username": test_user.email, "password": "password123"},
+            headers=LOGIN_HEADERS
+        )
+    finally:
+        release.set()
+        await blocker
+        hasher.shutdown()
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert hasher.stats() == {"pending": 0, "rejected": 1}
+
+
+async def _login(client: AsyncClient, user: User) -> dict:
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": user.email, "password": "password123"},
+        headers=LOGIN_HEADERS
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_login_returns_refresh_token(client: AsyncClient, test_user: User):
+    """ログインでリフレッシュトークンとアクセストークンの有効期間を返すテスト"""
+    tokens = await _login(client, test_user)
+
+    assert tokens["refresh_token"]
+    assert tokens["expires_in"] == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    response = await client.get(
+        "/api/v1/goals",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_refresh_rotates_token(client: AsyncClient, test_user: User):
+    """トークン更新で新しいリフレッシュトークンが発行され、古いものは使えなくなるテスト"""
+    tokens = await _login(client, test_user)
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    response = await client.get(
+        "/api/v1/goals",
+        headers={"Authorization": f"Bearer {rotated['access_token']}"}
+    )
+    assert response.status_code == 200
+
+    # 新しいリフレッシュトークンは続けて使える
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_family(client: AsyncClient, test_user: User):
+    """交換済みのリフレッシュトークンが再利用されたら、同じ系列のトークンをすべて失効させるテスト"""
+    tokens = await _login(client, test_user)
+    other_login = await _login(client, test_user)
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    rotated = response.json()
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == 401
+
+    # 別のログインの系列は影響を受けない
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": other_login["refresh_token"]})
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_refresh_invalid_token(client: AsyncClient):
+    """存在しないリフレッシュトークンのテスト"""
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": "unknown"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_refresh_rejected_for_deactivated_user(client: AsyncClient, test_db, test_user: User):
+    """無効化されたユーザーはトークンを更新できないテスト"""
+    tokens = await _login(client, test_user)
+    test_user.is_active = False
+    await test_db.commit()
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_logout(client: AsyncClient, test_user: User):
+    """ログアウトしたリフレッシュトークンは使えなくなるテスト"""
+    tokens = await _login(client, test_user)
+
+    response = await client.post("/api/v1/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 204
+
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+    # アクセストークンは期限まで使える
+    response = await client.get(
+        "/api/v1/goals",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_logout_everywhere_revokes_access_tokens(client: AsyncClient, test_user: User):
+    """全端末からのログアウトで、発行済みのアクセストークンも無効になるテスト"""
+    tokens = await _login(client, test_user)
+    other_login = await _login(client, test_user)
+    headers = {"Authorization": f"Bearer {other_login['access_token']}"}
+    assert (await client.get("/api/v1/goals", headers=headers)).status_code == 200
+
+    response = await client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": tokens["refresh_token"], "everywhere": True}
+    )
+    assert response.status_code == 204
+
+    assert await token_revocations.is_revoked(test_user.id, 0) is True
+    response = await client.get("/api/v1/goals", headers=headers)
+    assert response.status_code == 401
+    response = await client.post("/api/v1/auth/refresh", json={"refresh_token": other_login["refresh_token"]})
+    assert response.status_code == 401
+
+    # 再ログインすれば新しいトークンで使える
+    tokens = await _login(client, test_user)
+    response = await client.get(
+        "/api/v1/goals",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_remote_revocation_recorded_before_logout_returns(client: AsyncClient, test_user: User, monkeypatch):
+    """外部バックエンドへの失効の記録は、ログアウトのレスポンスより前に終わるテスト"""
+    backend = RemoteCacheBackend()
+    monkeypatch.setattr(token_revocations, "backend", backend)
+    tokens = await _login(client, test_user)
+
+    response = await client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": tokens["refresh_token"], "everywhere": True}
+    )
+
+    assert response.status_code == 204
+    assert backend.data[str(test_user.id)] == {"is_active": True, "token_version": 1}
+    response = await client.get("/api/v1/goals", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    assert response.status_code == 401
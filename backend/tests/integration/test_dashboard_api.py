@@ -3,6 +3,9 @@ import pytest
 from httpx import AsyncClient
 from datetime import datetime, timedelta
 
+from app.core.config import settings
+from app.services.dashboard import community_area_cache
+
 
 class TestDashboardAPI:
     """ダッシュボードAPI のテスト"""
@@ -195,3 +198,90 @@ class TestDashboardAPI:
         """認証なしでのアクセステスト"""
         response = await client.get("/api/v1/dashboard")
         assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy", ["concurrent", "single"])
+    async def test_dashboard_strategies_match_sequential(self, client: AsyncClient, auth_headers, monkeypatch, strategy):
+        """どの実行方法でも同じダッシュボードを返すテスト"""
+        for i in range(4):
+            await client.post(
+                "/api/v1/goals",
+                headers=auth_headers,
+                json={"title": f"戦略テスト目標{i}", "category": "activity"}
+            )
+            await client.post(
+                "/api/v1/logs",
+                headers=auth_headers,
+                json={"title": f"戦略テストログ{i}", "content": "内容", "visibility": "public", "tags": ["戦略"]}
+            )
+            await client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "title": f"戦略テストイベント{i}",
+                    "start_date": (datetime.now() + timedelta(days=i + 1)).isoformat(),
+                    "location_type": "online",
+                }
+            )
+
+        monkeypatch.setattr(settings, "DASHBOARD_QUERY_STRATEGY", "sequential")
+        expected = await client.get("/api/v1/dashboard", headers=auth_headers)
+
+        monkeypatch.setattr(settings, "DASHBOARD_QUERY_STRATEGY", strategy)
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == expected.json()
+        assert response.json()["personal"]["total_points"] == 4 * 5 + 4 * 50
+
+    @pytest.mark.asyncio
+    async def test_dashboard_community_area_cache_invalidation(self, client: AsyncClient, auth_headers, monkeypatch):
+        """公開ログ・イベントの変更でコミュニティエリアのキャッシュが無効化されるテスト"""
+        # 古い値を返さず再計算を待つようにして、無効化の結果を直接確認する
+        monkeypatch.setattr(community_area_cache, "stale_ttl", 0)
+
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert response.json()["community"]["recent_public_logs"] == []
+
+        # 非公開ログの作成では無効化されない
+        await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "非公開ログ", "content": "非公開", "visibility": "private"}
+        )
+        await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert community_area_cache.stats()["recomputes"] == 1
+
+        log_response = await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "キャッシュ確認ログ", "content": "公開", "visibility": "public"}
+        )
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert [log["title"] for log in response.json()["community"]["recent_public_logs"]] == ["キャッシュ確認ログ"]
+
+        # 公開から非公開への変更
+        await client.patch(
+            f"/api/v1/logs/{log_response.json()['id']}",
+            headers=auth_headers,
+            json={"visibility": "private"}
+        )
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert response.json()["community"]["recent_public_logs"] == []
+
+        event_response = await client.post(
+            "/api/v1/events",
+            headers=auth_headers,
+            json={
+                "title": "キャッシュ確認イベント",
+                "start_date": (datetime.now() + timedelta(days=3)).isoformat(),
+                "location_type": "online",
+            }
+        )
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert [event["title"] for event in response.json()["community"]["upcoming_events"]] == ["キャッシュ確認イベント"]
+
+        await client.delete(f"/api/v1/events/{event_response.json()['id']}", headers=auth_headers)
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert response.json()["community"]["upcoming_events"] == []
+        assert community_area_cache.stats()["recomputes"] == 5
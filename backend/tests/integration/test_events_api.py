@@ -243,6 +243,29 @@ class TestEventsAPI:
 
         assert response.status_code == 204
 
+    @pytest.mark.asyncio
+    async def test_rejoin_after_leave(self, client: AsyncClient, auth_headers):
+        """離脱したイベントに再参加できる"""
+        start_date = datetime.now() + timedelta(days=7)
+        create_response = await client.post(
+            "/api/v1/events",
+            headers=auth_headers,
+            json={
+                "title": "再参加テスト",
+                "start_date": start_date.isoformat(),
+                "location_type": "online",
+            }
+        )
+        event_id = create_response.json()["id"]
+
+        await client.post(f"/api/v1/events/{event_id}/join", headers=auth_headers)
+        await client.delete(f"/api/v1/events/{event_id}/leave", headers=auth_headers)
+        response = await client.post(f"/api/v1/events/{event_id}/join", headers=auth_headers)
+
+        assert response.status_code == 200
+        participants = await client.get(f"/api/v1/events/{event_id}/participants", headers=auth_headers)
+        assert len(participants.json()) == 1
+
     @pytest.mark.asyncio
     async def test_get_participants(self, client: AsyncClient, auth_headers):
         """参加者一覧取得のテスト"""
@@ -383,3 +406,96 @@ class TestEventsAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["max_attendees"] == 20
+
+    @pytest.mark.asyncio
+    async def test_get_events_cursor_pagination(self, client: AsyncClient, auth_headers):
+        """イベント一覧のカーソルページネーションのテスト"""
+        for i in range(3):
+            start_date = datetime.now() + timedelta(days=i + 1)
+            await client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "title": f"ページイベント{i}",
+                    "start_date": start_date.isoformat(),
+                    "location_type": "online",
+                }
+            )
+
+        response = await client.get("/api/v1/events?limit=2", headers=auth_headers)
+
+        assert response.status_code == 200
+        first_page = response.json()
+        assert [e["title"] for e in first_page["items"]] == ["ページイベント2", "ページイベント1"]
+        assert first_page["next_cursor"] is not None
+
+        response = await client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"limit": 2, "cursor": first_page["next_cursor"]}
+        )
+
+        assert response.status_code == 200
+        second_page = response.json()
+        assert [e["title"] for e in second_page["items"]] == ["ページイベント0"]
+        assert second_page["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_filter_events_by_tags(self, client: AsyncClient, auth_headers):
+        """タグでのイベント絞り込みのテスト"""
+        for i, tags in enumerate([["読書会", "オンライン"], ["読書会"], ["農業"]]):
+            await client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "title": f"タグイベント{i}",
+                    "start_date": (datetime.now() + timedelta(days=i + 1)).isoformat(),
+                    "location_type": "online",
+                    "tags": tags,
+                }
+            )
+
+        response = await client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"tags": ["読書会", "オンライン"]}
+        )
+        assert response.status_code == 200
+        assert [e["title"] for e in response.json()] == ["タグイベント0"]
+
+        response = await client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"tags": ["オンライン", "農業"], "tag_mode": "any"}
+        )
+        assert response.status_code == 200
+        assert [e["title"] for e in response.json()] == ["タグイベント2", "タグイベント0"]
+
+    @pytest.mark.asyncio
+    async def test_get_events_fields(self, client: AsyncClient, auth_headers):
+        """fields=summary は説明を含まない要約を返す"""
+        for i in range(3):
+            await client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "title": f"要約イベント{i}",
+                    "description": "長い説明",
+                    "start_date": (datetime.now() + timedelta(days=i + 1)).isoformat(),
+                    "location_type": "online",
+                }
+            )
+
+        response = await client.get("/api/v1/events", headers=auth_headers, params={"fields": "summary", "limit": 2})
+        assert response.status_code == 200
+        page = response.json()
+        assert [e["title"] for e in page["items"]] == ["要約イベント2", "要約イベント1"]
+        assert "description" not in page["items"][0]
+        assert page["next_cursor"] is not None
+
+        response = await client.get("/api/v1/events", headers=auth_headers, params={"fields": "title,start_date"})
+        assert response.status_code == 200
+        assert all(set(e) == {"title", "start_date"} for e in response.json())
+
+        response = await client.get("/api/v1/events", headers=auth_headers, params={"fields": "owner"})
+        assert response.status_code == 400
@@ -0,0 +1,28 @@
+"""ヘルスチェック API の統合テスト"""
+import pytest
+from httpx import AsyncClient
+
+
+class TestHealthAPI:
+    """ヘルスチェックAPI のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_health(self, client: AsyncClient):
+        """アプリケーションのヘルスチェック"""
+        response = await client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_health_db(self, client: AsyncClient):
+        """DBのヘルスチェックと接続プールの使用状況"""
+        response = await client.get("/health/db")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["latency_ms"] >= 0
+        pool = data["pool"]
+        assert pool["checked_out"] >= 1  # リクエスト中のセッションが使用中
+        assert pool["size"] >= 1
+        assert set(pool) >= {"class", "size", "max_overflow", "checked_out", "idle", "overflow"}
@@ -0,0 +1,139 @@
+"""HTTP の条件付きリクエスト（ETag / Last-Modified）の統合テスト"""
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _create_event(client: AsyncClient, headers: dict, title: str = "キャッシュイベント") -> dict:
+    response = await client.post(
+        "/api/v1/events",
+        headers=headers,
+        json={
+            "title": title,
+            "start_date": (datetime.now() + timedelta(days=7)).isoformat(),
+            "location_type": "online",
+        }
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestHttpCache:
+    """読み取り API の ETag / 304"""
+
+    @pytest.mark.asyncio
+    async def test_event_etag(self, client: AsyncClient, auth_headers):
+        """詳細は If-None-Match が一致すれば本文なしの 304、更新すると新しい ETag"""
+        event = await _create_event(client, auth_headers)
+        path = f"/api/v1/events/{event['id']}"
+
+        response = await client.get(path, headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert response.headers["cache-control"] == "private, no-cache"
+        assert "Authorization" in response.headers["vary"]
+        assert "last-modified" in response.headers
+
+        response = await client.get(path, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        # 複数の ETag や W/ のない形でも一致する
+        response = await client.get(path, headers={**auth_headers, "If-None-Match": f'"other", {etag[2:]}'})
+        assert response.status_code == 304
+
+        await client.patch(path, headers=auth_headers, json={"title": "更新後"})
+        response = await client.get(path, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["title"] == "更新後"
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_project_if_modified_since(self, client: AsyncClient, auth_headers):
+        """If-None-Match がなければ If-Modified-Since で比べる"""
+        project = (await client.post(
+            "/api/v1/projects",
+            headers=auth_headers,
+            json={
+                "title": "キャッシュプロジェクト",
+                "category": "asobi",
+                "start_date": datetime.now().isoformat(),
+                "location_type": "online",
+            }
+        )).json()
+        path = f"/api/v1/projects/{project['id']}"
+
+        last_modified = (await client.get(path, headers=auth_headers)).headers["last-modified"]
+
+        response = await client.get(path, headers={**auth_headers, "If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+        response = await client.get(
+            path, headers={**auth_headers, "If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+        assert response.status_code == 200
+
+        response = await client.get(path, headers={**auth_headers, "If-Modified-Since": "invalid"})
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_profile_cache_control(self, client: AsyncClient, auth_headers, test_user):
+        """プロフィールは短い max-age を付ける"""
+        await client.patch("/api/v1/users/me/profile", headers=auth_headers, json={"bio": "キャッシュ"})
+        path = f"/api/v1/users/{test_user.id}/profile"
+
+        response = await client.get(path, headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, max-age=60"
+
+        response = await client.get(path, headers={**auth_headers, "If-None-Match": response.headers["etag"]})
+        assert response.status_code == 304
+
+    @pytest.mark.asyncio
+    async def test_logs_etag(self, client: AsyncClient, auth_headers):
+        """一覧の ETag は行の追加・削除で変わり、fields ごとに違う"""
+        first = (await client.post(
+            "/api/v1/logs", headers=auth_headers, json={"title": "ログ1", "content": "内容"}
+        )).json()
+        await client.post("/api/v1/logs", headers=auth_headers, json={"title": "ログ2", "content": "内容"})
+
+        response = await client.get("/api/v1/logs", headers=auth_headers, params={"limit": 10})
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert "last-modified" not in response.headers
+
+        response = await client.get(
+            "/api/v1/logs", headers={**auth_headers, "If-None-Match": etag}, params={"limit": 10}
+        )
+        assert response.status_code == 304
+
+        response = await client.get(
+            "/api/v1/logs", headers={**auth_headers, "If-None-Match": etag}, params={"limit": 10, "fields": "summary"}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+        # 最大の updated_at が変わらない削除でも ETag が変わる
+        await client.delete(f"/api/v1/logs/{first['id']}", headers=auth_headers)
+        response = await client.get(
+            "/api/v1/logs", headers={**auth_headers, "If-None-Match": etag}, params={"limit": 10}
+        )
+        assert response.status_code == 200
+        assert [log["title"] for log in response.json()["items"]] == ["ログ2"]
+
+    @pytest.mark.asyncio
+    async def test_dashboard_etag(self, client: AsyncClient, auth_headers):
+        """ダッシュボードは内容が変わるまで 304"""
+        response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        etag = response.headers["etag"]
+
+        response = await client.get("/api/v1/dashboard", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        await client.post("/api/v1/logs", headers=auth_headers, json={"title": "新しいログ", "content": "内容"})
+        response = await client.get("/api/v1/dashboard", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["personal"]["recent_logs"][0]["title"] == "新しいログ"
@@ -0,0 +1,226 @@
+"""ランキング API の統合テスト"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.models.enums import LocationType
+from app.models.leaderboard import LeaderboardEntry, LeaderboardScoreCount
+from app.models.point_event import PointEvent
+from app.models.project import Project, ProjectCategory
+from app.models.project_member import ProjectMember, MemberRole, MemberStatus
+from app.models.user import User
+from app.services.leaderboards import (
+    LeaderboardPeriod, period_key, rebuild_leaderboards, rebuild_project_contributions,
+)
+from app.services.point_events import PointEventWorker, apply_point_events
+
+
+async def _create_user(test_db, email: str) -> User:
+    user = User(email=email, hashed_password=get_password_hash("password123"), full_name=email, is_active=True)
+    test_db.add(user)
+    await test_db.commit()
+    return user
+
+
+async def _award(test_db, user: User, count: int, action_type: str = "event_join", created_at=None) -> None:
+    """count 件のアクションを反映する（event_join は1件10ポイント）"""
+    created_at = created_at or datetime.now(timezone.utc)
+    events = [
+        PointEvent(
+            user_id=user.id,
+            action_type=action_type,
+            reference_id=f"{created_at.isoformat()}-{i}",
+            created_at=created_at,
+        )
+        for i in range(count)
+    ]
+    test_db.add_all(events)
+    await apply_point_events(test_db, events)
+    await test_db.commit()
+
+
+class TestLeaderboardsAPI:
+    """ランキング API のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_get_leaderboard(self, client: AsyncClient, test_db, test_user, test_user2, auth_headers):
+        """上位のユーザーと自分の順位を返す"""
+        user3 = await _create_user(test_db, "test3@example.com")
+        await _award(test_db, test_user, 2)
+        await _award(test_db, test_user2, 5)
+        await _award(test_db, user3, 3)
+
+        response = await client.get("/api/v1/leaderboards/all", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["period"] == "all"
+        assert [(entry["rank"], entry["score"]) for entry in data["entries"]] == [(1, 50), (2, 30), (3, 20)]
+        assert data["entries"][0]["user_id"] == str(test_user2.id)
+        assert data["entries"][0]["full_name"] == "Test User 2"
+        assert data["me"] == {"rank": 3, "user_id": str(test_user.id), "full_name": "Test User", "score": 20}
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_limit_and_ties(self, client: AsyncClient, test_db, test_user, test_user2, auth_headers):
+        """同点は同順位で、limit より下位でも自分の順位を返す"""
+        user3 = await _create_user(test_db, "test3@example.com")
+        await _award(test_db, test_user2, 3)
+        await _award(test_db, user3, 3)
+        await _award(test_db, test_user, 1)
+
+        response = await client.get("/api/v1/leaderboards/all?limit=2", headers=auth_headers)
+
+        data = response.json()
+        assert [(entry["rank"], entry["score"]) for entry in data["entries"]] == [(1, 30), (1, 30)]
+        assert data["me"]["rank"] == 3
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_periods(self, client: AsyncClient, test_db, test_user, auth_headers):
+        """今月・今週のランキングには以前の期間のポイントを含めない"""
+        now = datetime.now(timezone.utc)
+        await _award(test_db, test_user, 1, created_at=now - timedelta(days=40))
+        await _award(test_db, test_user, 2)
+
+        all_time = (await client.get("/api/v1/leaderboards/all", headers=auth_headers)).json()
+        month = (await client.get("/api/v1/leaderboards/month", headers=auth_headers)).json()
+        week = (await client.get("/api/v1/leaderboards/week", headers=auth_headers)).json()
+
+        assert all_time["me"]["score"] == 30
+        assert month["period"] == period_key(LeaderboardPeriod.MONTH, now)
+        assert month["me"]["score"] == 20
+        assert week["period"] == period_key(LeaderboardPeriod.WEEK, now)
+        assert week["me"]["score"] == 20
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_without_points(self, client: AsyncClient, test_user, auth_headers):
+        """ポイントがなければ自分の順位は null"""
+        response = await client.get("/api/v1/leaderboards/week", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == {"period": response.json()["period"], "entries": [], "me": None}
+
+    @pytest.mark.asyncio
+    async def test_invalid_period(self, client: AsyncClient, test_user, auth_headers):
+        """不正な期間は 422"""
+        response = await client.get("/api/v1/leaderboards/year", headers=auth_headers)
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_score_counts_match_entries(self, test_db, test_user, test_user2):
+        """増分で更新したスコア別ユーザー数が leaderboard_entries の集計と一致する"""
+        for user, count in [(test_user, 1), (test_user2, 1), (test_user, 2), (test_user2, 3), (test_user, 1)]:
+            await _award(test_db, user, count)
+
+        expected = (await test_db.execute(
+            select(LeaderboardEntry.period, LeaderboardEntry.score, func.count())
+            .group_by(LeaderboardEntry.period, LeaderboardEntry.score)
+        )).all()
+        actual = (await test_db.execute(
+            select(LeaderboardScoreCount.period, LeaderboardScoreCount.score, LeaderboardScoreCount.users)
+        )).all()
+
+        assert sorted(actual) == sorted(expected)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, test_db, test_user, test_user2):
+        """points からの作り直しが増分の更新と一致する"""
+        await _award(test_db, test_user, 2, created_at=datetime.now(timezone.utc) - timedelta(days=40))
+        await _award(test_db, test_user, 1)
+        await _award(test_db, test_user2, 3)
+
+        entries = select(LeaderboardEntry.period, LeaderboardEntry.user_id, LeaderboardEntry.score)
+        counts = select(LeaderboardScoreCount.period, LeaderboardScoreCount.score, LeaderboardScoreCount.users)
+        incremental = (sorted((await test_db.execute(entries)).all()), sorted((await test_db.execute(counts)).all()))
+
+        await rebuild_leaderboards(test_db)
+        await test_db.commit()
+        rebuilt = (sorted((await test_db.execute(entries)).all()), sorted((await test_db.execute(counts)).all()))
+
+        assert rebuilt == incremental
+
+    @pytest.mark.asyncio
+    async def test_project_leaderboard(self, client: AsyncClient, test_db, test_user, test_user2, auth_headers):
+        """プロジェクト内の貢献度ランキング（参加中のメンバーのみ）"""
+        user3 = await _create_user(test_db, "test3@example.com")
+        project = Project(
+            title="プロジェクト",
+            category=ProjectCategory.ASOTO,
+            start_date=datetime.now(timezone.utc),
+            location_type=LocationType.ONLINE,
+            owner_id=test_user.id,
+        )
+        test_db.add(project)
+        await test_db.flush()
+        test_db.add_all([
+            ProjectMember(project_id=project.id, user_id=test_user.id, role=MemberRole.OWNER,
+                          status=MemberStatus.ACTIVE, contribution_points=20),
+            ProjectMember(project_id=project.id, user_id=test_user2.id, role=MemberRole.MEMBER,
+                          status=MemberStatus.ACTIVE, contribution_points=40),
+            ProjectMember(project_id=project.id, user_id=user3.id, role=MemberRole.MEMBER,
+                          status=MemberStatus.PENDING, contribution_points=100),
+        ])
+        await test_db.commit()
+
+        response = await client.get(f"/api/v1/projects/{project.id}/leaderboard", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [(entry["user_id"], entry["score"]) for entry in data["entries"]] == [
+            (str(test_user2.id), 40), (str(test_user.id), 20),
+        ]
+        assert data["me"]["rank"] == 2
+
+    @pytest.mark.asyncio
+    async def test_project_contributions(
+        self, client: AsyncClient, test_db, test_user, test_user2, auth_headers, monkeypatch
+    ):
+        """プロジェクトの作成のポイントが反映されるとオーナーの貢献度に加算され、順位が変わる"""
+        monkeypatch.setattr(settings, "POINT_EVENTS_MODE", "worker")
+        project = (await client.post(
+            "/api/v1/projects",
+            headers=auth_headers,
+            json={
+                "title": "貢献度プロジェクト",
+                "category": "asobi",
+                "start_date": datetime.now().isoformat(),
+                "location_type": "online",
+            }
+        )).json()
+        test_db.add(ProjectMember(project_id=project["id"], user_id=test_user2.id, role=MemberRole.MEMBER,
+                                  status=MemberStatus.ACTIVE))
+        await test_db.commit()
+        path = f"/api/v1/projects/{project['id']}/leaderboard"
+
+        # ポイントの反映前は全員 0 で同順位
+        data = (await client.get(path, headers=auth_headers)).json()
+        assert [(entry["rank"], entry["score"]) for entry in data["entries"]] == [(1, 0), (1, 0)]
+
+        session_factory = async_sessionmaker(test_db.bind, class_=AsyncSession, expire_on_commit=False)
+        await PointEventWorker(session_factory, batch_size=100, poll_interval=0.01).run_once()
+
+        data = (await client.get(path, headers=auth_headers)).json()
+        assert [(entry["rank"], entry["user_id"], entry["score"]) for entry in data["entries"]] == [
+            (1, str(test_user.id), 30), (2, str(test_user2.id), 0),
+        ]
+        assert data["me"]["rank"] == 1
+
+        # points からの作り直しでも同じ貢献度になる
+        await rebuild_project_contributions(test_db)
+        await test_db.commit()
+        assert (await client.get(path, headers=auth_headers)).json() == data
+
+    @pytest.mark.asyncio
+    async def test_project_leaderboard_not_found(self, client: AsyncClient, test_user, auth_headers):
+        """存在しないプロジェクトは 404"""
+        response = await client.get(
+            "/api/v1/projects/00000000-0000-0000-0000-000000000000/leaderboard",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
@@ -1,6 +1,13 @@
 """内省ログ（Log）API の統合テスト"""
+from uuid import UUID
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import delete
+
+from app.api.v1 import logs as logs_api
+from app.models.log import Log
+from app.services import log_search
 
 
 class TestLogsAPI:
@@ -118,6 +125,125 @@ class TestLogsAPI:
         assert len(data) >= 1
         assert "農業" in data[0]["tags"]
 
+    @pytest.mark.asyncio
+    async def test_filter_logs_by_multiple_tags(self, client: AsyncClient, auth_headers):
+        """複数タグ（all / any）でのログ絞り込みのテスト"""
+        for title, tags in [("農業と地域", ["農業", "地域"]), ("農業のみ", ["農業"]), ("読書", ["読書"])]:
+            await client.post(
+                "/api/v1/logs",
+                headers=auth_headers,
+                json={"title": title, "content": "内容", "tags": tags, "visibility": "public"}
+            )
+
+        response = await client.get(
+            "/api/v1/logs",
+            headers=auth_headers,
+            params={"tags": ["農業", "地域"]}
+        )
+        assert response.status_code == 200
+        assert [log["title"] for log in response.json()] == ["農業と地域"]
+
+        response = await client.get(
+            "/api/v1/logs",
+            headers=auth_headers,
+            params={"tags": ["地域", "読書"], "tag_mode": "any", "limit": 10}
+        )
+        assert response.status_code == 200
+        assert {log["title"] for log in response.json()["items"]} == {"農業と地域", "読書"}
+
+    @pytest.mark.asyncio
+    async def test_filter_logs_invalid_tag_mode(self, client: AsyncClient, auth_headers):
+        """不正な tag_mode は 422"""
+        response = await client.get(
+            "/api/v1/logs",
+            headers=auth_headers,
+            params={"tags": ["農業"], "tag_mode": "xor"}
+        )
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_get_logs_cursor_pagination(self, client: AsyncClient, auth_headers):
+        """カーソルページネーションのテスト"""
+        for i in range(5):
+            await client.post(
+                "/api/v1/logs",
+                headers=auth_headers,
+                json={"title": f"ページログ{i}", "content": "内容", "visibility": "public"}
+            )
+
+        # limit=2 で最後のページまで辿る
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get("/api/v1/logs", headers=auth_headers, params=params)
+
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["items"]) <= 2
+            seen.extend(data["items"])
+            pages += 1
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert len({log["id"] for log in seen}) == 5
+        # 新しい順に並んでいる
+        created = [log["created_at"] for log in seen]
+        assert created == sorted(created, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_get_logs_invalid_cursor(self, client: AsyncClient, auth_headers):
+        """不正なカーソルのテスト"""
+        response = await client.get(
+            "/api/v1/logs?cursor=invalid",
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_get_logs_fields(self, client: AsyncClient, auth_headers, query_counter):
+        """fields で指定したフィールドだけを返し、本文は読まない"""
+        for i in range(3):
+            await _create_log(client, auth_headers, f"フィールド{i}", "長い本文" * 50)
+
+        with query_counter.count() as queries:
+            response = await client.get("/api/v1/logs", headers=auth_headers, params={"fields": "id,title"})
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 3
+        assert all(set(log) == {"id", "title"} for log in data)
+        assert not any("logs.content" in statement for statement in queries.statements)
+
+        response = await client.get("/api/v1/logs", headers=auth_headers, params={"fields": "summary", "limit": 2})
+        assert response.status_code == 200
+        page = response.json()
+        assert set(page["items"][0]) == {"id", "user_id", "title", "tags", "visibility", "created_at"}
+        assert page["next_cursor"] is not None
+
+        # 次のページも fields 付きで辿れる
+        response = await client.get(
+            "/api/v1/logs",
+            headers=auth_headers,
+            params={"fields": "summary", "limit": 2, "cursor": page["next_cursor"]}
+        )
+        assert [log["title"] for log in response.json()["items"]] == ["フィールド0"]
+
+    @pytest.mark.asyncio
+    async def test_get_logs_unknown_fields(self, client: AsyncClient, auth_headers):
+        """存在しないフィールドの指定は 400"""
+        response = await client.get("/api/v1/logs", headers=auth_headers, params={"fields": "id,password"})
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+
+        response = await client.get("/api/v1/logs", headers=auth_headers, params={"fields": " , "})
+        assert response.status_code == 400
+
     @pytest.mark.asyncio
     async def test_get_log_by_id(self, client: AsyncClient, auth_headers):
         """ログ詳細取得のテスト"""
@@ -372,3 +498,148 @@ class TestLogsAPI:
         assert response.status_code == 201
         data = response.json()
         assert data["related_goal_id"] == goal_id
+
+
+async def _create_log(client: AsyncClient, headers: dict, title: str, content: str, visibility: str = "public") -> dict:
+    response = await client.post(
+        "/api/v1/logs",
+        headers=headers,
+        json={"title": title, "content": content, "visibility": visibility},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestLogSearchAPI:
+    """ログ検索API のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_search_substring(self, client: AsyncClient, auth_headers):
+        """日本語の部分文字列で検索できる"""
+        found = await _create_log(client, auth_headers, "読書会", "読書会で新しい気づきがあった")
+        await _create_log(client, auth_headers, "散歩", "海まで歩いた")
+        # 「気」と「づき」が離れているだけのログは一致しない
+        await _create_log(client, auth_headers, "天気", "天気がよく、つきが綺麗だった")
+
+        response = await client.get("/api/v1/logs/search", params={"q": "気づき"}, headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [found["id"]]
+        assert data["next_offset"] is None
+
+    @pytest.mark.asyncio
+    async def test_search_visibility(self, client: AsyncClient, auth_headers, auth_headers2):
+        """一覧と同じく、自分のログと他人の公開ログだけが対象"""
+        mine = await _create_log(client, auth_headers, "自分", "畑で収穫", visibility="private")
+        public = await _create_log(client, auth_headers2, "公開", "畑で収穫", visibility="public")
+        await _create_log(client, auth_headers2, "非公開", "畑で収穫", visibility="private")
+
+        response = await client.get("/api/v1/logs/search", params={"q": "収穫"}, headers=auth_headers)
+        private_only = await client.get(
+            "/api/v1/logs/search", params={"q": "収穫", "visibility": "private"}, headers=auth_headers
+        )
+
+        assert {item["id"] for item in response.json()["items"]} == {mine["id"], public["id"]}
+        assert [item["id"] for item in private_only.json()["items"]] == [mine["id"]]
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_title_first(self, client: AsyncClient, auth_headers):
+        """タイトルに含むログが本文だけのログより上位"""
+        in_content = await _create_log(client, auth_headers, "週末の記録", "ワークショップに参加した")
+        in_title = await _create_log(client, auth_headers, "ワークショップ", "楽しかった")
+
+        response = await client.get("/api/v1/logs/search", params={"q": "ワークショップ"}, headers=auth_headers)
+
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [in_title["id"], in_content["id"]]
+        assert items[0]["rank"] > items[1]["rank"]
+
+    @pytest.mark.asyncio
+    async def test_search_snippet(self, client: AsyncClient, auth_headers):
+        """本文の検索語の前後と、その中での位置を返す"""
+        content = "あ" * 100 + "地域の人の話を聞いた" + "い" * 100
+        await _create_log(client, auth_headers, "記録", content)
+
+        response = await client.get("/api/v1/logs/search", params={"q": "人の話"}, headers=auth_headers)
+
+        item = response.json()["items"][0]
+        snippet = item["snippet"]
+        assert snippet.startswith("…") and snippet.endswith("…")
+        assert [snippet[start:end] for start, end in item["highlights"]] == ["人の話"]
+
+    @pytest.mark.asyncio
+    async def test_search_multiple_terms_and_single_char(self, client: AsyncClient, auth_headers):
+        """空白区切りの検索語はすべて含むもの。1文字の検索語も使える"""
+        both = await _create_log(client, auth_headers, "山と川", "山に登って川で遊んだ")
+        await _create_log(client, auth_headers, "山", "山に登った")
+
+        response = await client.get("/api/v1/logs/search", params={"q": "川　山"}, headers=auth_headers)
+
+        assert [item["id"] for item in response.json()["items"]] == [both["id"]]
+
+    @pytest.mark.asyncio
+    async def test_search_after_update(self, client: AsyncClient, auth_headers):
+        """ログを更新すると新しい内容で検索される"""
+        log = await _create_log(client, auth_headers, "記録", "朝から畑に行った")
+        await client.patch(f"/api/v1/logs/{log['id']}", headers=auth_headers, json={"content": "朝から海に行った"})
+
+        old = await client.get("/api/v1/logs/search", params={"q": "畑"}, headers=auth_headers)
+        new = await client.get("/api/v1/logs/search", params={"q": "海に"}, headers=auth_headers)
+
+        assert old.json()["items"] == []
+        assert [item["id"] for item in new.json()["items"]] == [log["id"]]
+
+    @pytest.mark.asyncio
+    async def test_search_pagination(self, client: AsyncClient, auth_headers):
+        """limit / offset でページをたどる"""
+        for i in range(3):
+            await _create_log(client, auth_headers, f"記録{i}", "仲間に感謝")
+
+        first = await client.get("/api/v1/logs/search", params={"q": "感謝", "limit": 2}, headers=auth_headers)
+        second = await client.get(
+            "/api/v1/logs/search",
+            params={"q": "感謝", "limit": 2, "offset": first.json()["next_offset"]},
+            headers=auth_headers,
+        )
+
+        assert len(first.json()["items"]) == 2
+        assert len(second.json()["items"]) == 1
+        assert second.json()["next_offset"] is None
+
+    @pytest.mark.asyncio
+    async def test_search_common_long_term(self, client: AsyncClient, auth_headers, monkeypatch):
+        """一致の多い長い語は新しい順にたどって候補を集める（結果は同じ）"""
+        monkeypatch.setattr(log_search, "SEARCH_PROBE", 2)
+        monkeypatch.setattr(log_search, "SEARCH_CANDIDATES", 2)
+        logs = [await _create_log(client, auth_headers, f"記録{i}", "ワークショップに参加した") for i in range(3)]
+
+        response = await client.get("/api/v1/logs/search", params={"q": "ワークショップ"}, headers=auth_headers)
+
+        # 候補は新しい2件
+        assert {item["id"] for item in response.json()["items"]} == {logs[1]["id"], logs[2]["id"]}
+
+    @pytest.mark.asyncio
+    async def test_search_log_deleted_during_search(self, client: AsyncClient, auth_headers, monkeypatch):
+        """候補を検索したあとに削除されたログは結果から除く"""
+        kept = await _create_log(client, auth_headers, "記録1", "畑で収穫")
+        deleted = await _create_log(client, auth_headers, "記録2", "畑で収穫")
+        find_candidates = logs_api.find_candidates
+
+        async def find_then_delete(db, *args):
+            candidates = await find_candidates(db, *args)
+            await db.execute(delete(Log).where(Log.id == UUID(deleted["id"])))
+            return candidates
+
+        monkeypatch.setattr(logs_api, "find_candidates", find_then_delete)
+        response = await client.get("/api/v1/logs/search", params={"q": "収穫"}, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [kept["id"]]
+
+    @pytest.mark.asyncio
+    async def test_search_blank_query(self, client: AsyncClient, auth_headers):
+        """空白だけの検索語は 400"""
+        response = await client.get("/api/v1/logs/search", params={"q": "　 "}, headers=auth_headers)
+
+        assert response.status_code == 400
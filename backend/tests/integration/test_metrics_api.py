@@ -0,0 +1,56 @@
+"""メトリクス API の統合テスト"""
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+
+
+class TestMetricsAPI:
+    """メトリクスAPI のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_metrics_records_route_and_sql(self, client: AsyncClient, auth_headers):
+        """ルートのパステンプレートごとにレイテンシとSQL回数を記録する"""
+        log = await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "メトリクス", "content": "内容"}
+        )
+        await client.get(f"/api/v1/logs/{log.json()['id']}", headers=auth_headers)
+
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        labels = 'method="GET",route="/api/v1/logs/{log_id}",status="200"'
+        assert f"http_request_duration_seconds_count{{{labels}}}" in body
+        sql_sum = re.search(r"http_request_sql_statements_sum\{%s\} (\S+)" % re.escape(labels), body)
+        assert sql_sum is not None and float(sql_sum.group(1)) >= 1
+        assert "# TYPE db_pool_idle gauge" in body
+        assert "user_cache_hits_total" in body
+
+    @pytest.mark.asyncio
+    async def test_unmatched_route_label(self, client: AsyncClient):
+        """存在しないパスはまとめて記録する（ラベルの種類を増やさない）"""
+        await client.get("/no-such-path/12345")
+
+        response = await client.get("/metrics")
+
+        assert 'route="<unmatched>",status="404"' in response.text
+        assert "/no-such-path/12345" not in response.text
+
+    @pytest.mark.asyncio
+    async def test_server_timing_header(self, client: AsyncClient, auth_headers, monkeypatch):
+        """開発環境では Server-Timing ヘッダーにSQLの回数と時間を出す"""
+        monkeypatch.setattr(settings, "ENVIRONMENT", "development")
+        response = await client.get("/api/v1/logs", headers=auth_headers)
+
+        assert re.match(r'app;dur=[\d.]+, db;dur=[\d.]+;desc="\d+ queries"', response.headers["server-timing"])
+
+        monkeypatch.setattr(settings, "ENVIRONMENT", "production")
+        response = await client.get("/api/v1/logs", headers=auth_headers)
+
+        assert "server-timing" not in response.headers
@@ -0,0 +1,169 @@
+"""ポイント付与のアウトボックス・ワーカーの統合テスト"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.models.point import Point
+from app.models.point_event import PointEvent
+from app.services import point_events
+from app.services.point_events import PointEventWorker, enqueue_point_event
+from app.services.points import get_balance
+
+
+@pytest.fixture
+def worker_mode(monkeypatch):
+    """ポイント付与をワーカーで反映するモードにする"""
+    monkeypatch.setattr(settings, "POINT_EVENTS_MODE", "worker")
+
+
+def _worker(test_db, batch_size=100, max_attempts=5) -> PointEventWorker:
+    session_factory = async_sessionmaker(test_db.bind, class_=AsyncSession, expire_on_commit=False)
+    return PointEventWorker(session_factory, batch_size=batch_size, poll_interval=0.01, max_attempts=max_attempts)
+
+
+async def _count(test_db, model) -> int:
+    return (await test_db.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestPointEvents:
+    """ポイント付与のアウトボックスのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_write_endpoint_only_records_event(self, client: AsyncClient, test_db, test_user, auth_headers, worker_mode):
+        """書き込みのエンドポイントはイベントを記録するだけで、ワーカーが反映する"""
+        response = await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "アウトボックス", "content": "内容"}
+        )
+        assert response.status_code == 201
+
+        assert await _count(test_db, Point) == 0
+        assert await get_balance(test_db, test_user.id) == 0
+
+        worker = _worker(test_db)
+        assert await worker.run_once() == 1
+        assert await worker.run_once() == 0
+
+        point = (await test_db.execute(select(Point))).scalar_one()
+        assert point.action_type == "log_create"
+        assert point.reference_id == response.json()["id"]
+        assert await get_balance(test_db, test_user.id) == 5
+        assert worker.stats() == {"processed": 1, "batches": 1, "errors": 0, "failed": 0}
+
+    @pytest.mark.asyncio
+    async def test_commit_wakes_worker(self, test_db, test_user, worker_mode, monkeypatch):
+        """コミットされたらワーカーを起こし、ロールバックでは起こさない"""
+        worker = _worker(test_db)
+        monkeypatch.setattr(point_events, "point_event_worker", worker)
+        user_id = test_user.id
+
+        await enqueue_point_event(test_db, user_id, "log_create", reference_id="1")
+        await test_db.rollback()
+        assert not worker._wakeup.is_set()
+        assert await _count(test_db, PointEvent) == 0
+
+        await enqueue_point_event(test_db, user_id, "log_create", reference_id="2")
+        await test_db.commit()
+        assert worker._wakeup.is_set()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_apply_each_event_once(self, test_db, test_user, test_user2, worker_mode):
+        """複数のワーカーが同時に動いても、各イベントは1回だけ反映される"""
+        for i in range(30):
+            user = test_user if i % 2 == 0 else test_user2
+            await enqueue_point_event(test_db, user.id, "event_join", reference_id=str(i))
+        await test_db.commit()
+
+        workers = [_worker(test_db, batch_size=4) for _ in range(3)]
+
+        async def drain(worker):
+            while await worker.run_once():
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(drain(worker) for worker in workers))
+
+        assert sum(worker.processed for worker in workers) == 30
+        assert await _count(test_db, Point) == 30
+        assert await get_balance(test_db, test_user.id) == 150
+        assert await get_balance(test_db, test_user2.id) == 150
+        unprocessed = await test_db.execute(
+            select(func.count()).select_from(PointEvent).where(PointEvent.processed_at.is_(None))
+        )
+        assert unprocessed.scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_award_handlers_receive_batch(self, test_db, test_user, worker_mode, monkeypatch):
+        """登録したハンドラーは反映されたポイントをバッチで受け取る"""
+        received = []
+
+        async def handler(db, points):
+            received.append([(point.action_type, point.amount) for point in points])
+
+        monkeypatch.setattr(point_events, "point_award_handlers", [handler])
+        await enqueue_point_event(test_db, test_user.id, "log_create", reference_id="log")
+        await enqueue_point_event(test_db, test_user.id, "step_complete", reference_id="step")
+        await test_db.commit()
+
+        await _worker(test_db).run_once()
+
+        assert received == [[("log_create", 5), ("step_complete", 10)]]
+
+    @pytest.mark.asyncio
+    async def test_background_worker_loop(self, test_db, test_user, worker_mode):
+        """起動したワーカーは通知を受けて反映する"""
+        worker = _worker(test_db)
+        worker.start()
+        try:
+            await enqueue_point_event(test_db, test_user.id, "event_create", reference_id="event")
+            await test_db.commit()
+            worker.notify()
+            for _ in range(100):
+                if worker.processed:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.stop()
+
+        assert worker.processed == 1
+        assert await get_balance(test_db, test_user.id) == 50
+
+    @pytest.mark.asyncio
+    async def test_failing_event_does_not_block_others(self, test_db, test_user, worker_mode):
+        """反映に失敗するイベントがあっても後ろのイベントは反映され、上限に達したら対象から外す"""
+        await enqueue_point_event(test_db, test_user.id, "log_create", reference_id="before")
+        # ルールが削除されたアクションなど、反映できないイベント
+        test_db.add(PointEvent(user_id=test_user.id, action_type="removed_action", created_at=datetime.now(timezone.utc)))
+        await enqueue_point_event(test_db, test_user.id, "step_complete", reference_id="after")
+        await test_db.commit()
+
+        worker = _worker(test_db, max_attempts=2)
+        assert await worker.run_once() == 3
+        assert await get_balance(test_db, test_user.id) == 15
+        assert worker.processed == 2
+
+        failing = (await test_db.execute(
+            select(PointEvent).where(PointEvent.action_type == "removed_action")
+        )).scalar_one()
+        assert failing.attempts == 1
+        assert failing.failed_at is None
+        assert "UnknownPointAction" in failing.last_error
+
+        # 上限に達したら failed_at を記録し、以後は処理しない
+        assert await worker.run_once() == 1
+        await test_db.refresh(failing)
+        assert failing.attempts == 2
+        assert failing.failed_at is not None
+        assert failing.processed_at is None
+        assert worker.stats()["failed"] == 1
+
+        await enqueue_point_event(test_db, test_user.id, "log_create", reference_id="later")
+        await test_db.commit()
+        assert await worker.run_once() == 1
+        assert await worker.run_once() == 0
+        assert await get_balance(test_db, test_user.id) == 20
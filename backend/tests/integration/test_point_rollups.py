@@ -0,0 +1,127 @@
+"""ポイントの期間別集計・推移 API の統合テスト"""
+from datetime import datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.point_event import PointEvent
+from app.models.point_rollup import PointRollup
+from app.services.point_events import apply_point_events
+from app.services.point_rollups import rebuild_point_rollups
+from app.services.point_rules import day_start
+
+
+def _today():
+    return day_start(datetime.now(timezone.utc)).date()
+
+
+async def _award(test_db, user, action_type: str, day, count: int = 1) -> None:
+    """day（POINTS_TIMEZONE の日付）の正午に count 件のアクションを反映する"""
+    created_at = datetime.combine(day, time(12), tzinfo=ZoneInfo(settings.POINTS_TIMEZONE))
+    events = [
+        PointEvent(
+            user_id=user.id,
+            action_type=action_type,
+            reference_id=f"{action_type}-{day}-{i}",
+            created_at=created_at,
+        )
+        for i in range(count)
+    ]
+    test_db.add_all(events)
+    await apply_point_events(test_db, events)
+    await test_db.commit()
+
+
+class TestPointSeriesAPI:
+    """ポイント推移 API のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_daily_series(self, client: AsyncClient, test_db, test_user, auth_headers):
+        """日別の推移（ポイントのない日は 0）"""
+        today = _today()
+        await _award(test_db, test_user, "event_join", today, count=2)
+        await _award(test_db, test_user, "log_create", today)
+        await _award(test_db, test_user, "event_join", today - timedelta(days=2))
+
+        response = await client.get(
+            f"/api/v1/users/me/points/series?granularity=day&from={today - timedelta(days=3)}&to={today}",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "day"
+        assert [bucket["bucket_start"] for bucket in data["buckets"]] == [
+            str(today - timedelta(days=offset)) for offset in (3, 2, 1, 0)
+        ]
+        assert [bucket["total"] for bucket in data["buckets"]] == [0, 10, 0, 25]
+        assert data["buckets"][-1]["count"] == 3
+        assert data["buckets"][-1]["by_action"] == {"event_join": 20, "log_create": 5}
+
+    @pytest.mark.asyncio
+    async def test_weekly_series(self, client: AsyncClient, test_db, test_user, auth_headers):
+        """週別の推移（月曜始まり）"""
+        monday = _today() - timedelta(days=_today().weekday())
+        await _award(test_db, test_user, "event_join", monday)
+        await _award(test_db, test_user, "event_join", monday + timedelta(days=6))
+        await _award(test_db, test_user, "event_join", monday - timedelta(days=1))
+
+        response = await client.get(
+            f"/api/v1/users/me/points/series?granularity=week&from={monday - timedelta(days=3)}&to={monday}",
+            headers=auth_headers,
+        )
+
+        data = response.json()
+        assert [(bucket["bucket_start"], bucket["total"]) for bucket in data["buckets"]] == [
+            (str(monday - timedelta(days=7)), 10),
+            (str(monday), 20),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_default_range(self, client: AsyncClient, test_user, auth_headers):
+        """期間を省略すると今日までの30日"""
+        response = await client.get("/api/v1/users/me/points/series", headers=auth_headers)
+
+        assert response.status_code == 200
+        buckets = response.json()["buckets"]
+        assert len(buckets) == 30
+        assert buckets[-1]["bucket_start"] == str(_today())
+
+    @pytest.mark.asyncio
+    async def test_invalid_range(self, client: AsyncClient, test_user, auth_headers):
+        """from が to より後、または期間が長すぎる場合は 400"""
+        reversed_range = await client.get(
+            "/api/v1/users/me/points/series?from=2026-10-10&to=2026-10-01",
+            headers=auth_headers,
+        )
+        too_long = await client.get(
+            "/api/v1/users/me/points/series?from=2020-01-01&to=2026-10-01",
+            headers=auth_headers,
+        )
+
+        assert reversed_range.status_code == 400
+        assert too_long.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, test_db, test_user, test_user2):
+        """points からの作り直しが増分の集計と一致する"""
+        today = _today()
+        await _award(test_db, test_user, "event_join", today, count=3)
+        await _award(test_db, test_user, "log_create", today - timedelta(days=8), count=2)
+        await _award(test_db, test_user2, "event_create", today)
+
+        query = select(
+            PointRollup.user_id, PointRollup.granularity, PointRollup.bucket_start,
+            PointRollup.action_type, PointRollup.total, PointRollup.count,
+        )
+        incremental = sorted((await test_db.execute(query)).all())
+
+        await rebuild_point_rollups(test_db, [test_user.id, test_user2.id])
+        await test_db.commit()
+        rebuilt = sorted((await test_db.execute(query)).all())
+
+        assert rebuilt == incremental
+        assert len(rebuilt) == 6
@@ -0,0 +1,148 @@
+"""ポイント付与ルールの統合テスト"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.point import Point
+from app.services.point_events import enqueue_point_event
+from app.services.point_rules import PointAction, PointRule, PointRuleEngine, UnknownPointAction, day_start
+from app.services.points import get_balance
+
+
+async def _points(test_db, user_id):
+    result = await test_db.execute(select(Point).where(Point.user_id == user_id))
+    return result.scalars().all()
+
+
+class TestPointRules:
+    """ポイント付与ルールのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_complete_step_awards_once(self, client: AsyncClient, test_db, test_user, auth_headers):
+        """同じステップを何度完了してもポイントは1回だけ"""
+        goal = await client.post("/api/v1/goals", headers=auth_headers, json={"title": "目標", "category": "activity"})
+        step = await client.post(
+            f"/api/v1/goals/{goal.json()['id']}/steps",
+            headers=auth_headers,
+            json={"title": "ステップ", "order": 1}
+        )
+
+        for _ in range(3):
+            response = await client.post(f"/api/v1/steps/{step.json()['id']}/complete", headers=auth_headers)
+            assert response.status_code == 200
+
+        assert [point.amount for point in await _points(test_db, test_user.id)] == [10]
+        assert await get_balance(test_db, test_user.id) == 10
+
+    @pytest.mark.asyncio
+    async def test_project_amount_by_category(self, client: AsyncClient, test_db, test_user, auth_headers):
+        """プロジェクト作成はカテゴリで付与量が変わる（あそと: 50, あそび: 30）"""
+        for category in ("asoto", "asobi"):
+            response = await client.post(
+                "/api/v1/projects",
+                headers=auth_headers,
+                json={
+                    "title": f"{category}プロジェクト",
+                    "description": "説明",
+                    "category": category,
+                    "start_date": datetime.now(timezone.utc).isoformat(),
+                    "location_type": "offline",
+                }
+            )
+            assert response.status_code == 201
+
+        amounts = sorted(point.amount for point in await _points(test_db, test_user.id))
+        assert amounts == [30, 50]
+
+    @pytest.mark.asyncio
+    async def test_daily_cap(self, client: AsyncClient, test_db, test_user, auth_headers):
+        """1日の上限を超えたログ投稿にはポイントを付与しない"""
+        for i in range(12):
+            response = await client.post(
+                "/api/v1/logs",
+                headers=auth_headers,
+                json={"title": f"ログ{i}", "content": "内容"}
+            )
+            assert response.status_code == 201
+
+        assert await get_balance(test_db, test_user.id) == 50
+        assert len(await _points(test_db, test_user.id)) == 10
+
+    @pytest.mark.asyncio
+    async def test_daily_cap_per_day(self, test_db, test_user):
+        """上限は日（POINTS_TIMEZONE）ごとに数える"""
+        engine = PointRuleEngine([PointRule("log_create", 5, daily_cap=10)])
+        today = day_start(datetime.now(timezone.utc)) + timedelta(hours=1)
+        yesterday = today - timedelta(days=1)
+        actions = [
+            PointAction(test_user.id, "log_create", occurred_at=moment, reference_id=f"{moment.date()}-{i}")
+            for moment in (yesterday, today)
+            for i in range(3)
+        ]
+
+        points = await engine.apply(test_db, actions)
+
+        assert len(points) == 4
+        assert sorted(point.reference_id for point in points) == [
+            f"{yesterday.date()}-0", f"{yesterday.date()}-1", f"{today.date()}-0", f"{today.date()}-1",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_dedupe(self, test_db, test_user):
+        """バッチ内と付与済みの重複は付与しない"""
+        engine = PointRuleEngine([PointRule("event_join", 10)])
+        now = datetime.now(timezone.utc)
+        first = await engine.apply(test_db, [PointAction(test_user.id, "event_join", now, reference_id="a")])
+        second = await engine.apply(test_db, [
+            PointAction(test_user.id, "event_join", now, reference_id="a"),
+            PointAction(test_user.id, "event_join", now, reference_id="b"),
+            PointAction(test_user.id, "event_join", now, reference_id="b"),
+        ])
+
+        assert [point.reference_id for point in first] == ["a"]
+        assert [point.reference_id for point in second] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_action(self, test_db, test_user):
+        """ルールのないアクションは記録できない"""
+        with pytest.raises(UnknownPointAction):
+            await enqueue_point_event(test_db, test_user.id, "unknown_action")
+
+    @pytest.mark.asyncio
+    async def test_double_submission_race(self, test_db, test_user):
+        """同じアクションを別々のトランザクションで同時に付与しても1回だけ"""
+        session_factory = async_sessionmaker(test_db.bind, class_=AsyncSession, expire_on_commit=False)
+        user_id = test_user.id
+
+        async def submit():
+            async with session_factory() as session:
+                await enqueue_point_event(session, user_id, "event_join", reference_id="same-event")
+                await asyncio.sleep(0.05)
+                await session.commit()
+
+        await asyncio.gather(*(submit() for _ in range(5)))
+
+        count = await test_db.execute(select(func.count()).select_from(Point).where(Point.user_id == user_id))
+        assert count.scalar() == 1
+        assert await get_balance(test_db, user_id) == 10
+
+    @pytest.mark.asyncio
+    async def test_daily_cap_race(self, test_db, test_user):
+        """別々のトランザクションが同時に付与しても1日の上限を超えない"""
+        session_factory = async_sessionmaker(test_db.bind, class_=AsyncSession, expire_on_commit=False)
+        user_id = test_user.id
+
+        async def submit(batch):
+            async with session_factory() as session:
+                for i in range(6):
+                    await enqueue_point_event(session, user_id, "log_create", reference_id=f"{batch}-{i}")
+                await asyncio.sleep(0.05)
+                await session.commit()
+
+        await asyncio.gather(*(submit(batch) for batch in range(3)))
+
+        assert await get_balance(test_db, user_id) == 50
@@ -3,6 +3,9 @@ import pytest
 from httpx import AsyncClient
 from datetime import datetime, timedelta
 
+from app.models.point import Point
+from app.services.points import award_points, get_balance, reconcile_balances
+
 
 class TestPointsAPI:
     """ポイントAPI のテスト"""
@@ -126,6 +129,51 @@ class TestPointsAPI:
         for point in data:
             assert "earned_at" in point
 
+    @pytest.mark.asyncio
+    async def test_balance_updated_on_award(self, client: AsyncClient, auth_headers):
+        """ポイント付与時に残高が更新されるテスト"""
+        await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "残高テストログ", "content": "内容"}
+        )
+        start_date = datetime.now() + timedelta(days=7)
+        await client.post(
+            "/api/v1/events",
+            headers=auth_headers,
+            json={
+                "title": "残高テストイベント",
+                "start_date": start_date.isoformat(),
+                "location_type": "online",
+            }
+        )
+
+        response = await client.get("/api/v1/users/me/points", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["total_points"] == 55
+
+    @pytest.mark.asyncio
+    async def test_reconcile_point_balances(self, test_db, test_user):
+        """残高の再計算でずれを検出・修正するテスト"""
+        await award_points(test_db, test_user.id, 10, "step_complete", "step-1")
+        # 残高を更新せずにポイントを追加（ずれを作る）
+        test_db.add(Point(user_id=test_user.id, amount=5, action_type="log_create"))
+        await test_db.commit()
+
+        drifts = await reconcile_balances(test_db)
+        assert len(drifts) == 1
+        assert drifts[0].user_id == test_user.id
+        assert drifts[0].recorded == 10
+        assert drifts[0].actual == 15
+        assert await get_balance(test_db, test_user.id) == 10
+
+        await reconcile_balances(test_db, fix=True)
+        await test_db.commit()
+
+        assert await get_balance(test_db, test_user.id) == 15
+        assert await reconcile_balances(test_db) == []
+
     @pytest.mark.asyncio
     async def test_unauthorized_access(self, client: AsyncClient):
         """認証なしでのアクセステスト"""
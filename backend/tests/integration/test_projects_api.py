@@ -84,6 +84,42 @@ class TestProjectsAPI:
         assert isinstance(data, list)
         assert len(data) >= 2
 
+    @pytest.mark.asyncio
+    async def test_get_projects_cursor_pagination(self, client: AsyncClient, auth_headers):
+        """プロジェクト一覧のカーソルページネーションのテスト"""
+        start_date = datetime.now()
+        for i in range(3):
+            await client.post(
+                "/api/v1/projects",
+                headers=auth_headers,
+                json={
+                    "title": f"ページプロジェクト{i+1}",
+                    "category": "asobi",
+                    "start_date": start_date.isoformat(),
+                    "location_type": "online",
+                }
+            )
+
+        response = await client.get("/api/v1/projects?limit=2", headers=auth_headers)
+
+        assert response.status_code == 200
+        first_page = response.json()
+        assert len(first_page["items"]) == 2
+        assert first_page["next_cursor"] is not None
+
+        response = await client.get(
+            "/api/v1/projects",
+            headers=auth_headers,
+            params={"limit": 2, "cursor": first_page["next_cursor"]}
+        )
+
+        assert response.status_code == 200
+        second_page = response.json()
+        assert len(second_page["items"]) == 1
+        assert second_page["next_cursor"] is None
+        ids = {p["id"] for p in first_page["items"] + second_page["items"]}
+        assert len(ids) == 3
+
     @pytest.mark.asyncio
     async def test_get_project_by_id(self, client: AsyncClient, auth_headers):
         """プロジェクト詳細取得のテスト"""
@@ -461,3 +497,61 @@ class TestProjectsAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["is_recruiting"] == False
+
+    @pytest.mark.asyncio
+    async def test_filter_projects_by_tags(self, client: AsyncClient, auth_headers):
+        """タグでのプロジェクト絞り込みのテスト"""
+        for i, tags in enumerate([["農業", "地域"], ["地域"], ["アート"]]):
+            await client.post(
+                "/api/v1/projects",
+                headers=auth_headers,
+                json={
+                    "title": f"タグプロジェクト{i}",
+                    "category": "asobi",
+                    "start_date": datetime.now().isoformat(),
+                    "location_type": "online",
+                    "tags": tags,
+                }
+            )
+
+        response = await client.get(
+            "/api/v1/projects",
+            headers=auth_headers,
+            params={"tags": ["地域"], "limit": 10}
+        )
+        assert response.status_code == 200
+        assert {p["title"] for p in response.json()["items"]} == {"タグプロジェクト0", "タグプロジェクト1"}
+
+        response = await client.get(
+            "/api/v1/projects",
+            headers=auth_headers,
+            params={"tags": ["農業", "アート"], "tag_mode": "any"}
+        )
+        assert response.status_code == 200
+        assert {p["title"] for p in response.json()} == {"タグプロジェクト0", "タグプロジェクト2"}
+
+    @pytest.mark.asyncio
+    async def test_get_projects_fields(self, client: AsyncClient, auth_headers):
+        """fields=summary は説明を含まない要約を返す"""
+        await client.post(
+            "/api/v1/projects",
+            headers=auth_headers,
+            json={
+                "title": "要約プロジェクト",
+                "description": "長い説明",
+                "category": "asoto",
+                "start_date": datetime.now().isoformat(),
+                "location_type": "online",
+                "tags": ["地域"],
+            }
+        )
+
+        response = await client.get("/api/v1/projects", headers=auth_headers, params={"fields": "summary"})
+        assert response.status_code == 200
+        project = response.json()[0]
+        assert project["title"] == "要約プロジェクト"
+        assert project["tags"] == ["地域"]
+        assert "description" not in project
+
+        response = await client.get("/api/v1/projects", headers=auth_headers, params={"fields": "id,tasks"})
+        assert response.status_code == 400
@@ -0,0 +1,178 @@
+"""リクエストごとのクエリ数のテスト
+
+主要なエンドポイントが発行する SQL の数に上限（予算）を設け、
+N+1 や余分な存在確認が入り込んだら失敗させる。
+認証ユーザーはキャッシュ済み（定常状態）の前提で数える。
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.event import Event, EventStatus, LocationType
+from app.models.event_participant import EventParticipant, ParticipantStatus
+from app.models.goal import Goal, GoalCategory
+from app.models.log import Log, LogVisibility
+from app.models.step import Step
+from app.models.user import User
+
+
+async def _warm_up(client: AsyncClient, headers: dict) -> None:
+    """認証ユーザーをキャッシュに載せる"""
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+
+
+async def _add_users(db: AsyncSession, count: int, prefix: str) -> list:
+    users = [
+        User(email=f"{prefix}{i}@example.com", hashed_password="x", full_name=f"{prefix}{i}", is_active=True)
+        for i in range(count)
+    ]
+    db.add_all(users)
+    await db.commit()
+    return users
+
+
+class TestQueryCounts:
+    """エンドポイントごとのクエリ数"""
+
+    @pytest.mark.asyncio
+    async def test_dashboard_single_strategy(self, client: AsyncClient, auth_headers, query_counter, monkeypatch):
+        """single はコミュニティエリアの再計算を含めて2クエリ以内"""
+        monkeypatch.setattr(settings, "DASHBOARD_QUERY_STRATEGY", "single")
+        await _warm_up(client, auth_headers)
+
+        with query_counter.count() as queries:
+            response = await client.get("/api/v1/dashboard", headers=auth_headers)
+        assert response.status_code == 200
+        queries.assert_at_most(2)
+
+        # コミュニティエリアがキャッシュ済みなら個人エリアの1クエリだけ
+        with query_counter.count() as queries:
+            await client.get("/api/v1/dashboard", headers=auth_headers)
+        queries.assert_at_most(1)
+
+    @pytest.mark.asyncio
+    async def test_dashboard_sequential_strategy(self, client: AsyncClient, auth_headers, query_counter, monkeypatch):
+        """sequential は部分ごとに1クエリ"""
+        monkeypatch.setattr(settings, "DASHBOARD_QUERY_STRATEGY", "sequential")
+        await _warm_up(client, auth_headers)
+
+        with query_counter.count() as queries:
+            await client.get("/api/v1/dashboard", headers=auth_headers)
+        queries.assert_at_most(5)
+
+        with query_counter.count() as queries:
+            await client.get("/api/v1/dashboard", headers=auth_headers)
+        queries.assert_at_most(3)
+
+    @pytest.mark.asyncio
+    async def test_participants_constant(
+        self, client: AsyncClient, test_db: AsyncSession, test_user, auth_headers, query_counter
+    ):
+        """参加者一覧は参加者数によらず1クエリ（存在確認を含む）"""
+        await _warm_up(client, auth_headers)
+        event = Event(
+            owner_id=test_user.id,
+            title="クエリ数",
+            start_date=datetime.now(timezone.utc) + timedelta(days=7),
+            location_type=LocationType.ONLINE,
+            status=EventStatus.UPCOMING,
+        )
+        test_db.add(event)
+        await test_db.commit()
+        path = f"/api/v1/events/{event.id}/participants"
+
+        counts = []
+        # 参加者を 0 → 1 → 10 人に増やしながら数える
+        for added in (0, 1, 9):
+            users = await _add_users(test_db, added, f"participant{len(counts)}-")
+            test_db.add_all([
+                EventParticipant(event_id=event.id, user_id=user.id, status=ParticipantStatus.JOINED)
+                for user in users
+            ])
+            await test_db.commit()
+
+            with query_counter.count() as queries:
+                response = await client.get(path, headers=auth_headers)
+            assert response.status_code == 200
+            counts.append((len(queries), len(response.json())))
+
+        assert counts == [(1, 0), (1, 1), (1, 10)]
+
+        with query_counter.count() as queries:
+            response = await client.get(
+                "/api/v1/events/00000000-0000-0000-0000-000000000000/participants", headers=auth_headers
+            )
+        assert response.status_code == 404
+        queries.assert_at_most(1)
+
+    @pytest.mark.asyncio
+    async def test_lists_constant(
+        self, client: AsyncClient, test_db: AsyncSession, test_user, auth_headers, query_counter
+    ):
+        """一覧は件数によらず一定のクエリ数（関連の読み込みで N+1 にならない）"""
+        await _warm_up(client, auth_headers)
+        paths = ["/api/v1/logs?limit=20", "/api/v1/goals", "/api/v1/events?limit=20"]
+
+        async def measure():
+            counts = {}
+            for path in paths:
+                with query_counter.count() as queries:
+                    response = await client.get(path, headers=auth_headers)
+                assert response.status_code == 200, (path, response.text)
+                counts[path] = len(queries)
+            return counts
+
+        def add_rows(count: int):
+            for i in range(count):
+                goal = Goal(user_id=test_user.id, title=f"目標{i}", category=GoalCategory.ACTIVITY)
+                goal.steps = [Step(order=order, title=f"ステップ{order}") for order in range(3)]
+                test_db.add(goal)
+                test_db.add(Log(user_id=test_user.id, title=f"ログ{i}", content="内容", visibility=LogVisibility.PUBLIC))
+                test_db.add(Event(
+                    owner_id=test_user.id,
+                    title=f"イベント{i}",
+                    start_date=datetime.now(timezone.utc) + timedelta(days=i + 1),
+                    location_type=LocationType.ONLINE,
+                    status=EventStatus.UPCOMING,
+                ))
+
+        add_rows(1)
+        await test_db.commit()
+        few = await measure()
+        add_rows(15)
+        await test_db.commit()
+        many = await measure()
+
+        assert many == few
+        assert max(many.values()) <= 1
+
+    @pytest.mark.asyncio
+    async def test_leaderboards(self, client: AsyncClient, test_user, auth_headers, query_counter):
+        """ランキングは上位と自分の順位で2クエリ、プロジェクト内は存在確認を含めて3クエリ"""
+        await _warm_up(client, auth_headers)
+        await client.post("/api/v1/logs", headers=auth_headers, json={"title": "t", "content": "c"})
+        project = (await client.post(
+            "/api/v1/projects",
+            headers=auth_headers,
+            json={
+                "title": "プロジェクト",
+                "description": "説明",
+                "category": "asoto",
+                "start_date": datetime.now(timezone.utc).isoformat(),
+                "location_type": "online",
+            },
+        )).json()
+
+        with query_counter.count() as queries:
+            response = await client.get("/api/v1/leaderboards/all", headers=auth_headers)
+        assert response.json()["me"]["rank"] == 1
+        queries.assert_at_most(2)
+
+        with query_counter.count() as queries:
+            response = await client.get(f"/api/v1/projects/{project['id']}/leaderboard", headers=auth_headers)
+        assert response.json()["me"]["rank"] == 1
+        queries.assert_at_most(3)
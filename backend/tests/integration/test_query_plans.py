@@ -0,0 +1,168 @@
+"""主要エンドポイントのクエリプランのテスト
+
+大きめのデータを投入した状態で各エンドポイントを呼び出し、発行された SELECT を
+EXPLAIN してシーケンシャルスキャンが含まれていないことを確認する。
+ページネーションなしの一覧（全件返却）は対象外。
+"""
+import json
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO users (id, email, hashed_password, full_name, is_active, role, created_at, updated_at)
+    SELECT gen_random_uuid(), 'plan' || i || '@example.com', 'x', 'Plan ' || i, true, 'USER', now(), now()
+    FROM generate_series(1, 2000) AS i
+    """,
+    """
+    INSERT INTO goals (id, user_id, title, category, status, progress, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, '目標' || g, 'ACTIVITY',
+           (CASE WHEN g % 3 = 0 THEN 'COMPLETED' ELSE 'ACTIVE' END)::goalstatus,
+           0, now() - g * interval '1 day', now()
+    FROM users u, generate_series(1, 5) AS g
+    """,
+    """
+    INSERT INTO steps (id, goal_id, "order", title, status, created_at, updated_at)
+    SELECT gen_random_uuid(), g.id, s, 'ステップ' || s, 'PENDING', now(), now()
+    FROM goals g, generate_series(1, 3) AS s
+    """,
+    """
+    INSERT INTO logs (id, user_id, title, content, tags, visibility, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, 'ログ' || l, '内容',
+           jsonb_build_array('タグ' || (l % 50)),
+           (CASE WHEN l % 10 = 0 THEN 'PUBLIC' ELSE 'PRIVATE' END)::logvisibility,
+           now() - (l || ' hours')::interval - random() * interval '1 hour', now()
+    FROM users u, generate_series(1, 20) AS l
+    """,
+    """
+    INSERT INTO points (id, user_id, amount, action_type, created_at)
+    SELECT gen_random_uuid(), u.id, 5, 'log_create', now() - p * interval '1 hour'
+    FROM users u, generate_series(1, 20) AS p
+    """,
+    """
+    INSERT INTO user_point_balances (user_id, balance, updated_at)
+    SELECT id, 100, now() FROM users
+    """,
+    """
+    INSERT INTO events (id, owner_id, title, start_date, location_type, tags, status, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, 'イベント', now() + (random() * 730 - 700) * interval '1 day',
+           'ONLINE', '[]'::jsonb, 'UPCOMING', now(), now()
+    FROM users u
+    """,
+    """
+    INSERT INTO event_participants (id, event_id, user_id, status, joined_at, created_at)
+    SELECT gen_random_uuid(), e.id, u.id, 'JOINED', now() - random() * interval '30 days', now()
+    FROM (SELECT id, row_number() OVER () AS rn FROM events) e
+    JOIN (SELECT id, row_number() OVER () AS rn FROM users) u ON u.rn % 200 = e.rn % 200
+    """,
+    """
+    INSERT INTO projects (id, owner_id, title, category, status, start_date, location_type,
+                          is_recruiting, required_skills, tags, visibility, created_at, updated_at)
+    SELECT gen_random_uuid(), u.id, 'プロジェクト', 'ASOBI', 'RECRUITING', now(), 'ONLINE',
+           true, '[]'::jsonb, '[]'::jsonb, 'PUBLIC', now() - random() * interval '365 days', now()
+    FROM users u
+    """,
+]
+
+
+def _seq_scans(plan: Dict[str, Any]) -> List[str]:
+    """プランツリーからシーケンシャルスキャンされているテーブルを集める"""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+@pytest.fixture
+async def large_dataset(test_db: AsyncSession, test_user: User) -> AsyncSession:
+    """テストユーザーを含む全ユーザーにデータを投入"""
+    for statement in SEED_STATEMENTS:
+        await test_db.execute(text(statement))
+    await test_db.commit()
+    await test_db.execute(text("ANALYZE"))
+    return test_db
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+class TestQueryPlans:
+    """主要エンドポイントのクエリプラン"""
+
+    async def _capture_selects(
+        self, db: AsyncSession, client: AsyncClient, headers: dict, paths: List[str]
+    ) -> List[Tuple[str, str, Any]]:
+        """各パスを呼び出し、発行された SELECT を (パス, SQL, パラメータ) で返す"""
+        captured = []
+        current = {}
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                captured.append((current["path"], statement, parameters))
+
+        engine = db.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            for path in paths:
+                current["path"] = path
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, (path, response.text)
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        return captured
+
+    @pytest.mark.asyncio
+    async def test_no_seq_scan_on_hot_paths(self, client: AsyncClient, large_dataset: AsyncSession, auth_headers):
+        """ホットパスのクエリにシーケンシャルスキャンがないこと"""
+        db = large_dataset
+
+        log_id = (await db.execute(text("SELECT id FROM logs WHERE visibility = 'PUBLIC' LIMIT 1"))).scalar()
+        event_id = (await db.execute(text("SELECT id FROM events LIMIT 1"))).scalar()
+        project_id = (await db.execute(text("SELECT id FROM projects LIMIT 1"))).scalar()
+        goal_id = (await db.execute(text("SELECT id FROM goals LIMIT 1"))).scalar()
+
+        first_page = await client.get("/api/v1/logs", params={"limit": 20}, headers=auth_headers)
+        log_cursor = first_page.json()["next_cursor"]
+
+        paths = [
+            "/api/v1/dashboard",
+            "/api/v1/logs?limit=20",
+            f"/api/v1/logs?limit=20&cursor={log_cursor}",
+            "/api/v1/logs?limit=20&visibility=public",
+            "/api/v1/logs?limit=20&visibility=private",
+            "/api/v1/logs?limit=20&tag=タグ7",
+            "/api/v1/logs?limit=20&tags=タグ7&tags=タグ8&tag_mode=any",
+            f"/api/v1/logs/{log_id}",
+            "/api/v1/events?limit=20",
+            f"/api/v1/events/{event_id}",
+            f"/api/v1/events/{event_id}/participants",
+            "/api/v1/projects?limit=20",
+            f"/api/v1/projects/{project_id}",
+            "/api/v1/goals",
+            f"/api/v1/goals/{goal_id}",
+            "/api/v1/users/me/points",
+            "/api/v1/users/me/points/history",
+        ]
+        captured = await self._capture_selects(db, client, auth_headers, paths)
+        assert captured
+
+        conn = await db.connection()
+        failures = []
+        for path, statement, parameters in captured:
+            plan_result = await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters)
+            plan = plan_result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            scans = _seq_scans(plan[0]["Plan"])
+            if scans:
+                failures.append(f"{path}: Seq Scan on {scans}\n{statement}")
+
+        assert not failures, "\n\n".join(failures)
@@ -0,0 +1,86 @@
+"""読み取りレプリカへの振り分けの統合テスト"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core import database
+from app.core.replica import recent_writers
+from tests.conftest import TEST_DATABASE_URL
+from tests.integration.test_auth_api import RemoteCacheBackend
+
+
+@pytest.fixture
+async def replica(monkeypatch):
+    """テスト用DBをレプリカとして設定し、レプリカで実行されたSQLを記録"""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    monkeypatch.setattr(
+        database,
+        "ReplicaSessionLocal",
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+    )
+    yield statements
+    await engine.dispose()
+
+
+class TestReadReplica:
+    """読み取りレプリカへの振り分けのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_reads_use_replica(self, client: AsyncClient, auth_headers, replica):
+        """読み取りはレプリカで実行される"""
+        response = await client.get("/api/v1/logs", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert any("FROM logs" in statement for statement in replica)
+
+    @pytest.mark.asyncio
+    async def test_reads_after_write_use_primary(self, client: AsyncClient, auth_headers, replica):
+        """書き込んだ直後のユーザーはプライマリから読む"""
+        await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "書き込み直後", "content": "内容", "visibility": "private"}
+        )
+
+        response = await client.get("/api/v1/logs", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert [log["title"] for log in response.json()] == ["書き込み直後"]
+        assert replica == []
+
+        # 期間が過ぎたらレプリカに戻る
+        await recent_writers.clear()
+        await client.get("/api/v1/logs", headers=auth_headers)
+        assert any("FROM logs" in statement for statement in replica)
+
+    @pytest.mark.asyncio
+    async def test_other_users_read_from_replica(self, client: AsyncClient, auth_headers, auth_headers2, replica):
+        """書き込んでいないユーザーはレプリカから読む"""
+        await client.post(
+            "/api/v1/logs",
+            headers=auth_headers,
+            json={"title": "公開ログ", "content": "内容", "visibility": "public"}
+        )
+
+        await client.get("/api/v1/logs", headers=auth_headers2)
+
+        assert any("FROM logs" in statement for statement in replica)
+
+    @pytest.mark.asyncio
+    async def test_remote_sticky_backend_recorded_before_response(
+        self, client: AsyncClient, auth_headers, test_user, replica, monkeypatch
+    ):
+        """外部バックエンドでも、書き込みのレスポンスより前に記録が終わる"""
+        backend = RemoteCacheBackend()
+        monkeypatch.setattr(recent_writers, "backend", backend)
+
+        await client.post("/api/v1/logs", headers=auth_headers, json={"title": "書き込み", "content": "内容"})
+
+        assert str(test_user.id) in backend.data
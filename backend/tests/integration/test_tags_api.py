@@ -0,0 +1,140 @@
+"""タグ API の統合テスト"""
+import pytest
+from httpx import AsyncClient
+from datetime import datetime, timedelta
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class TestTagsAPI:
+    """タグAPI のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_get_log_tag_counts(self, client: AsyncClient, auth_headers):
+        """公開ログのタグ件数のテスト"""
+        for tags, visibility in [
+            (["農業", "地域"], "public"),
+            (["農業"], "public"),
+            (["読書"], "public"),
+            (["農業", "秘密"], "private"),
+        ]:
+            await client.post(
+                "/api/v1/logs",
+                headers=auth_headers,
+                json={"title": "タグ集計", "content": "内容", "tags": tags, "visibility": visibility}
+            )
+
+        response = await client.get("/api/v1/tags", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"tag": "農業", "count": 2},
+            {"tag": "地域", "count": 1},
+            {"tag": "読書", "count": 1},
+        ]
+
+        response = await client.get("/api/v1/tags", headers=auth_headers, params={"limit": 1})
+        assert response.json() == [{"tag": "農業", "count": 2}]
+
+    @pytest.mark.asyncio
+    async def test_get_event_tag_counts(self, client: AsyncClient, auth_headers):
+        """イベントのタグ件数のテスト"""
+        for tags in [["読書会", "オンライン"], ["読書会"]]:
+            await client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "title": "タグ集計イベント",
+                    "start_date": (datetime.now() + timedelta(days=1)).isoformat(),
+                    "location_type": "online",
+                    "tags": tags,
+                }
+            )
+
+        response = await client.get("/api/v1/tags", headers=auth_headers, params={"source": "events"})
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"tag": "読書会", "count": 2},
+            {"tag": "オンライン", "count": 1},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_tag_counts_follow_updates_and_deletes(self, client: AsyncClient, auth_headers, test_db: AsyncSession):
+        """作成・更新・削除に合わせて tag_counts が更新される"""
+        log_ids = []
+        for tags, visibility in [(["農業", "地域"], "public"), (["農業"], "private")]:
+            response = await client.post(
+                "/api/v1/logs",
+                headers=auth_headers,
+                json={"title": "タグ集計", "content": "内容", "tags": tags, "visibility": visibility}
+            )
+            log_ids.append(response.json()["id"])
+        # タグの変更と、非公開から公開への変更
+        await client.patch(f"/api/v1/logs/{log_ids[0]}", headers=auth_headers, json={"tags": ["農業", "読書"]})
+        await client.patch(f"/api/v1/logs/{log_ids[1]}", headers=auth_headers, json={"visibility": "public"})
+
+        response = await client.get("/api/v1/tags", headers=auth_headers)
+        assert response.json() == [{"tag": "農業", "count": 2}, {"tag": "読書", "count": 1}]
+
+        await client.delete(f"/api/v1/logs/{log_ids[0]}", headers=auth_headers)
+        response = await client.get("/api/v1/tags", headers=auth_headers)
+        assert response.json() == [{"tag": "農業", "count": 1}]
+
+        response = await client.post(
+            "/api/v1/events",
+            headers=auth_headers,
+            json={
+                "title": "タグ集計イベント",
+                "start_date": (datetime.now() + timedelta(days=1)).isoformat(),
+                "location_type": "online",
+                "tags": ["読書会"],
+            }
+        )
+        event_id = response.json()["id"]
+        await client.patch(f"/api/v1/events/{event_id}", headers=auth_headers, json={"tags": ["対話"]})
+        response = await client.get("/api/v1/tags", headers=auth_headers, params={"source": "events"})
+        assert response.json() == [{"tag": "対話", "count": 1}]
+
+        response = await client.post(
+            "/api/v1/projects",
+            headers=auth_headers,
+            json={
+                "title": "哲学カフェ",
+                "category": "asobi",
+                "start_date": datetime.now().isoformat(),
+                "location_type": "hybrid",
+                "tags": ["哲学", "対話"],
+            }
+        )
+        project_id = response.json()["id"]
+        response = await client.get("/api/v1/tags", headers=auth_headers, params={"source": "projects"})
+        assert response.json() == [{"tag": "哲学", "count": 1}, {"tag": "対話", "count": 1}]
+        await client.delete(f"/api/v1/projects/{project_id}", headers=auth_headers)
+        response = await client.get("/api/v1/tags", headers=auth_headers, params={"source": "projects"})
+        assert response.json() == []
+
+        # tags 列をその場で集計した結果と一致する
+        result = await test_db.execute(text("""
+            SELECT 'logs' AS source, tag, COUNT(*) AS count
+            FROM logs, jsonb_array_elements_text(logs.tags) AS tag WHERE visibility = 'PUBLIC' GROUP BY tag
+            UNION ALL
+            SELECT 'events', tag, COUNT(*) FROM events, jsonb_array_elements_text(events.tags) AS tag GROUP BY tag
+            UNION ALL
+            SELECT 'projects', tag, COUNT(*) FROM projects, jsonb_array_elements_text(projects.tags) AS tag GROUP BY tag
+        """))
+        expected = set(result.all())
+        result = await test_db.execute(text("SELECT source, tag, count FROM tag_counts"))
+        assert set(result.all()) == expected
+
+    @pytest.mark.asyncio
+    async def test_get_tag_counts_invalid_source(self, client: AsyncClient, auth_headers):
+        """不正な集計対象は 422"""
+        response = await client.get("/api/v1/tags", headers=auth_headers, params={"source": "users"})
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_get_tag_counts_unauthorized(self, client: AsyncClient):
+        """認証なしでのアクセステスト"""
+        response = await client.get("/api/v1/tags")
+        assert response.status_code == 403
@@ -24,6 +24,20 @@ class TestUsersAPI:
         assert "user_id" in data
         assert data["bio"] == "テストユーザー"
 
+    @pytest.mark.asyncio
+    async def test_me_profile_not_shadowed_by_user_id(self, client: AsyncClient, auth_headers, auth_headers2, test_user):
+        """/users/me/profile は /users/{user_id}/profile より優先され、"me" は user_id として解釈されない"""
+        await client.patch("/api/v1/users/me/profile", headers=auth_headers, json={"bio": "ユーザー1"})
+        await client.patch("/api/v1/users/me/profile", headers=auth_headers2, json={"bio": "ユーザー2"})
+
+        mine = await client.get("/api/v1/users/me/profile", headers=auth_headers2)
+        other = await client.get(f"/api/v1/users/{test_user.id}/profile", headers=auth_headers2)
+
+        assert mine.status_code == 200
+        assert mine.json()["bio"] == "ユーザー2"
+        assert other.status_code == 200
+        assert other.json()["bio"] == "ユーザー1"
+
     @pytest.mark.asyncio
     async def test_update_my_profile(self, client: AsyncClient, auth_headers):
         """プロフィール更新のテスト"""
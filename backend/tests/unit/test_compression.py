@@ -0,0 +1,121 @@
+"""圧縮ミドルウェアの単体テスト"""
+import gzip
+import json
+
+import brotli
+import pytest
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+ITEMS = [{"title": f"振り返り {i}", "content": "畑で収穫のワークショップに参加した。" * 5} for i in range(200)]
+
+
+def _app(**options) -> Starlette:
+    async def items(request):
+        return JSONResponse(ITEMS)
+
+    async def small(request):
+        return JSONResponse({"status": "ok"})
+
+    async def stream(request):
+        async def chunks():
+            for item in ITEMS:
+                yield json.dumps(item, ensure_ascii=False).encode() + b"\n"
+        return StreamingResponse(chunks(), media_type="application/x-ndjson; charset=utf-8")
+
+    async def image(request):
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    async def encoded(request):
+        return Response(gzip.compress(b"a" * 5000), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+    app = Starlette(routes=[
+        Route("/items", items), Route("/small", small), Route("/stream", stream),
+        Route("/image", image), Route("/encoded", encoded),
+    ])
+    app.add_middleware(CompressionMiddleware, **options)
+    return app
+
+
+async def _get(app: Starlette, path: str, accept_encoding: str):
+    """展開せずに本文を受け取る"""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+            return response, b"".join([chunk async for chunk in response.aiter_raw()])
+
+
+@pytest.mark.unit
+def test_negotiate_encoding():
+    """q 値の高いものを選び、同じ q 値ならサーバーの優先順。q=0 は除く"""
+    assert negotiate_encoding("gzip, deflate, br", ["br", "gzip"]) == "br"
+    assert negotiate_encoding("gzip, br;q=0", ["br", "gzip"]) == "gzip"
+    assert negotiate_encoding("gzip, br;q=0.1", ["br", "gzip"]) == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br;q=0.5", ["br", "gzip"]) == "br"
+    assert negotiate_encoding("br;q=0.2, *;q=0.8", ["br", "gzip"]) == "gzip"
+    assert negotiate_encoding("*", ["br", "gzip"]) == "br"
+    assert negotiate_encoding("identity", ["br", "gzip"]) is None
+    assert negotiate_encoding("", ["br", "gzip"]) is None
+
+
+@pytest.mark.unit
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        CompressionMiddleware(Starlette(), encodings=["zstd"])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("encoding, decompress", [("br", brotli.decompress), ("gzip", gzip.decompress)])
+async def test_compress_json(encoding, decompress):
+    """一覧は圧縮し、Content-Length は圧縮後の長さ"""
+    response, raw = await _get(_app(), "/items", encoding)
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert json.loads(decompress(raw)) == ITEMS
+    assert len(raw) * 5 < len(json.dumps(ITEMS, ensure_ascii=False).encode())
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_skip_small_and_binary():
+    """小さい本文・画像・圧縮済みの本文はそのまま"""
+    app = _app()
+
+    response, raw = await _get(app, "/small", "gzip")
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert json.loads(raw) == {"status": "ok"}
+
+    response, raw = await _get(app, "/image", "gzip")
+    assert "content-encoding" not in response.headers
+    assert raw == b"\x89PNG" * 1000
+
+    response, raw = await _get(app, "/encoded", "br")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(raw) == b"a" * 5000
+
+    response, raw = await _get(app, "/items", "identity")
+    assert "content-encoding" not in response.headers
+    assert json.loads(raw) == ITEMS
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/stream", "/items"])
+async def test_streaming(path):
+    """StreamingResponse と stream_chunk_size を超える本文は、分割して圧縮しながら送る"""
+    response, raw = await _get(_app(stream_chunk_size=4096), path, "gzip")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    body = gzip.decompress(raw).decode()
+    if path == "/stream":
+        assert [json.loads(line) for line in body.splitlines()] == ITEMS
+    else:
+        assert json.loads(body) == ITEMS
@@ -0,0 +1,32 @@
+"""DB接続設定の単体テスト"""
+import pytest
+
+from app.core.config import settings
+from app.core.database import engine_options
+
+
+@pytest.mark.unit
+def test_engine_options_from_settings(monkeypatch):
+    """設定値が接続プールと asyncpg のオプションに反映される"""
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 0)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    options = engine_options()
+
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 0
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "5000"
+
+
+@pytest.mark.unit
+def test_engine_options_without_statement_timeout(monkeypatch):
+    """statement_timeout が 0 の場合はサーバー設定を送らない"""
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 0)
+
+    options = engine_options()
+
+    assert "statement_timeout" not in options["connect_args"]["server_settings"]
@@ -0,0 +1,38 @@
+"""メトリクスの単体テスト"""
+import pytest
+
+from app.core.metrics import Histogram, MetricsRegistry, RequestStats
+
+
+@pytest.mark.unit
+def test_histogram_render():
+    """累積バケット・合計・件数を Prometheus 形式で出力する"""
+    histogram = Histogram("sample", "Sample.", ("route",), (1, 5))
+    histogram.observe(("/a",), 0.5)
+    histogram.observe(("/a",), 3)
+    histogram.observe(("/a",), 10)
+
+    assert list(histogram.render()) == [
+        "# HELP sample Sample.",
+        "# TYPE sample histogram",
+        'sample_bucket{route="/a",le="1"} 1',
+        'sample_bucket{route="/a",le="5"} 2',
+        'sample_bucket{route="/a",le="+Inf"} 3',
+        'sample_sum{route="/a"} 13.5',
+        'sample_count{route="/a"} 3',
+    ]
+
+
+@pytest.mark.unit
+def test_registry_render_with_gauges_and_counters():
+    """リクエストのメトリクスと、追加のゲージ・カウンターを出力する"""
+    registry = MetricsRegistry()
+    registry.observe_request("GET", "/logs", 200, 0.02, RequestStats(sql_count=3, sql_seconds=0.004))
+
+    output = registry.render(gauges={"db_pool_idle": 2}, counters={"user_cache_hits_total": 5})
+
+    assert 'http_request_sql_statements_bucket{method="GET",route="/logs",status="200",le="3"} 1' in output
+    assert 'http_request_sql_statements_sum{method="GET",route="/logs",status="200"} 3' in output
+    assert 'http_request_duration_seconds_count{method="GET",route="/logs",status="200"} 1' in output
+    assert "# TYPE db_pool_idle gauge\ndb_pool_idle 2" in output
+    assert "# TYPE user_cache_hits_total counter\nuser_cache_hits_total 5" in output
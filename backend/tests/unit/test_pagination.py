@@ -0,0 +1,45 @@
+"""カーソルページネーションの単体テスト"""
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from fastapi import HTTPException
+
+from app.core.pagination import encode_cursor, decode_cursor, build_page
+
+
+@pytest.mark.unit
+def test_cursor_round_trip():
+    """カーソルのエンコード・デコードのテスト"""
+    created_at = datetime(2025, 11, 13, 10, 0, 0, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert decode_cursor(cursor) == (created_at, row_id)
+
+
+@pytest.mark.unit
+def test_decode_invalid_cursor():
+    """不正なカーソルは400エラー"""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.unit
+def test_build_page_next_cursor():
+    """limit + 1 件取得できた場合のみ next_cursor を返す"""
+    class Row:
+        def __init__(self, minute):
+            self.id = uuid4()
+            self.created_at = datetime(2025, 11, 13, 10, minute, tzinfo=timezone.utc)
+
+    rows = [Row(3), Row(2), Row(1)]
+
+    page = build_page(rows, "created_at", 2)
+    assert page["items"] == rows[:2]
+    assert decode_cursor(page["next_cursor"]) == (rows[1].created_at, rows[1].id)
+
+    last_page = build_page(rows[:2], "created_at", 2)
+    assert last_page["next_cursor"] is None
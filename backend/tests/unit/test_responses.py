@@ -0,0 +1,59 @@
+"""model_response の単体テスト"""
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+
+from app.core.responses import model_response
+from app.models.log import Log, LogVisibility
+from app.schemas.log import LogPage, LogResponse
+
+
+def _log(created_at: datetime) -> Log:
+    return Log(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        title="振り返り",
+        content="畑で収穫した\n気づき",
+        tags=["農業"],
+        visibility=LogVisibility.PUBLIC,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.mark.unit
+def test_model_response_matches_pydantic():
+    """ORM のオブジェクトから pydantic の JSON 化と同じ内容を返す"""
+    logs = [
+        _log(datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)),
+        _log(datetime(2024, 5, 1, 9, 30, tzinfo=timezone(timedelta(hours=9)))),
+    ]
+
+    response = model_response(List[LogResponse], logs)
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    expected = [LogResponse.model_validate(log).model_dump(mode="json") for log in logs]
+    assert json.loads(response.body) == expected
+    assert expected[0]["created_at"] == "2024-05-01T09:30:15.123456Z"
+
+
+class _DriverUUID(uuid.UUID):
+    """asyncpg が返す UUID（uuid.UUID のサブクラス）の代わり"""
+
+
+@pytest.mark.unit
+def test_model_response_page():
+    """build_page の dict（items は ORM のオブジェクト）も受け付ける"""
+    log = _log(datetime.now(timezone.utc))
+    log.id = _DriverUUID(str(uuid.uuid4()))
+
+    response = model_response(LogPage, {"items": [log], "next_cursor": "abc"})
+
+    body = json.loads(response.body)
+    assert body["next_cursor"] == "abc"
+    assert body["items"][0]["id"] == str(log.id)
+    assert body["items"][0]["visibility"] == "public"
@@ -0,0 +1,42 @@
+"""全文検索のヘルパーの単体テスト"""
+import pytest
+
+from app.core.search import MAX_SEARCH_TERMS, highlight, search_terms
+
+
+@pytest.mark.unit
+def test_search_terms():
+    """全角の空白でも区切り、重複と空の語を除く"""
+    assert search_terms(" 読書会　気づき 読書会 ") == ["読書会", "気づき"]
+    assert search_terms("　") == []
+    assert len(search_terms(" ".join(str(i) for i in range(20)))) == MAX_SEARCH_TERMS
+
+
+@pytest.mark.unit
+def test_highlight_short_text():
+    """短い本文はそのまま返し、すべての一致の位置を返す"""
+    snippet, highlights = highlight("Python の勉強会で python を学んだ", ["python"])
+
+    assert snippet == "Python の勉強会で python を学んだ"
+    assert [snippet[start:end] for start, end in highlights] == ["Python", "python"]
+
+
+@pytest.mark.unit
+def test_highlight_long_text():
+    """長い本文は最初の一致の前後を切り出す"""
+    text = "あ" * 50 + "発見\n" + "い" * 200
+    snippet, highlights = highlight(text, ["発見"], width=40)
+
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert len(snippet) == 42
+    assert "\n" not in snippet
+    assert [snippet[start:end] for start, end in highlights] == ["発見"]
+
+
+@pytest.mark.unit
+def test_highlight_no_match():
+    """本文に一致しない場合（タイトルだけ一致）は先頭を返す"""
+    snippet, highlights = highlight("い" * 100, ["発見"], width=40)
+
+    assert snippet == "い" * 40 + "…"
+    assert highlights == []
@@ -1,7 +1,23 @@
 """セキュリティ関連の単体テスト"""
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from app import main
+from app.core.config import settings
+from app.core.password_hasher import PasswordHasher, PasswordHasherBusy
 from app.core.security import (
+    VerifiedTokenCache,
+    get_jwt_keys,
     get_password_hash,
+    password_needs_rehash,
+    verified_tokens,
     verify_password,
     create_access_token,
     decode_access_token
@@ -24,6 +40,76 @@ def test_password_hashing():
     assert verify_password("wrong_password", hashed) is False
 
 
+@pytest.mark.unit
+def test_password_needs_rehash(monkeypatch):
+    """コストが BCRYPT_ROUNDS と異なるハッシュは再ハッシュが必要"""
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+
+    assert password_needs_rehash(get_password_hash("pw", rounds=4)) is True
+    assert password_needs_rehash(get_password_hash("pw")) is False
+    assert password_needs_rehash("not-a-bcrypt-hash") is True
+
+
+@pytest.mark.unit
+async def test_password_hasher_runs_off_event_loop():
+    """ハッシュ化・検証はイベントループ以外のスレッドで実行される"""
+    hasher = PasswordHasher(max_workers=2, max_queue=0)
+    try:
+        hashed = await hasher.hash("pw")
+        assert await hasher.verify("pw", hashed) is True
+        assert await hasher.run(threading.get_ident) != threading.get_ident()
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.unit
+async def test_password_hasher_rejects_over_queue_limit():
+    """実行中と待機中の合計が上限に達したら PasswordHasherBusy"""
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+    running = asyncio.ensure_future(hasher.run(release.wait))
+    queued = asyncio.ensure_future(hasher.run(release.wait))
+    await asyncio.sleep(0)
+
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.run(release.wait)
+    finally:
+        release.set()
+        await asyncio.gather(running, queued)
+        hasher.shutdown()
+
+    assert hasher.stats() == {"pending": 0, "rejected": 1}
+
+
+@pytest.mark.unit
+async def test_password_hasher_shutdown_waits_for_pending():
+    """shutdown は実行中・待機中の計算が終わるまで待つ"""
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    finished = []
+    tasks = [asyncio.ensure_future(hasher.run(lambda i=i: (time.sleep(0.05), finished.append(i)))) for i in range(2)]
+    await asyncio.sleep(0)
+
+    await asyncio.to_thread(hasher.shutdown)
+
+    assert finished == [0, 1]
+    assert hasher.stats() == {"pending": 0, "rejected": 0}
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.unit
+async def test_lifespan_shuts_down_password_hasher(monkeypatch):
+    """アプリの終了時にパスワードハッシュのスレッドプールを止める"""
+    hasher = PasswordHasher(max_workers=1, max_queue=0)
+    monkeypatch.setattr(main, "password_hasher", hasher)
+
+    async with main.lifespan(main.app):
+        await hasher.hash("pw")
+        assert hasher._executor is not None
+
+    assert hasher._executor is None
+
+
 @pytest.mark.unit
 def test_create_and_decode_token():
     """JWTトークン生成・検証のテスト"""
@@ -58,3 +144,117 @@ def test_token_expiration():
     assert "exp" in payload
     assert "sub" in payload
     assert payload["sub"] == user_id
+
+
+@pytest.fixture
+def jwt_settings(monkeypatch):
+    """JWT の設定を変更し、テスト後に鍵とキャッシュを読み込み直す"""
+    def configure(**values):
+        for name, value in values.items():
+            monkeypatch.setattr(settings, name, value)
+        get_jwt_keys.cache_clear()
+        verified_tokens.clear()
+
+    yield configure
+    get_jwt_keys.cache_clear()
+    verified_tokens.clear()
+
+
+def _write_private_key(path, key) -> str:
+    path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    return str(path)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("algorithm, generate", [
+    ("RS256", lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+    ("ES256", lambda: ec.generate_private_key(ec.SECP256R1())),
+])
+def test_asymmetric_token(jwt_settings, tmp_path, algorithm, generate):
+    """公開鍵方式では秘密鍵で署名し、公開鍵で検証する"""
+    private_key = generate()
+    public_path = tmp_path / "public.pem"
+    public_path.write_bytes(private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+    jwt_settings(
+        ALGORITHM=algorithm,
+        JWT_PRIVATE_KEY_FILE=_write_private_key(tmp_path / "private.pem", private_key),
+        JWT_PUBLIC_KEY_FILE=str(public_path),
+    )
+
+    token = create_access_token(data={"sub": "user-1"})
+
+    assert jwt.get_unverified_header(token)["alg"] == algorithm
+    assert decode_access_token(token)["sub"] == "user-1"
+
+    # 別の鍵で署名したトークンは拒否する
+    other = _write_private_key(tmp_path / "other.pem", generate())
+    jwt_settings(JWT_PRIVATE_KEY_FILE=other, JWT_PUBLIC_KEY_FILE=None)
+    forged = create_access_token(data={"sub": "user-1"})
+    jwt_settings(JWT_PRIVATE_KEY_FILE=str(tmp_path / "private.pem"), JWT_PUBLIC_KEY_FILE=str(public_path))
+    assert decode_access_token(forged) is None
+
+
+@pytest.mark.unit
+def test_asymmetric_algorithm_requires_private_key(jwt_settings):
+    """公開鍵方式で秘密鍵が設定されていなければエラー"""
+    jwt_settings(ALGORITHM="RS256", JWT_PRIVATE_KEY_FILE=None)
+
+    with pytest.raises(ValueError):
+        get_jwt_keys()
+
+
+@pytest.mark.unit
+def test_decode_uses_verified_token_cache(jwt_settings, monkeypatch):
+    """検証済みのトークンは署名を検証し直さない"""
+    jwt_settings()
+    token = create_access_token(data={"sub": "user-1"})
+    calls = []
+    original = jwt.decode
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs))
+
+    assert decode_access_token(token)["sub"] == "user-1"
+    assert decode_access_token(token)["sub"] == "user-1"
+
+    assert len(calls) == 1
+    assert verified_tokens.stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.unit
+def test_verified_token_cache_expiry_and_size():
+    """期限切れのエントリは返さず、上限を超えたら古いものから捨てる"""
+    cache = VerifiedTokenCache(max_size=2)
+    now = time.time()
+    cache.put("expired", {"sub": "a", "exp": now - 1})
+    cache.put("no-exp", {"sub": "b"})
+    assert cache.get("expired") is None
+    assert cache.get("no-exp") is None
+
+    cache.put("t1", {"sub": "1", "exp": now + 60})
+    cache.put("t2", {"sub": "2", "exp": now + 60})
+    cache.get("t1")
+    cache.put("t3", {"sub": "3", "exp": now + 60})
+
+    assert cache.get("t1") == {"sub": "1", "exp": now + 60}
+    assert cache.get("t2") is None
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_cached_token_dropped_after_exp(jwt_settings, monkeypatch):
+    """キャッシュ済みのトークンも exp を過ぎたら返さない"""
+    jwt_settings()
+    token = create_access_token(data={"sub": "user-1"}, expires_delta=timedelta(minutes=1))
+    payload = decode_access_token(token)
+    assert verified_tokens.get(token) == payload
+
+    monkeypatch.setattr(time, "time", lambda: payload["exp"] + 1)
+
+    assert verified_tokens.get(token) is None
+    assert len(verified_tokens) == 0